@@ -1,27 +1,26 @@
 from os import environ
 
-from diy import Container
+from diy import Container, Specification
 
 from weather.client.constant import ConstantWeatherClient
 from weather.client.protocol import Condition, CurrentWeather, WeatherClient
-from weather.client.random import RandomWeatherClient
-from weather.client.wheatherapidotcom import WeatherApiWeatherClient
 
-container = Container()
+# The clients below pull in heavy dependencies like numpy or httpx. We refer to
+# them by import specifiers, so they are only imported once they are planned.
+RANDOM_WEATHER_CLIENT = "weather.client.random:RandomWeatherClient"
+WEATHER_API_WEATHER_CLIENT = "weather.client.wheatherapidotcom:WeatherApiWeatherClient"
 
+spec = Specification()
 
-@container.add
-def build_constant_weather_client() -> ConstantWeatherClient:
-    return ConstantWeatherClient(
-        weather=CurrentWeather(
-            city="New York",
-            temperature=12.34,
-            conditions=Condition.SUNNY,
-        )
-    )
+# Which weather client the application uses depends on the profile. Each
+# profile binds its own implementation, along with the builders for its
+# parameters. Only the bindings of the selected profile are ever planned or
+# imported.
+prod = spec.profile("prod")
+prod.add_lazy(WeatherClient, WEATHER_API_WEATHER_CLIENT)
 
 
-@container.add(WeatherApiWeatherClient, "key")
+@prod.add(WEATHER_API_WEATHER_CLIENT, "key")
 def build_weather_api_weather_client_key() -> str:
     if "WEATHERAPIDOTCOM_KEY" not in environ:
         message = "WEATHERAPIDOTCOM_KEY needs to be defined in the environment!"
@@ -29,21 +28,34 @@ def build_weather_api_weather_client_key() -> str:
     return str(environ["WEATHERAPIDOTCOM_KEY"])
 
 
+dev = spec.profile("dev")
+dev.add_lazy(WeatherClient, RANDOM_WEATHER_CLIENT)
+
+
 # This function tells us how our application builds a client returning random
-# weather information. This might be useful for unit testing environments,
-# where we only want to test e.g. the HTTP endpoint or a CLI function.
-@container.add(RandomWeatherClient, "seed")
+# weather information. This might be useful for development, where we don't
+# want to hit a real API.
+@dev.add(RANDOM_WEATHER_CLIENT, "seed")
 def build_random_weather_client_seed() -> int | None:
     if "WEATHER_SEED" not in environ:
         return None
     return int(environ["WEATHER_SEED"])
 
 
-# This sets the "default" implementation of a weather client for the whole
-# container. Since the arguments of builder function are also provided by the
-# container, it will construct the RandomWeatherClient and use the seed
-# argument as defined in our build_random_whather_client_seed function from
-# above.
-@container.add
-def build_weather_client(random: RandomWeatherClient) -> WeatherClient:
-    return random
+test = spec.profile("test")
+
+
+# Tests of e.g. the HTTP endpoint or a CLI function get a client that always
+# returns the same weather.
+@test.add
+def build_constant_weather_client() -> WeatherClient:
+    return ConstantWeatherClient(
+        weather=CurrentWeather(
+            city="New York",
+            temperature=12.34,
+            conditions=Condition.SUNNY,
+        )
+    )
+
+
+container = Container(spec, profile=environ.get("WEATHER_PROFILE", "dev"))
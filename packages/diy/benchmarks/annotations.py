@@ -0,0 +1,51 @@
+"""
+Compares planning a large specification, whose annotations are strings, when
+evaluating only the annotations the planner needs with evaluating all of them
+up front, like `inspect.signature(..., eval_str=True)` does.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.annotations
+"""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+from benchmarks.fixtures import stringified_graph
+from benchmarks.utils import measure, report
+from diy import Specification
+from diy._internal.planner import Planner
+from diy._internal.signatures import LazySignature
+
+
+class EagerSignature(LazySignature):
+    """Evaluates all annotations as soon as the signature is read."""
+
+    def __init__(self, subject: Callable[..., Any]) -> None:
+        super().__init__(subject)
+        for name in self.parameters:
+            self.annotation(name)
+
+
+def main() -> None:
+    graph = stringified_graph(layers=2, width=2_000, options=6)
+    spec = Specification()
+    for subject in graph:
+        spec.add(subject)
+
+    def plan() -> None:
+        planner = Planner(spec)
+        for subject in graph:
+            planner.plan(subject)
+
+    lazy = measure(plan, number=1)
+    with patch("diy._internal.planner.LazySignature", EagerSignature):
+        eager = measure(plan, number=1)
+
+    report("plan, evaluating needed annotations", lazy / 1_000, unit="ms")
+    report("plan, evaluating all annotations", eager / 1_000, unit="ms")
+
+
+if __name__ == "__main__":
+    main()
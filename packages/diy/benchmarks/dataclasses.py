@@ -0,0 +1,47 @@
+"""
+Compares planning a large specification of dataclasses, when reading their
+parameters from their fields with reflecting their generated constructors.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.dataclasses
+"""
+
+from unittest.mock import patch
+
+from benchmarks.fixtures import dataclass_graph
+from benchmarks.utils import measure, report
+from diy import Specification
+from diy._internal.introspection import constructor_signature
+from diy._internal.planner import Planner
+from diy._internal.signatures import LazySignature
+
+
+def main() -> None:
+    graph = dataclass_graph(layers=2, width=2_000, options=6)
+    spec = Specification()
+    for subject in graph:
+        spec.add(subject)
+
+    def plan() -> None:
+        planner = Planner(spec)
+        for subject in graph:
+            planner.plan(subject)
+
+    fields = measure(plan, number=1)
+    with patch("diy._internal.introspection._adapters", []):
+        reflected = measure(plan, number=1)
+
+    report("plan, reading fields", fields / 1_000, unit="ms")
+    report("plan, reflecting constructors", reflected / 1_000, unit="ms")
+
+    subject = graph[-1]
+    report("read fields", measure(lambda: constructor_signature(subject), 10_000))
+    report(
+        "reflect constructor",
+        measure(lambda: LazySignature(subject.__init__), 10_000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Plans and executes dependency chains of increasing depth.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.deep_chains
+"""
+
+import sys
+from functools import partial
+
+from benchmarks.fixtures import deep_chain
+from benchmarks.utils import measure, report
+from diy import Specification
+from diy._internal.planner import Planner
+
+
+def main() -> None:
+    report("recursion limit", sys.getrecursionlimit(), unit="frames")
+
+    for depth in (10, 100, 1_000, 5_000):
+        chain = deep_chain(depth)
+        planner = Planner(Specification())
+        plan = planner.plan(chain[-1])
+
+        report(
+            f"plan chain of depth {depth}",
+            measure(partial(planner.plan, chain[-1]), number=10),
+        )
+        report(f"execute chain of depth {depth}", measure(plan.execute, number=10))
+
+
+if __name__ == "__main__":
+    main()
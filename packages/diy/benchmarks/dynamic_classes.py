@@ -0,0 +1,47 @@
+"""
+Resolves many classes created at runtime, and reports whether the container's
+cache keeps memory flat while doing so.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.dynamic_classes
+"""
+
+import gc
+from time import perf_counter
+
+from benchmarks.utils import report
+from diy.container.runtime import RuntimeContainer
+
+CACHE_SIZE = 100
+CLASSES = 100_000
+
+
+def resolve(container: RuntimeContainer, amount: int) -> None:
+    for index in range(amount):
+        subject = type(f"Dynamic{index}", (), {})
+        container.resolve(subject)
+        container.resolve(subject)
+
+
+def main() -> None:
+    container = RuntimeContainer(cache_size=CACHE_SIZE)
+
+    resolve(container, 1_000)
+    gc.collect()
+    before = len(gc.get_objects())
+    start = perf_counter()
+    resolve(container, CLASSES)
+    elapsed = perf_counter() - start
+    gc.collect()
+    after = len(gc.get_objects())
+
+    stats = container.cache_stats()
+    report("resolve per dynamic class", elapsed / CLASSES * 1_000_000)
+    report("gc tracked objects left behind", after - before, unit="")
+    report("cache size", stats.size, unit="entries")
+    report("cache hit rate", stats.hits / (stats.hits + stats.misses) * 100, "%")
+
+
+if __name__ == "__main__":
+    main()
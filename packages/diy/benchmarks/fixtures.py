@@ -0,0 +1,108 @@
+from dataclasses import field, make_dataclass
+from types import ModuleType
+from typing import Any
+
+
+def deep_chain(depth: int) -> list[type[Any]]:
+    """
+    Creates `depth` classes, where each one requires an instance of the
+    previous one in its constructor. The last one is the deepest to resolve.
+    """
+    chain: list[type[Any]] = [type("Level0", (), {})]
+    for index in range(1, depth):
+        chain.append(_level(index, chain[-1]))
+    return chain
+
+
+def _level(index: int, dependency: type[Any]) -> type[Any]:
+    def __init__(self: Any, inner: Any) -> None:  # noqa: N807
+        self.inner = inner
+
+    __init__.__annotations__ = {"inner": dependency, "return": None}
+    return type(f"Level{index}", (), {"__init__": __init__})
+
+
+def layered_graph(layers: int, width: int) -> list[type[Any]]:
+    """
+    Creates `layers` layers of `width` classes each. Every class requires two
+    classes of the previous layer, so plans grow quickly with each layer.
+    """
+    graph: list[type[Any]] = [type(f"Layer0Node{j}", (), {}) for j in range(width)]
+    for layer in range(1, layers):
+        previous = graph[-width:]
+        for j in range(width):
+            dependencies = (previous[j], previous[(j + 1) % width])
+            graph.append(_node(f"Layer{layer}Node{j}", dependencies))
+    return graph
+
+
+def _node(name: str, dependencies: tuple[type[Any], type[Any]]) -> type[Any]:
+    def __init__(self: Any, left: Any, right: Any) -> None:  # noqa: N807
+        self.left = left
+        self.right = right
+
+    __init__.__annotations__ = {
+        "left": dependencies[0],
+        "right": dependencies[1],
+        "return": None,
+    }
+    return type(name, (), {"__init__": __init__})
+
+
+def stringified_graph(layers: int, width: int, options: int) -> list[type[Any]]:
+    """
+    Creates a graph like :func:`layered_graph`, but in a module using
+    `from __future__ import annotations`, so all annotations are strings.
+    Every class also accepts `options` parameters with defaults, like the
+    settings of a service usually are.
+    """
+    settings = "".join(
+        f", option{k}: Mapping[str, list[int]] | None = None" for k in range(options)
+    )
+    lines = [
+        "from __future__ import annotations",
+        "from collections.abc import Mapping",
+    ]
+    lines.extend(f"class Layer0Node{j}: pass" for j in range(width))
+    for layer in range(1, layers):
+        for j in range(width):
+            left = f"Layer{layer - 1}Node{j}"
+            right = f"Layer{layer - 1}Node{(j + 1) % width}"
+            lines.append(
+                f"class Layer{layer}Node{j}:\n"
+                f"    def __init__(self, left: {left}, right: {right}{settings}) -> None:\n"
+                "        self.left = left\n"
+                "        self.right = right"
+            )
+
+    module = ModuleType("stringified_graph")
+    exec("\n".join(lines), vars(module))  # noqa: S102
+    return [
+        getattr(module, f"Layer{layer}Node{j}")
+        for layer in range(layers)
+        for j in range(width)
+    ]
+
+
+def dataclass_graph(layers: int, width: int, options: int) -> list[type[Any]]:
+    """
+    Creates a graph like :func:`layered_graph`, but of dataclasses. Every
+    class also has `options` fields with defaults, and one with a default
+    factory.
+    """
+    settings: list[Any] = [
+        *((f"option{k}", int, field(default=k)) for k in range(options)),
+        ("tags", list[str], field(default_factory=list)),
+    ]
+    graph = [make_dataclass(f"Layer0Node{j}", settings) for j in range(width)]
+    for layer in range(1, layers):
+        previous = graph[-width:]
+        for j in range(width):
+            dependencies = [
+                ("left", previous[j]),
+                ("right", previous[(j + 1) % width]),
+            ]
+            graph.append(
+                make_dataclass(f"Layer{layer}Node{j}", [*dependencies, *settings])
+            )
+    return graph
@@ -0,0 +1,60 @@
+"""
+Reports how long importing diy takes in a fresh interpreter, based on
+`python -X importtime`, along with the diy modules that get imported.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.import_time
+"""
+
+import subprocess  # noqa: S404
+import sys
+
+STATEMENTS = [
+    "import diy",
+    "import diy.markers",
+    "from diy import Specification",
+    "from diy import Container",
+]
+
+ROUNDS = 5
+
+
+def import_time(statement: str) -> tuple[float, list[str]]:
+    """
+    The best cumulative import time of the modules the statement imports in
+    microseconds, and the diy modules it imported.
+    """
+    best = float("inf")
+    modules: list[str] = []
+    for _ in range(ROUNDS):
+        command = [sys.executable, "-X", "importtime", "-c", statement]
+        # Only ever runs the statements above.
+        result = subprocess.run(command, capture_output=True, text=True, check=True)  # noqa: S603
+        total = 0
+        modules = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.removeprefix("import time:").split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            if name.strip().startswith("diy"):
+                modules.append(name.strip())
+            # Only top level imports, their cumulative time covers the rest.
+            if not name.startswith("  "):
+                total += int(cumulative)
+        best = min(best, total)
+    return best, modules
+
+
+def main() -> None:
+    baseline, _ = import_time("pass")
+    for statement in STATEMENTS:
+        total, modules = import_time(statement)
+        name = f"{statement} ({len(modules)} diy modules)"
+        sys.stdout.write(f"{name:<50} {(total - baseline) / 1_000:>12.2f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Reports how much each optimizer pass shrinks a plan, and how fast the plan
+executes after each of them.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.optimizer
+"""
+
+from benchmarks.utils import measure, report
+from diy import Specification
+from diy._internal.execution import compile_program
+from diy._internal.optimizer import PASSES, count_nodes, optimize
+from diy._internal.planner import Planner
+from diy.provider import Provider
+
+
+class Config:
+    def __init__(self, retries: int = 3, timeout: float = 1.0) -> None:
+        super().__init__()
+        self.retries = retries
+        self.timeout = timeout
+
+
+class Connection: ...
+
+
+class Pool:
+    def __init__(self, connection: Connection, config: Config) -> None:
+        super().__init__()
+        self.connection = connection
+        self.config = config
+
+
+class Repository: ...
+
+
+class SqlRepository(Repository):
+    def __init__(self, pool: Pool, config: Config, cache: str | None = None) -> None:
+        super().__init__()
+        self.pool = pool
+        self.config = config
+        self.cache = cache
+
+
+class Service:
+    def __init__(
+        self,
+        users: Repository,
+        orders: Repository,
+        connections: Provider[Connection],
+        verbose: bool = False,
+    ) -> None:
+        super().__init__()
+        self.users = users
+        self.orders = orders
+        self.connections = connections
+        self.verbose = verbose
+
+
+def main() -> None:
+    spec = Specification()
+
+    @spec.add
+    def build_repository(repository: SqlRepository) -> Repository:
+        return repository
+
+    plan = Planner(spec).plan(Service)
+    report("nodes before optimizing", count_nodes(plan), unit="nodes")
+    unoptimized = compile_program([plan])
+    report("execute unoptimized", measure(unoptimized.run))
+
+    for amount in range(1, len(PASSES) + 1):
+        passes = PASSES[:amount]
+        optimized = optimize(plan, passes)
+        name = passes[-1].name
+        report(f"nodes after {name}", count_nodes(optimized), unit="nodes")
+        program = compile_program([optimized])
+        report(f"execute after {name}", measure(program.run))
+
+
+if __name__ == "__main__":
+    main()
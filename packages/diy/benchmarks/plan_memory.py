@@ -0,0 +1,54 @@
+"""
+Reports how much memory plans take up, and how much keeping them alive slows
+down the garbage collector.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.plan_memory
+"""
+
+import gc
+import tracemalloc
+from time import perf_counter
+
+from benchmarks.fixtures import layered_graph
+from benchmarks.utils import report
+from diy import Specification
+from diy._internal.optimizer import count_nodes
+from diy._internal.planner import Planner
+
+
+def main() -> None:
+    graph = layered_graph(layers=8, width=50)
+    planner = Planner(Specification())
+
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    tracemalloc.start()
+    plans = [planner.plan(subject) for subject in graph]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects_after = len(gc.get_objects())
+
+    nodes = sum(count_nodes(plan) for plan in plans)
+    report("plans", len(plans), unit="plans")
+    report("nodes", nodes, unit="nodes")
+    report("memory per plan", allocated / len(plans), unit="B")
+    report("memory per node", allocated / nodes, unit="B")
+    report("gc tracked objects per node", (objects_after - objects_before) / nodes, "")
+
+    pauses: list[float] = []
+    for _ in range(5):
+        start = perf_counter()
+        gc.collect()
+        pauses.append(perf_counter() - start)
+    report("full gc pause with plans alive", min(pauses) * 1_000, unit="ms")
+
+    start = perf_counter()
+    del plans
+    gc.collect()
+    report("free plans", (perf_counter() - start) * 1_000, unit="ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compares planning a specification from scratch with loading its plans from a
+:class:`PlanStore`, as a process would do on startup.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.plan_store
+"""
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from benchmarks.fixtures import layered_graph
+from benchmarks.utils import measure, report
+from diy import Specification
+from diy._internal.planner import Planner
+from diy._internal.store import PlanStore
+
+
+def main() -> None:
+    graph = layered_graph(layers=8, width=50)
+    # Stored plans reference types by their qualified name, so they need to
+    # be reachable from their module.
+    module = sys.modules[graph[0].__module__]
+    for subject in graph:
+        setattr(module, subject.__qualname__, subject)
+
+    spec = Specification()
+    for subject in graph:
+        spec.add(subject)
+
+    def plan() -> None:
+        planner = Planner(spec)
+        for subject in graph:
+            planner.plan(subject)
+
+    planner = Planner(spec)
+    plans = {subject: planner.plan(subject) for subject in graph}
+
+    with TemporaryDirectory() as directory:
+        store = PlanStore(Path(directory) / "plans")
+        store.save(spec, plans)
+        assert len(store.load(spec)) == len(graph)
+
+        report("plan from scratch", measure(plan, number=1) / 1_000, unit="ms")
+        report(
+            "load from store",
+            measure(lambda: store.load(spec), number=1) / 1_000,
+            unit="ms",
+        )
+        report("store size", store.path.stat().st_size / 1_024, unit="KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import sys
+from collections.abc import Callable
+from timeit import repeat
+from typing import Any
+
+
+def measure(subject: Callable[[], Any], number: int = 100, rounds: int = 5) -> float:
+    """
+    Returns the best time of a single call to `subject` in microseconds.
+    """
+    return min(repeat(subject, number=number, repeat=rounds)) / number * 1_000_000
+
+
+def report(name: str, value: float, unit: str = "us") -> None:
+    sys.stdout.write(f"{name:<50} {value:>12.2f} {unit}\n")
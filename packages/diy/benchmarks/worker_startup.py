@@ -0,0 +1,65 @@
+"""
+Compares process pool workers that plan all types themselves with workers that
+receive a container, which already planned them.
+
+Run it from the `packages/diy` directory using
+
+    python -m benchmarks.worker_startup
+"""
+
+import pickle  # noqa: S403
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from benchmarks.fixtures import layered_graph
+from benchmarks.utils import measure, report
+from diy import Container, Specification
+from diy.workers import initialize_worker, worker_container
+
+WORKERS = 4
+
+# The workers are spawned, so they need to create the same types when they
+# import this module. Pickled plans reference types by their qualified name,
+# so they need to be reachable from their module.
+GRAPH = layered_graph(layers=8, width=50)
+for subject in GRAPH:
+    setattr(sys.modules[subject.__module__], subject.__qualname__, subject)
+
+
+def spec() -> Specification:
+    spec = Specification()
+    for subject in GRAPH:
+        spec.add(subject)
+    return spec
+
+
+def resolve_all(_: int) -> int:
+    return len(worker_container().resolve_many(GRAPH))
+
+
+def run(container: Container) -> None:
+    with ProcessPoolExecutor(
+        max_workers=WORKERS,
+        mp_context=get_context("spawn"),
+        initializer=initialize_worker,
+        initargs=(container,),
+    ) as pool:
+        list(pool.map(resolve_all, range(WORKERS)))
+
+
+def main() -> None:
+    cold = Container(spec())
+    warm = Container(spec())
+    warm.resolve_many(GRAPH)
+
+    cold_time = measure(lambda: run(cold), number=1, rounds=3)
+    warm_time = measure(lambda: run(warm), number=1, rounds=3)
+    report("pool with planning workers", cold_time / 1_000, unit="ms")
+    report("pool with planned container", warm_time / 1_000, unit="ms")
+    report("pickled cold container", len(pickle.dumps(cold)) / 1_024, unit="KiB")
+    report("pickled planned container", len(pickle.dumps(warm)) / 1_024, unit="KiB")
+
+
+if __name__ == "__main__":
+    main()
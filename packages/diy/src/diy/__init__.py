@@ -6,9 +6,42 @@ library specific markers.
 At the root level, this package exports only the two default implementations of
 the specification and the container protocools. More specialized components
 must be imported from their respective modules.
+
+Both are only imported once they are first accessed, so importing e.g.
+`diy.markers` does not pull in the planner.
 """
 
-from diy.container.default import Container
-from diy.specification.default import Specification
+from importlib import import_module
+
+# Importing typing alone takes longer than everything else `import diy` does.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from diy.container.default import Container
+    from diy.specification.default import Specification
+
+_EXPORTS = {
+    "Container": "diy.container.default",
+    "Specification": "diy.specification.default",
+}
+"""The modules defining the exports of this package."""
+
+
+def __getattr__(name: str) -> "Any":
+    module = _EXPORTS.get(name)
+    if module is None:
+        message = f"module 'diy' has no attribute '{name}'"
+        raise AttributeError(message)
+
+    value = getattr(import_module(module), name)
+    # Later accesses don't go through this function anymore.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = ["Container", "Specification"]
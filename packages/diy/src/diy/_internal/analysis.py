@@ -0,0 +1,917 @@
+"""
+Analyzes a container without importing it, by parsing the modules it is
+defined in.
+
+Importing an application may take seconds and has side effects. Instead, the
+module defining the container is parsed with :mod:`ast`, and its top level
+registrations are replayed on a fresh specification. The classes and builders
+they refer to are replaced by stand-ins, that carry the signatures found in
+their source code. This way the regular planner plans them, and the plans are
+displayed exactly like the ones of the imported container.
+
+The results are approximate. Registrations we can't follow statically, e.g.
+ones made in loops, in other modules or by scanning packages, are skipped.
+Annotations referring to modules without Python source can't be resolved.
+Both are reported along with the analysis. Besides diy itself, only a few
+modules of the standard library defining types for annotations are imported.
+
+What was found in each file is cached by the hash of its contents, so later
+analyses only parse the files that changed.
+"""
+
+from __future__ import annotations
+
+import ast
+import marshal
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from hashlib import sha256
+from importlib import import_module
+from inspect import Parameter, Signature, signature
+from pathlib import Path
+from types import new_class
+from typing import Annotated, Any, Literal
+
+from diy._internal.scanning import Names
+from diy.errors import DiyError, InvalidImportSpecifierError, StaticAnalysisError
+from diy.specification.default import Specification
+from diy.specification.protocol import SpecificationProtocol
+
+_VERSION = 1
+"""Bumped whenever the format of the cache changes, so old ones are ignored."""
+
+_IMPORTED = ("abc", "builtins", "collections.abc", "diy", "enum", "types", "typing")
+"""
+Modules whose types are imported instead of parsed. They are part of diy or
+the standard library, and importing them has no side effects.
+"""
+
+_CONTAINERS = {"diy.Container", "diy.container.default.Container"}
+
+_SPECIFICATIONS = {"diy.Specification", "diy.specification.default.Specification"}
+
+_ENVIRONMENT = {"os.environ.get", "os.getenv"}
+"""Functions whose default argument is used as the profile of a container."""
+
+_METHODS = {
+    "builders.decorate": "add",
+    "partials.decorate": "add",
+    "builders.add_lazy": "add_lazy",
+}
+"""Methods of the builders and partials, that do the same as ones of the spec."""
+
+type Parameters = tuple[tuple[str, int, str | None, str | None], ...]
+"""The name, kind, annotation and default of each parameter, as source code."""
+
+type ClassSummary = tuple[
+    tuple[str, ...], tuple[str, ...], Parameters | None, Parameters
+]
+"""
+The bases and decorators of a class, the parameters of its `__init__` if it
+defines one, and the annotated attributes dataclasses turn into parameters.
+"""
+
+type FunctionSummary = tuple[Parameters, str | None]
+"""The parameters and return annotation of a function."""
+
+type Statement = tuple[str, str, str]
+"""
+A top level statement that might register something, either `("assign",
+target, value)`, `("call", "", call)`, `("decorate", function, decorator)`
+or `("block", names, first line)` for compound statements like loops.
+"""
+
+type Summary = tuple[
+    dict[str, str],
+    dict[str, ClassSummary],
+    dict[str, FunctionSummary],
+    tuple[Statement, ...],
+]
+"""
+What the analysis needs to know about a module: the dotted paths its names
+refer to, its classes by their qualified name, its top level functions, and
+the statements that might register something.
+"""
+
+
+@dataclass
+class Analysis:
+    spec: SpecificationProtocol
+    """
+    The specification of the container with the profile selected, where all
+    types and builders are stand-ins.
+    """
+
+    profile: str | None
+    """The selected profile."""
+
+    skipped: list[str] = field(default_factory=list)
+    """The registrations that could not be replayed, and why."""
+
+    unresolved: list[str] = field(default_factory=list)
+    """The parameters and signatures that could not be resolved from the source."""
+
+    files: int = 0
+    """How many files were analyzed."""
+
+    parsed: int = 0
+    """How many of them were parsed, since they were not in the cache."""
+
+
+def analyze_container(
+    specifier: str,
+    profile: str | None = None,
+    paths: Iterable[str | Path] | None = None,
+    cache: str | Path | None = None,
+) -> Analysis:
+    """
+    Analyzes the container or specification the import specifier refers to,
+    without importing it. Modules are looked up in `paths`, which defaults to
+    :data:`sys.path`. The profile the container selects can be overridden
+    using `profile`. Pass `cache` to keep what was found in each file there.
+    """
+    previous = {} if cache is None else _load_cache(Path(cache))
+    analyzer = _Analyzer([Path(path) for path in paths or sys.path], previous)
+    analysis = analyzer.analyze(specifier, profile)
+    if cache is not None and analyzer.used != previous:
+        _write_cache(Path(cache), analyzer.used)
+    return analysis
+
+
+def _load_cache(path: Path) -> dict[str, Summary]:
+    try:
+        # Like `.pyc` files, the cache is only ever written by us.
+        version, summaries = marshal.loads(path.read_bytes())  # noqa: S302
+    except (OSError, ValueError, EOFError, TypeError):
+        return {}
+    if version != _VERSION:
+        return {}
+    return summaries
+
+
+def _write_cache(path: Path, summaries: dict[str, Summary]) -> None:
+    # The cache only makes later analyses faster, so failing to write it is
+    # not worth failing this one.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_bytes(marshal.dumps((_VERSION, summaries)))
+        temporary.replace(path)
+    except OSError:
+        pass
+
+
+class _UnresolvedError(Exception):
+    """Something a registration refers to could not be resolved."""
+
+
+class _Analyzer:
+    _paths: list[Path]
+
+    _cache: dict[str, Summary]
+    """Summaries from previous analyses, by the hash of their module."""
+
+    used: dict[str, Summary]
+    """The summaries of the modules this analysis looked at."""
+
+    _analysis: Analysis
+
+    _modules: dict[str, tuple[Names, Summary] | None]
+    """The summarized modules, `None` for ones without source."""
+
+    _symbols: dict[str, Any]
+    """What the dotted paths resolved to, mostly stand-ins."""
+
+    _stand_ins: set[Any]
+
+    _resolving: set[str]
+    """The dotted paths currently being resolved, to break cyclic imports."""
+
+    _fields: dict[type[Any], dict[str, Parameter]]
+    """The parameters dataclasses derived from their fields."""
+
+    _registrars: dict[str, tuple[Specification, str | None]]
+    """
+    The specifications the names of the container module refer to, and the
+    profile a container created from them selects.
+    """
+
+    _constants: dict[str, str]
+    """Strings assigned at the top level of the container module."""
+
+    def __init__(self, paths: list[Path], cache: dict[str, Summary]) -> None:
+        super().__init__()
+        self._paths = paths
+        self._cache = cache
+        self.used = {}
+        self._analysis = Analysis(Specification(), None)
+        self._modules = {}
+        self._symbols = {}
+        self._stand_ins = set()
+        self._resolving = set()
+        self._fields = {}
+        self._registrars = {}
+        self._constants = {}
+
+    def analyze(self, specifier: str, profile: str | None) -> Analysis:
+        module, separator, symbol = specifier.partition(":")
+        if separator == "" or module == "" or symbol == "":
+            raise InvalidImportSpecifierError(specifier)
+
+        found = self._module(module)
+        if found is None:
+            reason = f"the source of the module '{module}' can't be found"
+            raise StaticAnalysisError(specifier, reason)
+
+        names, summary = found
+        for statement in summary[3]:
+            self._replay(statement, names)
+
+        registered = self._registrars.get(symbol)
+        if registered is None:
+            reason = f"'{symbol}' is not a container or specification created at the top level of '{module}'"
+            raise StaticAnalysisError(specifier, reason)
+
+        spec, selected = registered
+        profile = profile or selected
+        self._analysis.spec = spec if profile is None else spec.select(profile)
+        self._analysis.profile = profile
+        self._analysis.files = len(self.used)
+        return self._analysis
+
+    # -------------------------------------------------------------------------
+    # Modules
+    # -------------------------------------------------------------------------
+
+    def _module(self, name: str) -> tuple[Names, Summary] | None:
+        if name in self._modules:
+            return self._modules[name]
+
+        self._modules[name] = None
+        path = self._locate(name)
+        if path is None:
+            return None
+        try:
+            source = path.read_bytes()
+        except OSError:
+            return None
+
+        # Relative imports resolve differently in other modules and packages.
+        key = sha256(f"{name}:{path.name}:".encode() + source).hexdigest()
+        summary = self._cache.get(key)
+        if summary is None:
+            try:
+                summary = _summarize(source, path, name)
+            except (SyntaxError, ValueError):
+                return None
+            self._analysis.parsed += 1
+
+        self.used[key] = summary
+        self._modules[name] = (Names(name, summary[0]), summary)
+        return self._modules[name]
+
+    def _locate(self, name: str) -> Path | None:
+        """Finds the source of the module like the default importers would."""
+        parts = name.split(".")
+        for entry in self._paths:
+            base = entry.joinpath(*parts)
+            for candidate in [base / "__init__.py", base.with_name(f"{parts[-1]}.py")]:
+                if candidate.is_file():
+                    return candidate
+        return None
+
+    # -------------------------------------------------------------------------
+    # Symbols
+    # -------------------------------------------------------------------------
+
+    def _symbol(self, qualified: str) -> Any:
+        """
+        What the dotted path refers to, or `Parameter.empty` if it can't be
+        resolved.
+        """
+        if qualified in self._symbols:
+            return self._symbols[qualified]
+        if qualified in self._resolving:
+            return Parameter.empty
+
+        self._resolving.add(qualified)
+        try:
+            symbol = self._resolve(qualified)
+        finally:
+            self._resolving.discard(qualified)
+        self._symbols[qualified] = symbol
+        return symbol
+
+    def _resolve(self, qualified: str) -> Any:
+        parts = qualified.split(".")
+        # Either part might be dotted, so we look for the longest module.
+        for end in range(len(parts) - 1, 0, -1):
+            module, path = ".".join(parts[:end]), parts[end:]
+            if any(
+                module == name or module.startswith(f"{name}.") for name in _IMPORTED
+            ):
+                return _import(module, path)
+
+            found = self._module(module)
+            if found is None:
+                continue
+
+            names, (_, classes, functions, _) = found
+            qualname = ".".join(path)
+            if qualname in classes:
+                return self._class(module, qualname, names, classes[qualname])
+            if qualname in functions:
+                return self._function(module, qualname, names, functions[qualname])
+
+            # Modules like `__init__.py` often re-export what they import.
+            imported = names.names.get(path[0])
+            if imported is not None and imported != f"{module}.{path[0]}":
+                return self._symbol(".".join([imported, *path[1:]]))
+            return Parameter.empty
+        return Parameter.empty
+
+    def _class(
+        self, module: str, qualname: str, names: Names, summary: ClassSummary
+    ) -> type[Any]:
+        bases_source, decorators, init, fields = summary
+        # Named tuples are constructed from their fields, like dataclasses.
+        # Their stand-ins are plain classes, with a constructor taking them.
+        named_tuple = [
+            source for source in bases_source if _is_named_tuple(source, names)
+        ]
+        bases: list[Any] = []
+        for source in bases_source:
+            if source in named_tuple:
+                continue
+            base = self._evaluate_source(source, names)
+            # E.g. `NamedTuple` is a function, that creates the actual base.
+            if isinstance(base, type) or hasattr(base, "__mro_entries__"):
+                bases.append(base)
+
+        options = (
+            (True, False) if named_tuple else _dataclass_options(decorators, names)
+        )
+        namespace: dict[str, Any] = {"__module__": module, "__qualname__": qualname}
+        constructor = None
+        if init is not None or (options is not None and options[0]):
+            # The signature is only known once the class exists, since its
+            # annotations might refer to it.
+            constructor = _stand_in(module, f"{qualname}.__init__")
+            namespace["__init__"] = constructor
+
+        name = qualname.rpartition(".")[2]
+        try:
+            stand_in = new_class(
+                name, tuple(bases), exec_body=lambda ns: ns.update(namespace)
+            )
+        except TypeError:
+            # E.g. bases with conflicting metaclasses.
+            stand_in = new_class(name, (), exec_body=lambda ns: ns.update(namespace))
+        self._symbols[f"{module}.{qualname}"] = stand_in
+        self._stand_ins.add(stand_in)
+
+        owner = f"{module}:{qualname}"
+        if init is not None:
+            parameters = self._parameters(init, names, owner)
+        elif options is not None and options[0]:
+            own = self._parameters(fields, names, owner, keyword_only=options[1])
+            merged: dict[str, Parameter] = {}
+            for base in reversed(stand_in.__mro__[1:]):
+                merged.update(self._fields.get(base, {}))
+            merged.update({parameter.name: parameter for parameter in own})
+            self._fields[stand_in] = merged
+            # Keyword only fields move to the end of the generated `__init__`.
+            parameters = [
+                Parameter("self", Parameter.POSITIONAL_OR_KEYWORD),
+                *sorted(
+                    merged.values(), key=lambda p: p.kind == Parameter.KEYWORD_ONLY
+                ),
+            ]
+        else:
+            return stand_in
+
+        assert constructor is not None
+        try:
+            constructor.__signature__ = Signature(parameters)
+        except ValueError as error:
+            # E.g. dataclass fields without defaults following ones with.
+            self._analysis.unresolved.append(f"{owner}: {error}")
+            constructor.__signature__ = Signature(parameters[:1])
+        return stand_in
+
+    def _function(
+        self, module: str, qualname: str, names: Names, summary: FunctionSummary
+    ) -> Callable[..., Any]:
+        parameters, returns = summary
+        owner = f"{module}:{qualname}"
+        stand_in = _stand_in(module, qualname)
+        self._symbols[f"{module}.{qualname}"] = stand_in
+        self._stand_ins.add(stand_in)
+
+        annotation = Parameter.empty
+        if returns is not None:
+            annotation = self._evaluate_source(returns, names)
+            if annotation is Parameter.empty:
+                self._analysis.unresolved.append(f"{owner} -> return: {returns}")
+        stand_in.__signature__ = Signature(
+            self._parameters(parameters, names, owner), return_annotation=annotation
+        )
+        return stand_in
+
+    def _parameters(
+        self,
+        parameters: Parameters,
+        names: Names,
+        owner: str,
+        keyword_only: bool = False,
+    ) -> list[Parameter]:
+        result: list[Parameter] = []
+        for name, kind, annotation_source, default_source in parameters:
+            if keyword_only and kind == Parameter.POSITIONAL_OR_KEYWORD:
+                kind = Parameter.KEYWORD_ONLY
+
+            # Parameters with defaults are never resolved by their annotation.
+            annotation = Parameter.empty
+            default = Parameter.empty
+            if default_source is not None:
+                default = _literal(default_source)
+            elif annotation_source is not None:
+                annotation = self._evaluate_source(annotation_source, names)
+                if annotation is Parameter.empty:
+                    self._analysis.unresolved.append(
+                        f"{owner} -> {name}: {annotation_source}"
+                    )
+
+            result.append(
+                Parameter(name, kind, default=default, annotation=annotation)  # type: ignore[reportArgumentType]
+            )
+        return result
+
+    # -------------------------------------------------------------------------
+    # Annotations
+    # -------------------------------------------------------------------------
+
+    def _evaluate_source(self, source: str, names: Names) -> Any:
+        try:
+            expression = ast.parse(source, mode="eval").body
+        except SyntaxError:
+            return Parameter.empty
+        return self._evaluate(expression, names)
+
+    def _evaluate(self, expression: ast.expr, names: Names) -> Any:
+        """
+        Evaluates an annotation, or returns `Parameter.empty` if it refers to
+        something that can't be resolved.
+        """
+        match expression:
+            case ast.Constant(value=str(source)):
+                return self._evaluate_source(source, names)
+            case ast.Constant(value=value):
+                return value
+            case ast.Name() | ast.Attribute():
+                qualified = names.qualify(expression)
+                return Parameter.empty if qualified is None else self._symbol(qualified)
+            case ast.BinOp(left=left, op=ast.BitOr(), right=right):
+                members = [self._evaluate(left, names), self._evaluate(right, names)]
+                if Parameter.empty in members:
+                    return Parameter.empty
+                try:
+                    return members[0] | members[1]
+                except TypeError:
+                    return Parameter.empty
+            case ast.Subscript(value=value, slice=index):
+                return self._subscript(self._evaluate(value, names), index, names)
+            case ast.List(elts=elements):
+                return [self._evaluate(element, names) for element in elements]
+            case ast.Tuple(elts=elements):
+                return tuple(self._evaluate(element, names) for element in elements)
+            case _:
+                return Parameter.empty
+
+    def _subscript(self, generic: Any, index: ast.expr, names: Names) -> Any:
+        if generic is Parameter.empty:
+            return generic
+        # The arguments of generic stand-ins don't matter for planning.
+        if generic in self._stand_ins:
+            return generic
+
+        elements = index.elts if isinstance(index, ast.Tuple) else [index]
+        arguments: list[Any] = []
+        for position, element in enumerate(elements):
+            if generic is Literal or (generic is Annotated and position > 0):
+                arguments.append(_literal(ast.unparse(element)))
+                continue
+            argument = self._evaluate(element, names)
+            if argument is Parameter.empty or (
+                isinstance(argument, list) and Parameter.empty in argument
+            ):
+                return Parameter.empty
+            arguments.append(argument)
+
+        try:
+            return generic[arguments[0] if len(arguments) == 1 else tuple(arguments)]
+        except TypeError:
+            return Parameter.empty
+
+    # -------------------------------------------------------------------------
+    # Registrations
+    # -------------------------------------------------------------------------
+
+    def _replay(self, statement: Statement, names: Names) -> None:
+        kind, target, source = statement
+        if kind == "block":
+            if not self._registrars.keys().isdisjoint(target.split()):
+                message = (
+                    "registrations in compound statements can't be analyzed statically"
+                )
+                self._analysis.skipped.append(f"{source}: {message}")
+            return
+
+        expression = ast.parse(source, mode="eval").body
+        try:
+            match kind:
+                case "assign":
+                    self._assign(target, expression, names)
+                case "call":
+                    self._call(expression, names, source)
+                case _:
+                    self._decorate(f"{names.module}.{target}", expression, names)
+        except (DiyError, TypeError, _UnresolvedError) as error:
+            if kind == "decorate":
+                source = f"@{source} def {target}"
+            self._analysis.skipped.append(f"{source}: {error}")
+
+    def _assign(self, target: str, value: ast.expr, names: Names) -> None:
+        match value:
+            case ast.Constant(value=str(constant)):
+                self._constants[target] = constant
+            case ast.Call(func=function, args=arguments, keywords=keywords):
+                callee = names.qualify(function)
+                if callee in _SPECIFICATIONS:
+                    self._registrars[target] = (Specification(), None)
+                elif callee in _CONTAINERS:
+                    spec = Specification()
+                    if len(arguments) > 0:
+                        spec = self._registrar(arguments[0])
+                        if spec is None:
+                            message = "the specification of the container is unknown"
+                            raise _UnresolvedError(message)
+                    profile = None
+                    for keyword in keywords:
+                        if keyword.arg == "profile":
+                            profile = self._profile(keyword.value, names)
+                    self._registrars[target] = (spec, profile)
+                else:
+                    spec = self._registrar(value)
+                    if spec is not None:
+                        self._registrars[target] = (spec, None)
+            case _:
+                pass
+
+    def _call(self, call: ast.expr, names: Names, source: str) -> None:
+        if not isinstance(call, ast.Call):
+            return
+        found = self._method(call.func)
+        if found is None:
+            return
+
+        spec, method = found
+        match method, call.args:
+            case "add", [ast.Name(id=name)] if name in self._function_names(names):
+                spec.add(self._symbol(f"{names.module}.{name}"))
+            case "add", [abstract]:
+                spec.add(self._type(abstract, names))
+            case "add_lazy", [abstract, target]:
+                spec.add(self._lazy_builder(self._type(abstract, names), target))
+            case _:
+                message = "it can't be analyzed statically"
+                raise _UnresolvedError(message)
+
+    def _decorate(self, builder: str, decorator: ast.expr, names: Names) -> None:
+        match decorator:
+            case ast.Call(func=function, args=[abstract, name]):
+                found = self._method(function)
+                if found is None or found[1] != "add":
+                    return
+                parameter = self._string(name)
+                if parameter is None:
+                    message = f"the parameter {ast.unparse(name)} is unknown"
+                    raise _UnresolvedError(message)
+                found[0].add(self._type(abstract, names), parameter)(
+                    self._symbol(builder)
+                )
+            case _:
+                found = self._method(decorator)
+                if found is None or found[1] != "add":
+                    return
+                found[0].add(self._symbol(builder))
+
+    def _method(self, expression: ast.expr) -> tuple[Specification, str] | None:
+        """The specification and the name of the method the expression refers to."""
+        match expression:
+            case ast.Attribute(
+                value=ast.Attribute(value=value, attr="builders" | "partials" as group),
+                attr=attribute,
+            ):
+                method = _METHODS.get(f"{group}.{attribute}", f"{group}.{attribute}")
+            case ast.Attribute(value=value, attr=method):
+                pass
+            case _:
+                return None
+        spec = self._registrar(value)
+        return None if spec is None else (spec, method)
+
+    def _registrar(self, expression: ast.expr) -> Specification | None:
+        """The specification the expression refers to, if it is one."""
+        match expression:
+            case ast.Name(id=name) if name in self._registrars:
+                return self._registrars[name][0]
+            case ast.Call(func=ast.Attribute(value=value, attr="profile"), args=[name]):
+                spec = self._registrar(value)
+                profile = self._string(name)
+                if spec is None or profile is None:
+                    return None
+                return spec.profile(profile)
+            case _:
+                return None
+
+    def _profile(self, expression: ast.expr, names: Names) -> str | None:
+        """
+        The profile a container selects, using the default if it is read from
+        the environment.
+        """
+        match expression:
+            case ast.Call(func=function, args=[_, default]) if (
+                names.qualify(function) in _ENVIRONMENT
+            ):
+                return self._string(default)
+            case _:
+                return self._string(expression)
+
+    def _string(self, expression: ast.expr) -> str | None:
+        match expression:
+            case ast.Constant(value=str(value)):
+                return value
+            case ast.Name(id=name):
+                return self._constants.get(name)
+            case _:
+                return None
+
+    def _type(self, expression: ast.expr, names: Names) -> type[Any]:
+        """The type an argument refers to, either directly or by a specifier."""
+        specifier = self._string(expression)
+        if specifier is not None:
+            abstract = self._specified(specifier)
+        else:
+            abstract = self._evaluate(expression, names)
+
+        if abstract is Parameter.empty or not isinstance(abstract, type):
+            message = f"{ast.unparse(expression)} can't be resolved"
+            raise _UnresolvedError(message)
+        return abstract
+
+    def _specified(self, specifier: str) -> Any:
+        module, _, symbol = specifier.partition(":")
+        return self._symbol(f"{module}.{symbol}")
+
+    def _lazy_builder(
+        self, abstract: type[Any], target: ast.expr
+    ) -> Callable[..., Any]:
+        """A stand-in for the :class:`LazyBuilder` of the target."""
+        specifier = self._string(target)
+        resolved = Parameter.empty if specifier is None else self._specified(specifier)
+        if specifier is None or resolved is Parameter.empty:
+            message = f"{ast.unparse(target)} can't be resolved"
+            raise _UnresolvedError(message)
+
+        module, _, qualname = specifier.partition(":")
+        builder = _stand_in(module, qualname)
+        if isinstance(resolved, type) and resolved is not abstract:
+            parameter = Parameter(
+                "implementation", Parameter.POSITIONAL_OR_KEYWORD, annotation=resolved
+            )
+            builder.__signature__ = Signature([parameter], return_annotation=abstract)
+        else:
+            # Registered for the abstract type, whatever the target returns.
+            builder.__signature__ = signature(resolved).replace(
+                return_annotation=abstract
+            )
+        return builder
+
+    def _function_names(self, names: Names) -> set[str]:
+        found = self._modules.get(names.module)
+        return set() if found is None else set(found[1][2])
+
+
+def _import(module: str, path: list[str]) -> Any:
+    try:
+        symbol: Any = import_module(module)
+        for part in path:
+            symbol = getattr(symbol, part)
+    except (ImportError, AttributeError):
+        return Parameter.empty
+    return symbol
+
+
+def _stand_in(module: str, qualname: str) -> Any:
+    """A function standing in for a builder or constructor."""
+
+    def stand_in(*args: Any, **kwargs: Any) -> Any:
+        message = f"{module}:{qualname} only stands in for the analysis"
+        raise TypeError(message)
+
+    stand_in.__module__ = module
+    stand_in.__qualname__ = qualname
+    stand_in.__name__ = qualname.rpartition(".")[2]
+    return stand_in
+
+
+def _literal(source: str) -> Any:
+    """The value of a literal, or `...` for anything else."""
+    try:
+        expression = ast.parse(source, mode="eval").body
+    except SyntaxError:
+        return ...
+    return expression.value if isinstance(expression, ast.Constant) else ...
+
+
+def _dataclass_options(
+    decorators: tuple[str, ...], names: Names
+) -> tuple[bool, bool] | None:
+    """
+    Whether a dataclass generates an `__init__`, and whether its parameters
+    are keyword only. `None`, if the class is no dataclass.
+    """
+    for source in decorators:
+        expression = ast.parse(source, mode="eval").body
+        keywords: list[ast.keyword] = []
+        if isinstance(expression, ast.Call):
+            keywords = expression.keywords
+            expression = expression.func
+        if names.qualify(expression) != "dataclasses.dataclass":
+            continue
+
+        options = {keyword.arg: keyword.value for keyword in keywords}
+        return (
+            not _is_constant(options.get("init"), value=False),
+            _is_constant(options.get("kw_only"), value=True),
+        )
+    return None
+
+
+def _is_named_tuple(source: str, names: Names) -> bool:
+    expression = ast.parse(source, mode="eval").body
+    return names.qualify(expression) == "typing.NamedTuple"
+
+
+def _is_constant(expression: ast.expr | None, value: bool) -> bool:
+    return isinstance(expression, ast.Constant) and expression.value is value
+
+
+# =============================================================================
+# Summaries
+# =============================================================================
+
+
+def _summarize(source: bytes, path: Path, module: str) -> Summary:
+    tree = ast.parse(source, str(path))
+    names = Names.collect(module, path.name == "__init__.py", tree)
+
+    classes: dict[str, ClassSummary] = {}
+    _summarize_classes(tree.body, "", names, classes)
+
+    functions: dict[str, FunctionSummary] = {}
+    statements: list[Statement] = []
+    for node in tree.body:
+        match node:
+            case ast.FunctionDef() | ast.AsyncFunctionDef():
+                functions[node.name] = (_parameters(node.args), _source(node.returns))
+                statements.extend(
+                    ("decorate", node.name, ast.unparse(decorator))
+                    for decorator in node.decorator_list
+                )
+            case (
+                ast.Assign(targets=[ast.Name(id=target)], value=value)
+                | ast.AnnAssign(target=ast.Name(id=target), value=ast.expr() as value)
+            ) if isinstance(value, ast.Call | ast.Constant):
+                statements.append(("assign", target, ast.unparse(value)))
+            case ast.Expr(value=ast.Call(func=ast.Attribute()) as call):
+                statements.append(("call", "", ast.unparse(call)))
+            case ast.For() | ast.While() | ast.If() | ast.With() | ast.Try():
+                # We can't tell how often or whether the body runs, but the
+                # analysis can at least report registrations in it.
+                used = sorted(
+                    {
+                        child.id
+                        for child in ast.walk(node)
+                        if isinstance(child, ast.Name)
+                    }
+                )
+                first = ast.unparse(node).partition("\n")[0].removesuffix(":")
+                statements.append(("block", " ".join(used), first))
+            case _:
+                pass
+
+    return names.names, classes, functions, tuple(statements)
+
+
+def _summarize_classes(
+    body: list[ast.stmt], prefix: str, names: Names, classes: dict[str, ClassSummary]
+) -> None:
+    for node in body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        qualname = f"{prefix}{node.name}"
+        init: Parameters | None = None
+        fields: list[tuple[str, int, str | None, str | None]] = []
+        keyword_only = False
+        for statement in node.body:
+            match statement:
+                case ast.FunctionDef(name="__init__"):
+                    init = _parameters(statement.args)
+                case ast.AnnAssign(target=ast.Name(id=name)):
+                    annotation = statement.annotation
+                    if isinstance(annotation, ast.Subscript):
+                        annotation = annotation.value
+                    annotated = names.qualify(annotation)
+                    if annotated == "typing.ClassVar":
+                        continue
+                    if annotated == "dataclasses.KW_ONLY":
+                        keyword_only = True
+                        continue
+
+                    field = _field(name, statement, names, keyword_only)
+                    if field is not None:
+                        fields.append(field)
+                case _:
+                    pass
+
+        classes[qualname] = (
+            tuple(ast.unparse(base) for base in node.bases),
+            tuple(ast.unparse(decorator) for decorator in node.decorator_list),
+            init,
+            tuple(fields),
+        )
+        _summarize_classes(node.body, f"{qualname}.", names, classes)
+
+
+def _field(
+    name: str, statement: ast.AnnAssign, names: Names, keyword_only: bool
+) -> tuple[str, int, str | None, str | None] | None:
+    """The parameter a dataclass generates for an annotated attribute."""
+    kind = Parameter.KEYWORD_ONLY if keyword_only else Parameter.POSITIONAL_OR_KEYWORD
+    default = _source(statement.value)
+
+    value = statement.value
+    if isinstance(value, ast.Call) and names.qualify(value.func) == "dataclasses.field":
+        options = {keyword.arg: keyword.value for keyword in value.keywords}
+        if _is_constant(options.get("init"), value=False):
+            return None
+        if _is_constant(options.get("kw_only"), value=True):
+            kind = Parameter.KEYWORD_ONLY
+        has_default = "default" in options or "default_factory" in options
+        default = "..." if has_default else None
+
+    return (name, int(kind), ast.unparse(statement.annotation), default)
+
+
+def _parameters(arguments: ast.arguments) -> Parameters:
+    positional = [*arguments.posonlyargs, *arguments.args]
+    missing = len(positional) - len(arguments.defaults)
+    defaults: list[ast.expr | None] = [None] * missing + [*arguments.defaults]
+
+    parameters = [
+        _parameter(
+            argument,
+            Parameter.POSITIONAL_ONLY
+            if index < len(arguments.posonlyargs)
+            else Parameter.POSITIONAL_OR_KEYWORD,
+            default,
+        )
+        for index, (argument, default) in enumerate(
+            zip(positional, defaults, strict=True)
+        )
+    ]
+    if arguments.vararg is not None:
+        parameters.append(_parameter(arguments.vararg, Parameter.VAR_POSITIONAL))
+    parameters.extend(
+        _parameter(argument, Parameter.KEYWORD_ONLY, default)
+        for argument, default in zip(
+            arguments.kwonlyargs, arguments.kw_defaults, strict=True
+        )
+    )
+    if arguments.kwarg is not None:
+        parameters.append(_parameter(arguments.kwarg, Parameter.VAR_KEYWORD))
+    return tuple(parameters)
+
+
+def _parameter(
+    argument: ast.arg, kind: Any, default: ast.expr | None = None
+) -> tuple[str, int, str | None, str | None]:
+    return (argument.arg, int(kind), _source(argument.annotation), _source(default))
+
+
+def _source(node: ast.expr | None) -> str | None:
+    return None if node is None else ast.unparse(node)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from diy._internal.execution import Program, compile_program
+from diy._internal.plan import (
+    BuilderBasedResolutionPlan,
+    BuilderParameterResolutionPlan,
+    DefaultParameterResolutionPlan,
+    FailedParameterResolutionPlan,
+    InferenceBasedResolutionPlan,
+    InferenceParameterResolutionPlan,
+    LazyParameterResolutionPlan,
+    ParameterResolutionPlan,
+    ProviderParameterResolutionPlan,
+)
+
+type BatchRoot = (
+    BuilderBasedResolutionPlan[..., Any] | InferenceBasedResolutionPlan[Any]
+)
+type BatchNode = BatchRoot | ParameterResolutionPlan[..., Any]
+
+
+@dataclass
+class BatchResolutionPlan:
+    """
+    Resolves multiple types at once, while only constructing dependencies that
+    are shared between them a single time.
+
+    Since the plan of a type only depends on the type itself and the spec, two
+    nodes that build the same type (or call the same builder) are
+    interchangeable. We identify them using :func:`node_key` and re-use the
+    first instance that was built for all others.
+    """
+
+    plans: list[BatchRoot] = field(default_factory=list)
+    """The plans of the requested types, in the order they were requested."""
+
+    program: Program | None = field(default=None, init=False, repr=False, compare=False)
+    """The compiled form of this plan, see :meth:`execute`."""
+
+    def execute(self) -> list[Any]:
+        """
+        Builds an instance for each plan and returns them in order.
+        """
+        if self.program is None:
+            # Like for single plans, the optimizer is only needed once plans
+            # are executed.
+            from diy._internal.optimizer import optimize
+
+            self.program = compile_program(
+                [optimize(plan) for plan in self.plans],  # type: ignore[reportArgumentType]
+                key=node_key,
+            )
+        return self.program.run()
+
+    @property
+    def nodes(self) -> int:
+        """
+        How many instances would be constructed when resolving each type on
+        its own.
+        """
+        return sum(1 for _ in _iter_constructing_nodes(self.plans))
+
+    @property
+    def unique_nodes(self) -> int:
+        """
+        How many instances are actually constructed by :meth:`execute`.
+        """
+        return len({node_key(node) for node in _iter_constructing_nodes(self.plans)})
+
+    @property
+    def saved(self) -> int:
+        """
+        The amount of constructions that are avoided by sharing dependencies.
+        """
+        return self.nodes - self.unique_nodes
+
+
+def node_key(node: Any) -> Hashable:
+    """
+    Identifies nodes that produce interchangeable instances.
+    """
+    match node:
+        case BuilderBasedResolutionPlan() | BuilderParameterResolutionPlan():
+            return ("builder", node.builder)
+        case ProviderParameterResolutionPlan():
+            return ("provider", node.type)
+        case LazyParameterResolutionPlan():
+            return ("lazy", node.type)
+        case FailedParameterResolutionPlan():
+            return ("failed", id(node))
+        case _:
+            return ("type", node.type)
+
+
+def _iter_constructing_nodes(plans: list[BatchRoot]) -> Iterator[BatchNode]:
+    stack: list[BatchNode] = list(plans)
+    while len(stack) > 0:
+        node = stack.pop()
+        match node:
+            case DefaultParameterResolutionPlan():
+                continue
+            case BuilderBasedResolutionPlan() | BuilderParameterResolutionPlan():
+                stack.extend(node.args_plan.parameters)
+            case InferenceBasedResolutionPlan() | InferenceParameterResolutionPlan():
+                stack.extend(node.parameters)
+            case _:
+                pass
+        yield node
@@ -0,0 +1,111 @@
+"""
+Remembers what a planner derived for each type, without growing without bound.
+
+Applications that create classes at runtime (e.g. one per schema or tenant)
+would fill a plain dictionary without bound, and since it references the
+classes, they could never be unloaded. A :class:`PlanCache` instead holds at
+most `maxsize` entries, and evicts the least recently used ones. Once its
+entry is evicted, a class is no longer referenced by the cache, so it can be
+garbage collected.
+
+Entries are keyed by the type itself. Holding the types weakly would not help,
+since the cached plans reference the type they were made for anyways. Each
+cache keeps its entries to itself, and never stores anything on the classes
+or functions it is keyed by. With an unbounded cache, types are only released
+by :meth:`PlanCache.clear`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+_MISSING: Any = object()
+
+DEFAULT_MAXSIZE = 1024
+"""How many types a cache remembers, unless configured otherwise."""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    size: int
+    """How many entries the cache currently holds."""
+
+    maxsize: int | None
+    """How many entries the cache holds at most."""
+
+    hits: int
+    """How often a requested entry was found."""
+
+    misses: int
+    """How often a requested entry was not found."""
+
+    evictions: int
+    """How many entries were dropped, since the cache was full."""
+
+
+class PlanCache:
+    """A bounded, least recently used cache that is keyed by type."""
+
+    maxsize: int | None
+    """How many entries to hold at most, or `None` for no limit."""
+
+    hits: int
+    misses: int
+    evictions: int
+
+    _entries: OrderedDict[Any, Any]
+    """All entries, least recently used first."""
+
+    def __init__(self, maxsize: int | None = DEFAULT_MAXSIZE) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, subject: Any, default: Any = None) -> Any:
+        value = self._entries.get(subject, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        # Another thread might have evicted the entry in the meantime.
+        with suppress(KeyError):
+            self._entries.move_to_end(subject)
+        return value
+
+    def set(self, subject: Any, value: Any) -> None:
+        # Re-inserting the entry moves it to the end.
+        self._entries.pop(subject, None)
+        self._entries[subject] = value
+        while self.maxsize is not None and len(self._entries) > self.maxsize:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                # Another thread emptied the cache in the meantime.
+                break
+            self.evictions += 1
+
+    def items(self) -> list[tuple[Any, Any]]:
+        """All entries, from the least to the most recently used."""
+        return list(self._entries.items())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            size=len(self._entries),
+            maxsize=self.maxsize,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from sys import stdout
 from types import UnionType
@@ -12,9 +12,13 @@ from diy._internal.plan import (
     BuilderParameterResolutionPlan,
     CallableResolutionPlan,
     DefaultParameterResolutionPlan,
+    FailedParameterResolutionPlan,
+    LazyParameterResolutionPlan,
     NoArgsConstructorParameterResolutionPlan,
+    NoneParameterResolutionPlan,
     ParameterPlanList,
     ParameterResolutionPlan,
+    ProviderParameterResolutionPlan,
     ResolutionPlan,
 )
 
@@ -133,6 +137,14 @@ def print_resolution_plan(
             child_repr += f" {gray('<-', ansi)} {name}"
         if isinstance(child, NoArgsConstructorParameterResolutionPlan):
             child_repr += f" {gray('<-', ansi)} {child.type.__name__}()"
+        if isinstance(child, ProviderParameterResolutionPlan):
+            child_repr += f" {gray('<-', ansi)} Provider"
+        if isinstance(child, LazyParameterResolutionPlan):
+            child_repr += f" {gray('<-', ansi)} Lazy"
+        if isinstance(child, NoneParameterResolutionPlan):
+            child_repr += f" {gray('<-', ansi)} None"
+        if isinstance(child, FailedParameterResolutionPlan):
+            child_repr += f" {gray('<-', ansi)} {type(child.error).__name__}"
         children_repr += f"\n{child_repr}"
 
         if isinstance(child, DefaultParameterResolutionPlan):
@@ -141,6 +153,14 @@ def print_resolution_plan(
             continue
         if isinstance(child, NoArgsConstructorParameterResolutionPlan):
             continue
+        if isinstance(child, ProviderParameterResolutionPlan):
+            continue
+        if isinstance(child, LazyParameterResolutionPlan):
+            continue
+        if isinstance(child, NoneParameterResolutionPlan):
+            continue
+        if isinstance(child, FailedParameterResolutionPlan):
+            continue
 
         for unit in reversed(PlanDisplayContainer.map(child.parameters)):
             tree.appendleft(unit)
@@ -148,6 +168,30 @@ def print_resolution_plan(
     return f"{root_repr}{children_repr}"
 
 
+def print_cycle(
+    cycle: Sequence[tuple[str | None, Any]], ansi: bool | None = None
+) -> str:
+    """
+    Displays a circular dependency in the same style as a resolution plan.
+    Each entry is the name of the parameter a type was requested by, and the
+    type itself. The last type is the same as the first one.
+    """
+    if ansi is None:
+        ansi = stdout.isatty()
+    if ansi is None:
+        ansi = False
+
+    (_, first), *rest = cycle
+    lines = [_print_qualified_name(first, ansi)]
+    for depth, (name, abstract) in enumerate(rest):
+        line = "   " * depth + gray("└─", ansi)
+        line += _display_param(name or "", abstract, ansi)
+        lines.append(line)
+    lines[-1] += f" {gray('<-', ansi)} circular"
+
+    return "\n".join(lines)
+
+
 def _print_qualified_name(
     subject: type[Any] | Callable[..., Any] | None, ansi: bool
 ) -> str:
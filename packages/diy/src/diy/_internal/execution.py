@@ -0,0 +1,124 @@
+"""
+Executes plans without recursing into their children.
+
+Instead of letting every node of a plan call `execute` on its children, we
+flatten the plan into a list of instructions in post-order. Each instruction
+calls a function with the results of earlier instructions as its keyword
+arguments. Since children always come before their parents, a single loop
+over the instructions builds the whole plan, no matter how deep it is.
+
+This also means the work of walking the plan is only done once per plan,
+instead of every time it is executed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+class Step(Protocol):
+    """
+    Anything that can be compiled into an instruction.
+    """
+
+    def callee(self) -> Callable[..., Any]:
+        """The function that is called to produce the value of this step."""
+        ...
+
+    def arguments(self) -> Sequence[Argument]:
+        """The steps that are passed as keyword arguments to the callee."""
+        ...
+
+
+class Argument(Step, Protocol):
+    name: str
+
+
+type Instruction = tuple[Callable[..., Any], tuple[str, ...], tuple[int, ...]]
+"""
+The function to call, the names of its keyword arguments, and the indices of
+the instructions that produce the values for them.
+"""
+
+
+@dataclass
+class Program:
+    instructions: list[Instruction]
+    """All instructions in the order they need to be run."""
+
+    results: list[int]
+    """The indices of the instructions producing the requested values."""
+
+    def run(self) -> list[Any]:
+        """
+        Runs all instructions and returns the requested values.
+        """
+        values: list[Any] = []
+        append = values.append
+        for function, names, arguments in self.instructions:
+            if len(names) == 0:
+                append(function())
+                continue
+            append(
+                function(
+                    **dict(zip(names, [values[i] for i in arguments], strict=True))
+                )
+            )
+
+        return [values[result] for result in self.results]
+
+
+def compile_program(
+    roots: Sequence[Step],
+    key: Callable[[Step], Hashable] | None = None,
+) -> Program:
+    """
+    Flattens the given steps into a single program.
+
+    If a `key` function is passed, steps with the same key are only compiled
+    (and therefore executed) once, and their result is shared by everyone who
+    requires it.
+    """
+    instructions: list[Instruction] = []
+    slots: dict[int, int] = {}
+    shared: dict[Hashable, int] = {}
+
+    stack: list[tuple[Step, bool]] = [(root, False) for root in reversed(roots)]
+    while len(stack) > 0:
+        step, visited = stack.pop()
+
+        # All arguments were already compiled, so we know where to find them.
+        if visited:
+            arguments = step.arguments()
+            instructions.append(
+                (
+                    step.callee(),
+                    tuple(argument.name for argument in arguments),
+                    tuple(slots[id(argument)] for argument in arguments),
+                )
+            )
+            slot = len(instructions) - 1
+            slots[id(step)] = slot
+            if key is not None:
+                shared[key(step)] = slot
+            continue
+
+        if key is not None:
+            existing = shared.get(key(step))
+            if existing is not None:
+                slots[id(step)] = existing
+                continue
+
+        stack.append((step, True))
+        stack.extend((argument, False) for argument in reversed(step.arguments()))
+
+    return Program(instructions, [slots[id(root)] for root in roots])
+
+
+def run_step(step: Step) -> Any:
+    """
+    Compiles and immediately runs the given step.
+    """
+    return compile_program([step]).run()[0]
@@ -0,0 +1,170 @@
+"""
+Refers to builders and types by import specifiers, so the modules defining
+them are only imported once they are needed.
+
+Specifiers use the `module:symbol` format, e.g.
+`"weather.client.random:RandomWeatherClient"`, where the symbol may be a
+dotted path to a nested class or function.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from inspect import Parameter, Signature, signature
+from typing import Any
+
+from diy.errors import InvalidImportSpecifierError
+
+_UNRESOLVED: Any = object()
+
+
+def import_symbol(specifier: str) -> Any:
+    """
+    Imports the module of the specifier and returns the symbol it refers to.
+    """
+    module_name, separator, symbol = specifier.partition(":")
+    if separator == "" or module_name == "" or symbol == "" or ":" in symbol:
+        raise InvalidImportSpecifierError(specifier)
+
+    try:
+        subject: Any = sys.modules.get(module_name) or import_module(module_name)
+        for part in symbol.split("."):
+            subject = getattr(subject, part)
+    except (ImportError, AttributeError) as error:
+        raise InvalidImportSpecifierError(specifier, error) from error
+
+    return subject
+
+
+def imported_symbol(specifier: str) -> Any:
+    """
+    Returns the symbol the specifier refers to, if its module was imported
+    already, and `None` otherwise. Unlike :func:`import_symbol`, this never
+    imports anything.
+    """
+    module_name, _, symbol = specifier.partition(":")
+    subject: Any = sys.modules.get(module_name)
+    if subject is None:
+        return None
+    # Modules that are still being imported might lack the symbol for now.
+    for part in symbol.split("."):
+        subject = getattr(subject, part, None)
+    return subject
+
+
+class PendingSpecifiers:
+    """
+    Import specifiers of types that weren't imported yet, and might refer to
+    them by a module re-exporting them. Whether they do can only be told once
+    their module was imported, which might happen anytime.
+
+    Checking all of them on every lookup would make each lookup as slow as
+    there are specifiers, so we only check again once specifiers were added or
+    modules were imported since, and forget those we could check.
+    """
+
+    _unchecked: set[str]
+
+    _checked_at: int
+    """How many modules were imported, when we last checked, or `-1`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._unchecked = set()
+        self._checked_at = -1
+
+    def add(self, specifier: str) -> None:
+        self._unchecked.add(specifier)
+        self._checked_at = -1
+
+    def imported(self) -> list[tuple[str, type[Any]]]:
+        """
+        The specifiers, whose modules were imported since they were last
+        checked, along with the types they refer to.
+        """
+        if self._checked_at == len(sys.modules):
+            return []
+        self._checked_at = len(sys.modules)
+
+        imported: list[tuple[str, type[Any]]] = []
+        for specifier in list(self._unchecked):
+            subject = imported_symbol(specifier)
+            if isinstance(subject, type):
+                self._unchecked.discard(specifier)
+                imported.append((specifier, subject))
+        return imported
+
+
+def specifier_of(subject: type[Any] | Callable[..., Any]) -> str:
+    """The import specifier that refers to the given type or function."""
+    return f"{subject.__module__}:{subject.__qualname__}"
+
+
+def _forward[T](implementation: T) -> T:
+    return implementation
+
+
+class LazyBuilder:
+    """
+    Builds `abstract` using the function or class the specifier refers to,
+    without importing it until it is needed.
+
+    The planner only looks at the signature of a builder once it plans the
+    type, and only calls it when the plan is executed. Both import the
+    target, so registering the builder is free. If the specifier refers to
+    a class, it is planned like a parameter annotated with that class, so
+    partial builders registered for it still apply.
+    """
+
+    abstract: type[Any]
+
+    specifier: str
+
+    _target: Any
+    """What the specifier refers to, once imported."""
+
+    _call: Callable[..., Any]
+
+    def __init__(self, abstract: type[Any], specifier: str) -> None:
+        super().__init__()
+        self.abstract = abstract
+        self.specifier = specifier
+        self._target = _UNRESOLVED
+
+        # Plans and specification fingerprints refer to builders by their
+        # qualified names. Use those of the target, without importing it.
+        module, _, symbol = specifier.partition(":")
+        self.__module__ = module
+        self.__qualname__ = symbol
+
+    @property
+    def __signature__(self) -> Signature:
+        target = self._resolve()
+        if isinstance(target, type) and target is not self.abstract:
+            parameter = Parameter(
+                "implementation", Parameter.POSITIONAL_OR_KEYWORD, annotation=target
+            )
+            return Signature([parameter], return_annotation=self.abstract)
+        return signature(target, eval_str=True)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self._resolve()
+        return self._call(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyBuilder({self.specifier!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Whatever was imported is imported again on demand, and identity
+        # checks against the sentinel would not survive pickling.
+        return (LazyBuilder, (self.abstract, self.specifier))
+
+    def _resolve(self) -> Any:
+        if self._target is _UNRESOLVED:
+            target = import_symbol(self.specifier)
+            forwards = isinstance(target, type) and target is not self.abstract
+            self._call = _forward if forwards else target
+            self._target = target
+        return self._target
@@ -0,0 +1,151 @@
+"""
+Finds out which parameters the constructor of a class takes.
+
+Reflecting a constructor using `inspect.signature` is comparatively slow, and
+most injected classes don't even write their constructor themselves: it is
+generated from their fields, e.g. by :mod:`dataclasses`. For those, the
+fields already tell us everything we need, so adapters read them directly.
+Named tuples are constructed by a builtin, and can't be reflected at all.
+
+Adapters are tried in order, and the first one that returns parameters wins.
+If none applies, the constructor is reflected like any other function. Other
+libraries generating constructors can :func:`register_adapter` their own.
+"""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, fields, is_dataclass
+from inspect import CO_VARARGS, CO_VARKEYWORDS, Parameter
+from typing import TYPE_CHECKING, Any
+
+from diy._internal.signatures import LazySignature, class_annotations
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+type Adapter = Callable[[type[Any]], Sequence[Parameter] | None]
+"""
+Returns the parameters of the constructor of a class, without `self`, or
+`None` if the adapter doesn't know how the class is constructed. Annotations
+may be left as strings, they are only evaluated once they are needed.
+"""
+
+
+class DefaultFactory:
+    """
+    The default of parameters, whose default is created by a factory when the
+    constructor is called, e.g. dataclass fields with a `default_factory`.
+    """
+
+    def __repr__(self) -> str:
+        return "<factory>"
+
+
+DEFAULT_FACTORY = DefaultFactory()
+"""The default of all parameters with a default factory."""
+
+
+def constructor_signature(abstract: type[Any]) -> LazySignature | None:
+    """
+    The parameters of the constructor of the class, as told by the first
+    adapter that knows them. `None` if the constructor needs to be reflected.
+    """
+    for adapter in _adapters:
+        parameters = adapter(abstract)
+        if parameters is not None:
+            return LazySignature(abstract, parameters)
+    return None
+
+
+def register_adapter(adapter: Adapter) -> Adapter:
+    """
+    Uses the adapter to find out the parameters of constructors, before any
+    of the adapters that were registered earlier. Types that were planned
+    already keep the parameters they were planned with.
+    """
+    _adapters.insert(0, adapter)
+    return adapter
+
+
+def dataclass_parameters(abstract: type[Any]) -> Sequence[Parameter] | None:
+    """
+    The parameters of the `__init__` dataclasses generated from the fields,
+    including defaults created by a `default_factory`.
+    """
+    if not is_dataclass(abstract):
+        return None
+
+    positional: list[Parameter] = []
+    keyword_only: list[Parameter] = []
+    for field in fields(abstract):
+        if not field.init:
+            continue
+        default = field.default
+        if default is MISSING:
+            has_factory = field.default_factory is not MISSING
+            default = DEFAULT_FACTORY if has_factory else Parameter.empty
+        if field.kw_only is True:
+            keyword_only.append(
+                Parameter(
+                    field.name,
+                    Parameter.KEYWORD_ONLY,
+                    default=default,
+                    annotation=field.type,
+                )
+            )
+        else:
+            positional.append(
+                Parameter(
+                    field.name,
+                    Parameter.POSITIONAL_OR_KEYWORD,
+                    default=default,
+                    annotation=field.type,
+                )
+            )
+
+    # Dataclasses don't replace a constructor the class defines itself, and
+    # `InitVar`s are parameters, but no fields. Either way we need to reflect
+    # the actual constructor, which is cheap to detect using its code.
+    parameters = [*positional, *keyword_only]
+    if _argument_names(abstract.__init__) != [
+        parameter.name for parameter in parameters
+    ]:
+        return None
+    return parameters
+
+
+def namedtuple_parameters(abstract: type[Any]) -> Sequence[Parameter] | None:
+    """
+    The parameters named tuples are constructed with, one for each field.
+    """
+    if not issubclass(abstract, tuple) or abstract.__init__ is not object.__init__:
+        return None
+
+    # Subclasses of named tuples might construct themselves differently.
+    owner = next((base for base in abstract.__mro__ if "_fields" in vars(base)), None)
+    if owner is None or abstract.__new__ is not owner.__new__:
+        return None
+
+    defaults: dict[str, Any] = getattr(owner, "_field_defaults", {})
+    annotations = class_annotations(owner)
+    return [
+        Parameter(
+            name,
+            Parameter.POSITIONAL_OR_KEYWORD,
+            default=defaults.get(name, Parameter.empty),
+            annotation=annotations.get(name, Parameter.empty),
+        )
+        for name in owner._fields
+    ]
+
+
+def _argument_names(function: Any) -> list[str] | None:
+    """The names of the arguments of a function, except for `self`."""
+    code = getattr(function, "__code__", None)
+    if code is None or code.co_flags & (CO_VARARGS | CO_VARKEYWORDS):
+        return None
+    return list(code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount])
+
+
+_adapters: list[Adapter] = [dataclass_parameters, namedtuple_parameters]
+"""The adapters to try, in order."""
@@ -0,0 +1,334 @@
+"""
+Simplifies plans before they are executed.
+
+The planner produces plans that are meant to be displayed and reasoned about.
+They e.g. contain parameters that are resolved using their default values, so
+we can show them to the user. Before a plan is compiled for execution, it
+runs through a pipeline of passes. Each of them returns a smaller plan that
+still produces the same result. The original plan is never modified.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from inspect import (
+    CO_ASYNC_GENERATOR,
+    CO_COROUTINE,
+    CO_GENERATOR,
+    CO_VARARGS,
+    CO_VARKEYWORDS,
+)
+from typing import Any
+
+from diy._internal.plan import (
+    BuilderBasedResolutionPlan,
+    BuilderParameterResolutionPlan,
+    CallableResolutionPlan,
+    DefaultParameterResolutionPlan,
+    InferenceBasedResolutionPlan,
+    InferenceParameterResolutionPlan,
+    NoArgsConstructorParameterResolutionPlan,
+    ParameterPlanList,
+    ParameterResolutionPlan,
+    ResolutionPlan,
+)
+
+type AnyPlan = ResolutionPlan[..., Any]
+type AnyParameterPlan = ParameterResolutionPlan[..., Any]
+
+
+def _keep_root(plan: AnyPlan) -> AnyPlan:
+    return plan
+
+
+@dataclass(frozen=True)
+class Pass:
+    """
+    A single optimization. Passes are applied to each node of a plan, starting
+    at the root and continuing with the children of whatever the pass returned.
+    """
+
+    name: str
+
+    parameter: Callable[[AnyParameterPlan], AnyParameterPlan | None]
+    """
+    Returns the node that should be used instead of the given one, or `None`
+    to drop it from the plan altogether.
+    """
+
+    root: Callable[[AnyPlan], AnyPlan] = _keep_root
+    """Returns the plan that should be used instead of the given one."""
+
+
+@dataclass
+class PassReport:
+    name: str
+    """The name of the pass."""
+
+    nodes_before: int
+    """The amount of nodes in the plan before the pass ran."""
+
+    nodes_after: int
+    """The amount of nodes in the plan after the pass ran."""
+
+    @property
+    def removed(self) -> int:
+        return self.nodes_before - self.nodes_after
+
+
+def optimize(plan: AnyPlan, passes: Sequence[Pass] | None = None) -> AnyPlan:
+    """
+    Runs all passes over the plan and returns the optimized copy.
+
+    The passes are fused into a single walk over the plan, so optimizing
+    costs roughly the same as copying the plan once.
+    """
+    if passes is None:
+        passes = PASSES
+
+    for optimization in passes:
+        plan = optimization.root(plan)
+
+    def parameter(node: AnyParameterPlan) -> AnyParameterPlan | None:
+        for optimization in passes:
+            optimized = optimization.parameter(node)
+            if optimized is None:
+                return None
+            node = optimized
+        return node
+
+    return _rewrite(plan, parameter)
+
+
+def optimize_with_report(
+    plan: AnyPlan, passes: Sequence[Pass] | None = None
+) -> tuple[AnyPlan, list[PassReport]]:
+    """
+    Like :func:`optimize`, but runs each pass on its own to report how much
+    it shrank the plan.
+    """
+    if passes is None:
+        passes = PASSES
+
+    reports: list[PassReport] = []
+    for optimization in passes:
+        before = count_nodes(plan)
+        plan = optimize(plan, [optimization])
+        reports.append(PassReport(optimization.name, before, count_nodes(plan)))
+
+    return plan, reports
+
+
+def count_nodes(plan: AnyPlan) -> int:
+    """
+    The amount of nodes in the plan, including the root.
+    """
+    count = 1
+    stack = list(_children(plan))
+    while len(stack) > 0:
+        count += 1
+        stack.extend(_children(stack.pop()))
+    return count
+
+
+# =============================================================================
+# Passes
+# =============================================================================
+
+
+def _drop_default(node: AnyParameterPlan) -> AnyParameterPlan | None:
+    if isinstance(node, DefaultParameterResolutionPlan):
+        return None
+    return node
+
+
+drop_defaults = Pass("drop defaults", _drop_default)
+"""
+Parameters resolved using their default value are never passed explicitly, so
+we don't need to keep them around for execution.
+"""
+
+
+def _inline_forwarding_builder(node: AnyParameterPlan) -> AnyParameterPlan | None:
+    while isinstance(node, BuilderParameterResolutionPlan):
+        forwarded = _forwarded_argument(node.builder, node.args_plan)
+        if forwarded is None:
+            break
+        node = replace(forwarded, name=node.name)
+    return node
+
+
+def _inline_forwarding_root(plan: AnyPlan) -> AnyPlan:
+    while isinstance(plan, BuilderBasedResolutionPlan):
+        forwarded = _forwarded_argument(plan.builder, plan.args_plan)
+        if forwarded is None:
+            break
+
+        match forwarded:
+            case InferenceParameterResolutionPlan():
+                plan = InferenceBasedResolutionPlan(
+                    forwarded.type, forwarded.parameters
+                )
+            case NoArgsConstructorParameterResolutionPlan():
+                plan = InferenceBasedResolutionPlan(forwarded.type)
+            case BuilderParameterResolutionPlan():
+                plan = BuilderBasedResolutionPlan(
+                    forwarded.type, forwarded.builder, forwarded.args_plan
+                )
+            case _:
+                break
+
+    return plan
+
+
+inline_forwarding_builders = Pass(
+    "inline forwarding builders",
+    _inline_forwarding_builder,
+    _inline_forwarding_root,
+)
+"""
+Builders like
+
+```python
+@spec.add
+def build_weather_client(client: RandomWeatherClient) -> WeatherClient:
+    return client
+```
+
+only exist to tell the container which implementation to use. Instead of
+calling them, we directly use the plan of their argument.
+"""
+
+
+PASSES: Sequence[Pass] = (drop_defaults, inline_forwarding_builders)
+"""The passes that are run before executing a plan, in order."""
+
+
+# =============================================================================
+# Utilities
+# =============================================================================
+
+
+def _forward(subject: Any) -> Any:
+    return subject
+
+
+_NOT_FORWARDING = (
+    CO_VARARGS | CO_VARKEYWORDS | CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR
+)
+"""
+Flags of functions, that don't return their only parameter, even though their
+bytecode does, e.g. since they accept more arguments or run asynchronously.
+"""
+
+
+def forwarded_parameter(function: Callable[..., Any]) -> str | None:
+    """
+    Returns the name of the only parameter of the function, if the function
+    does nothing besides returning it.
+
+    Instead of matching the instructions of the function, which differ between
+    Python versions, we compare its bytecode with the one of a function that
+    is known to forward its parameter. Both were compiled by the running
+    interpreter, so they are equal exactly if the function forwards, too.
+    """
+    code = getattr(function, "__code__", None)
+    if code is None or code.co_argcount + code.co_kwonlyargcount != 1:
+        return None
+
+    if code.co_code != _forward.__code__.co_code or code.co_flags & _NOT_FORWARDING:
+        return None
+    # Parameters captured by a closure are loaded differently, so this is
+    # just to make sure.
+    if code.co_cellvars != () or code.co_freevars != ():
+        return None
+
+    return code.co_varnames[0]
+
+
+def _forwarded_argument(
+    builder: Callable[..., Any], args_plan: CallableResolutionPlan[..., Any]
+) -> AnyParameterPlan | None:
+    name = forwarded_parameter(builder)
+    if name is None:
+        return None
+
+    for parameter in args_plan.parameters:
+        if parameter.name == name:
+            if isinstance(parameter, DefaultParameterResolutionPlan):
+                return None
+            return parameter
+
+    return None
+
+
+def _children(node: AnyPlan | AnyParameterPlan) -> ParameterPlanList:
+    match node:
+        case (
+            InferenceBasedResolutionPlan()
+            | InferenceParameterResolutionPlan()
+            | CallableResolutionPlan()
+        ):
+            return node.parameters
+        case BuilderBasedResolutionPlan() | BuilderParameterResolutionPlan():
+            return node.args_plan.parameters
+        case _:
+            return []
+
+
+type _Container = (
+    InferenceBasedResolutionPlan[Any]
+    | InferenceParameterResolutionPlan[Any]
+    | CallableResolutionPlan[..., Any]
+)
+
+
+def _copy_root(plan: AnyPlan) -> tuple[AnyPlan, _Container]:
+    match plan:
+        case BuilderBasedResolutionPlan():
+            args_plan = replace(plan.args_plan, parameters=[])
+            return replace(plan, args_plan=args_plan), args_plan
+        case _:
+            copy = replace(plan, parameters=[])
+            return copy, copy
+
+
+def _copy_parameter(
+    node: AnyParameterPlan,
+) -> tuple[AnyParameterPlan, _Container | None]:
+    match node:
+        case BuilderParameterResolutionPlan():
+            args_plan = replace(node.args_plan, parameters=[])
+            return replace(node, args_plan=args_plan), args_plan
+        case InferenceParameterResolutionPlan():
+            copy = replace(node, parameters=[])
+            return copy, copy
+        case _:
+            # Nodes without children don't know where they are used, so they
+            # can be shared between the original and the copy.
+            return node, None
+
+
+def _rewrite(
+    plan: AnyPlan, rewrite: Callable[[AnyParameterPlan], AnyParameterPlan | None]
+) -> AnyPlan:
+    """
+    Copies the plan, while replacing each parameter node with whatever the
+    `rewrite` function returns for it.
+    """
+    copy, container = _copy_root(plan)
+
+    stack = [(child, container) for child in reversed(_children(plan))]
+    while len(stack) > 0:
+        original, parent = stack.pop()
+        node = rewrite(original)
+        if node is None:
+            continue
+
+        node_copy, node_container = _copy_parameter(node)
+        parent.parameters.append(node_copy)
+        if node_container is not None:
+            stack.extend((child, node_container) for child in reversed(_children(node)))
+
+    return copy
@@ -2,12 +2,21 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, Never
+
+from diy._internal.execution import Program, compile_program, run_step
+from diy.lazy import Lazy
+from diy.provider import Provider
+
+if TYPE_CHECKING:
+    from diy.errors import DiyError
 
 type ParameterPlanList = list[ParameterResolutionPlan[..., Any]]
+type PassedParameterPlanList = list[PassedParameterResolutionPlan[..., Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterResolutionPlanBase[T]:
     name: str
     """The name of the parameter."""
@@ -18,29 +27,32 @@ class ParameterResolutionPlanBase[T]:
     type: type[T]
     """The type of the parameter."""
 
-    parent: ResolutionPlan[..., Any] | ParameterResolutionPlan[..., Any]
-    """The parent plan that requested this one."""
-
 
-@dataclass
+@dataclass(slots=True)
 class DefaultParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
     """
     A parameter that is resolved simply by using the default value.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class NoArgsConstructorParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
     """
     A parameter that is resolved by simply constructing the constructor
     without any arguments.
     """
 
+    def callee(self) -> Callable[..., T]:
+        return self.type
+
+    def arguments(self) -> PassedParameterPlanList:
+        return []
+
     def execute(self) -> T:
         return self.type()
 
 
-@dataclass
+@dataclass(slots=True)
 class BuilderParameterResolutionPlan[**P, T](ParameterResolutionPlanBase[T]):
     """
     A parameter that is resolved by calling its builder.
@@ -52,12 +64,97 @@ class BuilderParameterResolutionPlan[**P, T](ParameterResolutionPlanBase[T]):
     args_plan: CallableResolutionPlan[P, T]
     """A plan for calling the function that knows how to build the type."""
 
+    def callee(self) -> Callable[P, T]:
+        return self.builder
+
+    def arguments(self) -> PassedParameterPlanList:
+        return self.args_plan.arguments()
+
     def execute(self) -> T:
         """Actually build the type"""
-        return self.args_plan.execute()
+        return run_step(self)
+
+
+@dataclass(slots=True)
+class NoneParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
+    """
+    An optional parameter, that is resolved to `None`, since we failed to
+    build the type it wraps.
+    """
+
+    def callee(self) -> Callable[[], None]:
+        return _none
+
+    def arguments(self) -> PassedParameterPlanList:
+        return []
+
+    def execute(self) -> None:
+        return None
+
+
+@dataclass(slots=True)
+class ProviderParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
+    """
+    A parameter that is resolved by injecting a :class:`Provider`, that builds
+    instances of `type` using the already planned `provided` plan.
+    """
+
+    provided: BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T]
+    """The plan that is executed every time the provider is called."""
+
+    def callee(self) -> Callable[[], Provider[T]]:
+        return partial(Provider, self.provided)
 
+    def arguments(self) -> PassedParameterPlanList:
+        return []
 
-@dataclass
+    def execute(self) -> Provider[T]:
+        return Provider(self.provided)
+
+
+@dataclass(slots=True)
+class LazyParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
+    """
+    A parameter that is resolved by injecting a :class:`Lazy` proxy, that
+    builds an instance of `type` using the already planned `provided` plan
+    once it is used for the first time.
+    """
+
+    provided: BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T]
+    """The plan that is executed when the proxy is used for the first time."""
+
+    def callee(self) -> Callable[[], Lazy[T]]:
+        return partial(Lazy, self.provided)
+
+    def arguments(self) -> PassedParameterPlanList:
+        return []
+
+    def execute(self) -> Lazy[T]:
+        return Lazy(self.provided)
+
+
+@dataclass(slots=True)
+class FailedParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
+    """
+    A parameter we failed to plan. These are only produced when planning
+    leniently, so all problems of a plan can be reported at once. Executing
+    the plan raises the error we ran into.
+    """
+
+    error: DiyError
+    """Why we failed to plan the parameter."""
+
+    def callee(self) -> Callable[[], Never]:
+        return partial(_raise, self.error)
+
+    def arguments(self) -> PassedParameterPlanList:
+        return []
+
+    def execute(self) -> Never:
+        raise self.error
+
+
+@dataclass(slots=True)
 class InferenceParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
     """
     A parameter that is resolved by recursively trying our best to resolve all
@@ -70,24 +167,14 @@ class InferenceParameterResolutionPlan[T](ParameterResolutionPlanBase[T]):
     parameter.
     """
 
-    def execute(self) -> T:
-        args = []
-        kwargs = {}
-        for plan in self.parameters:
-            match plan:
-                case DefaultParameterResolutionPlan():
-                    pass
+    def callee(self) -> Callable[..., T]:
+        return self.type
 
-                case NoArgsConstructorParameterResolutionPlan():
-                    kwargs[plan.name] = plan.execute()
+    def arguments(self) -> PassedParameterPlanList:
+        return _passed(self.parameters)
 
-                case BuilderParameterResolutionPlan():
-                    kwargs[plan.name] = plan.execute()
-
-                case InferenceParameterResolutionPlan():
-                    kwargs[plan.name] = plan.execute()
-
-        return self.type(*args, **kwargs)
+    def execute(self) -> T:
+        return run_step(self)
 
 
 type ParameterResolutionPlan[**P, T] = (
@@ -95,13 +182,28 @@ type ParameterResolutionPlan[**P, T] = (
     | InferenceParameterResolutionPlan[T]
     | DefaultParameterResolutionPlan[T]
     | NoArgsConstructorParameterResolutionPlan[T]
+    | ProviderParameterResolutionPlan[T]
+    | LazyParameterResolutionPlan[T]
+    | NoneParameterResolutionPlan[T]
+    | FailedParameterResolutionPlan[T]
+)
+
+type PassedParameterResolutionPlan[**P, T] = (
+    BuilderParameterResolutionPlan[P, T]
+    | InferenceParameterResolutionPlan[T]
+    | NoArgsConstructorParameterResolutionPlan[T]
+    | ProviderParameterResolutionPlan[T]
+    | LazyParameterResolutionPlan[T]
+    | NoneParameterResolutionPlan[T]
+    | FailedParameterResolutionPlan[T]
 )
+"""Parameters that are explicitly passed when calling a function."""
 
 
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class InferenceBasedResolutionPlan[T]:
     """
     Keeps track of which types depend on what other types to be instantiaded
@@ -139,16 +241,29 @@ class InferenceBasedResolutionPlan[T]:
     parameter.
     """
 
+    program: Program | None = field(default=None, init=False, repr=False, compare=False)
+    """The compiled form of this plan, see :meth:`execute`."""
+
+    def callee(self) -> Callable[..., T]:
+        return self.type
+
+    def arguments(self) -> PassedParameterPlanList:
+        return _passed(self.parameters)
+
     def execute(self) -> T:
         """
         Try to run the plan and return the expected result. This is either what
         the function returns, or an instance of the requested type.
         """
-        args, kwargs = resolve_parameter_plans(self.parameters)
-        return self.type(*args, **kwargs)
+        if self.program is None:
+            self.program = _compile(self)
+        return self.program.run()[0]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _reduce(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class BuilderBasedResolutionPlan[**P, T]:
     type: type[T]
     """
@@ -162,11 +277,25 @@ class BuilderBasedResolutionPlan[**P, T]:
 
     args_plan: CallableResolutionPlan[P, T]
 
+    program: Program | None = field(default=None, init=False, repr=False, compare=False)
+    """The compiled form of this plan, see :meth:`execute`."""
+
+    def callee(self) -> Callable[P, T]:
+        return self.builder
+
+    def arguments(self) -> PassedParameterPlanList:
+        return self.args_plan.arguments()
+
     def execute(self) -> T:
-        return self.args_plan.execute()
+        if self.program is None:
+            self.program = _compile(self)
+        return self.program.run()[0]
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _reduce(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class CallableResolutionPlan[**P, T]:
     subject: Callable[P, T]
     """
@@ -176,9 +305,19 @@ class CallableResolutionPlan[**P, T]:
 
     parameters: ParameterPlanList = field(default_factory=list)
 
+    program: Program | None = field(default=None, init=False, repr=False, compare=False)
+    """The compiled form of this plan, see :meth:`execute`."""
+
+    def callee(self) -> Callable[P, T]:
+        return self.subject
+
+    def arguments(self) -> PassedParameterPlanList:
+        return _passed(self.parameters)
+
     def execute(self) -> T:
-        args, kwargs = resolve_parameter_plans(self.parameters)
-        return self.subject(*args, **kwargs)  # type: ignore
+        if self.program is None:
+            self.program = _compile(self)
+        return self.program.run()[0]
 
 
 type ResolutionPlan[**P, T] = (
@@ -188,20 +327,62 @@ type ResolutionPlan[**P, T] = (
 )
 
 
-def resolve_parameter_plans[T](
-    parameters: ParameterPlanList,
-) -> tuple[list[Any], dict[str, Any]]:
-    args = []
-    kwargs = {}
-    for plan in parameters:
-        match plan:
-            case DefaultParameterResolutionPlan():
-                pass
-            case NoArgsConstructorParameterResolutionPlan():
-                kwargs[plan.name] = plan.execute()
-            case BuilderParameterResolutionPlan():
-                kwargs[plan.name] = plan.execute()
-            case InferenceParameterResolutionPlan():
-                kwargs[plan.name] = plan.execute()
-
-    return args, kwargs
+def _passed(parameters: ParameterPlanList) -> PassedParameterPlanList:
+    """
+    Parameters that are explicitly passed. Those that are resolved using their
+    default value are simply omitted.
+    """
+    return [
+        parameter
+        for parameter in parameters
+        if not isinstance(parameter, DefaultParameterResolutionPlan)
+    ]
+
+
+def _compile(plan: ResolutionPlan[..., Any]) -> Program:
+    # The optimizer works on the plans defined in this module, so we can only
+    # import it once they are defined.
+    from diy._internal.optimizer import optimize
+
+    return compile_program([optimize(plan)])
+
+
+def _reduce(
+    plan: InferenceBasedResolutionPlan[Any] | BuilderBasedResolutionPlan[..., Any],
+) -> tuple[Any, ...]:
+    """
+    Pickles the plan by the qualified names of the types and builders it
+    references, the way a :class:`PlanStore` stores it. The compiled program
+    is left out. Plans referencing something that can't be looked up by its
+    name are pickled as they are.
+    """
+    from diy._internal.store import encode_plans
+
+    names, entries = encode_plans({plan.type: plan})
+    if len(entries) == 0:
+        return (_new, (type(plan),), plan.__getstate__())
+    return (_unpickle, (names, entries))
+
+
+def _new[T](cls: type[T]) -> T:
+    return cls.__new__(cls)
+
+
+def _unpickle(
+    names: list[Any], entries: list[tuple[int, Any]]
+) -> InferenceBasedResolutionPlan[Any] | BuilderBasedResolutionPlan[..., Any]:
+    from diy._internal.store import decode_plans
+
+    plans = decode_plans(names, entries)
+    if len(plans) == 0:
+        message = "The plan references a type or builder that does not exist anymore."
+        raise LookupError(message)
+    return next(iter(plans.values()))
+
+
+def _none() -> None:
+    return None
+
+
+def _raise(error: Exception) -> Never:
+    raise error
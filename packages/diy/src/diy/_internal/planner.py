@@ -1,25 +1,57 @@
-from collections.abc import Callable
-from inspect import Parameter, getfullargspec, signature
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from inspect import Parameter, getfullargspec
+from sys import intern
+from threading import local
 from typing import Any
+from weakref import WeakValueDictionary
 
+from diy._internal.batch import BatchResolutionPlan
+from diy._internal.cache import DEFAULT_MAXSIZE, PlanCache
+from diy._internal.introspection import constructor_signature
 from diy._internal.plan import (
     BuilderBasedResolutionPlan,
     BuilderParameterResolutionPlan,
     CallableResolutionPlan,
     DefaultParameterResolutionPlan,
+    FailedParameterResolutionPlan,
     InferenceBasedResolutionPlan,
     InferenceParameterResolutionPlan,
+    LazyParameterResolutionPlan,
     NoArgsConstructorParameterResolutionPlan,
+    NoneParameterResolutionPlan,
+    ParameterResolutionPlan,
+    ProviderParameterResolutionPlan,
+)
+from diy._internal.signatures import LazySignature, return_annotation
+from diy._internal.validation import (
+    assert_is_typelike,
+    is_typelike,
+    lazy_type,
+    optional_type,
+    provided_type,
 )
-from diy._internal.validation import assert_is_typelike, is_typelike
 from diy.errors import (
+    CircularDependencyError,
+    DiyError,
     FailedToInferDependencyError,
     MissingConstructorKeywordTypeAnnotationError,
     UninstanciableTypeError,
     UnsupportedParameterTypeError,
 )
+from diy.specification.frozen import FrozenSpecification
 from diy.specification.protocol import SpecificationProtocol
 
+type Planning[R] = Generator[Planning[Any], Any, R]
+"""
+Planning a type means planning its dependencies first, which in turn means
+planning their dependencies, and so on. Instead of calling each other
+recursively, the methods of the :class:`Planner` yield the planning of a
+dependency and receive its result back. :func:`run_planning` takes care of
+driving them using an explicit stack, so deep dependency chains do not hit the
+recursion limit.
+"""
+
 
 class Planner:
     """
@@ -27,9 +59,51 @@ class Planner:
     The plan is based upon the spec provided to the builder upon instantiation.
     """
 
-    def __init__(self, spec: SpecificationProtocol) -> None:
+    cache: PlanCache
+    """
+    The plans of types we already planned, as well as a :class:`_Failure` for
+    those we failed to plan. The latter acts as a negative cache, so we don't
+    have to re-plan them over and over again, e.g. when probing for optional
+    dependencies.
+    """
+
+    _signatures: PlanCache
+    """
+    The signatures of the constructors and functions we planned, with the
+    annotations they needed evaluated.
+    Unlike plans, these don't depend on the spec.
+    """
+
+    _cache_revision: int
+    """The revision of the spec, for which the `cache` is valid."""
+
+    lenient: bool
+    """
+    Whether to mark parameters we fail to plan as failed, instead of raising,
+    see :class:`FailedParameterResolutionPlan`. Errors of the planned type
+    itself are still raised.
+    """
+
+    _local: local
+    """
+    Holds the types that are currently being planned, along with the name of
+    the parameter that requested them, see :meth:`_visiting`. Planners can be
+    shared between threads, so each thread gets its own.
+    """
+
+    def __init__(
+        self,
+        spec: SpecificationProtocol,
+        cache_size: int | None = DEFAULT_MAXSIZE,
+        lenient: bool = False,
+    ) -> None:
         super().__init__()
         self.spec = spec
+        self.lenient = lenient
+        self.cache = PlanCache(cache_size)
+        self._signatures = PlanCache(cache_size)
+        self._cache_revision = spec.revision
+        self._local = local()
 
     def plan[**P, T](
         self, subject: type[T]
@@ -37,19 +111,89 @@ class Planner:
         """
         Plans the resolution of an instance of the type.
         """
-        assert_is_instantiable(subject)
+        self._forget_outdated_plans()
+        cached = self.cache.get(subject)
+        if isinstance(cached, _Failure):
+            raise cached.error()
+        if cached is not None:
+            return cached
 
-        # maybe we already know how to build this
-        builder = self.spec.get(subject)
-        if builder is not None:
-            args_plan = self.plan_call(builder)
-            return BuilderBasedResolutionPlan(subject, builder, args_plan)
+        try:
+            plan = run_planning(self._plan(subject))
+        except DiyError as error:
+            self.cache.set(subject, _Failure(error))
+            raise
 
-        # if not, try to resolve it based on the knowledge we have
-        plan = InferenceBasedResolutionPlan(subject)
-        self._fill_plan_based_on_inference(subject.__init__, plan, plan)
+        self.cache.set(subject, plan)
         return plan
 
+    def preload(
+        self,
+        plans: Mapping[
+            type[Any],
+            BuilderBasedResolutionPlan[..., Any] | InferenceBasedResolutionPlan[Any],
+        ],
+    ) -> None:
+        """
+        Uses the given plans instead of planning the types again, e.g. plans
+        that were loaded from a :class:`PlanStore`. They need to be valid for
+        the current state of the spec.
+        """
+        self._forget_outdated_plans()
+        for subject, plan in plans.items():
+            self.cache.set(subject, plan)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Caches and thread locals can't be pickled. Instead, the plans are
+        # encoded by the names of what they reference, and the planner that
+        # unpickles them starts out with them already in its cache.
+        from diy._internal.store import encode_plans
+
+        self._forget_outdated_plans()
+        plans = {
+            subject: plan
+            for subject, plan in self.cache.items()
+            if isinstance(
+                plan, BuilderBasedResolutionPlan | InferenceBasedResolutionPlan
+            )
+        }
+        return {
+            "spec": self.spec,
+            "cache_size": self.cache.maxsize,
+            "lenient": self.lenient,
+            "plans": encode_plans(plans),
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        from diy._internal.store import decode_plans
+
+        Planner.__init__(self, state["spec"], state["cache_size"], state["lenient"])
+        self.preload(decode_plans(*state["plans"]))
+
+    def _plan[**P, T](
+        self, subject: type[T], name: str | None = None
+    ) -> Planning[BuilderBasedResolutionPlan[P, T] | InferenceBasedResolutionPlan[T]]:
+        assert_is_instantiable(subject)
+
+        with self._visiting(name, subject):
+            # maybe we already know how to build this
+            builder = self.spec.get(subject)
+            if builder is not None:
+                args_plan = yield self._plan_call(builder)
+                return BuilderBasedResolutionPlan(subject, builder, args_plan)
+
+            # if not, try to resolve it based on the knowledge we have
+            plan = InferenceBasedResolutionPlan(subject)
+            yield self._fill_plan_based_on_inference(subject, plan, plan)
+            return plan
+
+    def plan_many(self, subjects: Iterable[type[Any]]) -> BatchResolutionPlan:
+        """
+        Plans the resolution of multiple types at once. Dependencies shared
+        between them are only built once when executing the resulting plan.
+        """
+        return BatchResolutionPlan([self.plan(subject) for subject in subjects])
+
     def _fill_plan_based_on_inference[**P, T](
         self,
         subject: Callable[..., Any],
@@ -57,109 +201,183 @@ class Planner:
         | InferenceBasedResolutionPlan[T]
         | CallableResolutionPlan[P, T],
         root: InferenceBasedResolutionPlan[Any] | CallableResolutionPlan[P, T],
-    ) -> None:
+    ) -> Planning[None]:
         depth = -1
         if isinstance(parent, InferenceParameterResolutionPlan):
             depth = parent.depth
 
         try:
-            sig = signature(subject, eval_str=True)
+            sig = self._signature(subject)
         except ValueError as exception:
             assert isinstance(parent, InferenceParameterResolutionPlan)
             raise FailedToInferDependencyError(parent, root) from exception  # type: ignore[reportArgumentType]
 
-        for name, parameter in sig.parameters.items():
-            # TODO: This can definitely be done better
-            if name == "self" or name[0:1] == "*" or name[0:2] == "**":
-                continue
-
-            if parameter.kind in [Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD]:
-                # TODO: Maybe introduce a way of supplying these?
-                #       We skip them for now, since the empty constructor
-                #       has these at the end.
-                continue
-
-            if parameter.kind not in [
-                Parameter.KEYWORD_ONLY,
-                Parameter.POSITIONAL_OR_KEYWORD,
-            ]:
-                # HINT: Take a look at Signature.apply_defaults for supporting
-                #       positional argument defaults
-                # TODO: Support other cases
-                raise UnsupportedParameterTypeError
-
-            # If a specific type requests a parameter, we can ask if we have a
-            # partial builder for it. Since this is the most specific
-            # instruction, we check it first.
-            #
-            # TODO: Maybe we can support this also for functions?
-            #       E.g. when function XY needs param Z, then supply it via the
-            #       partial builder. Maybe we could also **only** deal with
-            #       functions, since abstract.__init__ is also just a function.
-            if isinstance(
-                parent, InferenceParameterResolutionPlan | InferenceBasedResolutionPlan
-            ):
-                plan = self._try_builder_based_resolution(parent, name, depth)
-                if plan is not None:
-                    parent.parameters.append(plan)
-                    continue
-
-            # If the parameter has a default, it is preferrable
-            if parameter.default is not Parameter.empty:
-                parent.parameters.append(
-                    DefaultParameterResolutionPlan(
-                        name=name,
-                        depth=depth + 1,
-                        type=type(parameter.default),
-                        parent=parent,  # type: ignore[reportArgumentType]
-                    )
+        for parameter_name, parameter in sig.parameters.items():
+            # Large specifications repeat the same few parameter names in
+            # thousands of nodes, so we make them share a single string.
+            name = intern(parameter_name)
+
+            try:
+                plan = yield from self._plan_parameter(
+                    name, parameter, sig, depth, parent, root
+                )
+            except DiyError as error:
+                if not self.lenient:
+                    raise
+                # Instead of bailing on the first problem, we mark the
+                # parameter as failed and carry on, so all of them can be
+                # reported at once.
+                plan = FailedParameterResolutionPlan(
+                    name=name,
+                    depth=depth + 1,
+                    type=_annotated_type(sig, name),
+                    error=error,
                 )
-                continue
 
-            # From here on out, we rely on type annotations. If the type is
-            # annotated, we can run inference and look if we can build the
-            # annotated type from the spec. If not, there is hardly anything we
-            # can do.
-            abstract = parameter.annotation
-            if abstract is Parameter.empty:
-                # TODO: Maybe don't throw, but annotate the step and plan to be
-                #       not executable. Then we could report *all* X errors at
-                #       once, instead of bailling X times one after another.
-                raise MissingConstructorKeywordTypeAnnotationError(abstract, name)
+            if plan is not None:
+                parent.parameters.append(plan)
+
+        # We keep the plan as close to the spec as possible, so it can be
+        # displayed. Simplifying it for execution is done by the optimizer.
+
+    def _plan_parameter[**P, T](
+        self,
+        name: str,
+        parameter: Parameter,
+        sig: LazySignature,
+        depth: int,
+        parent: InferenceParameterResolutionPlan[T]
+        | InferenceBasedResolutionPlan[T]
+        | CallableResolutionPlan[P, T],
+        root: InferenceBasedResolutionPlan[Any] | CallableResolutionPlan[P, T],
+    ) -> Planning[ParameterResolutionPlan[..., Any] | None]:
+        """
+        Plans a single parameter of a function. Returns `None` for parameters
+        that are not passed at all.
+        """
+        # TODO: This can definitely be done better
+        if name == "self" or name[0:1] == "*" or name[0:2] == "**":
+            return None
+
+        if parameter.kind in [Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD]:
+            # TODO: Maybe introduce a way of supplying these?
+            #       We skip them for now, since the empty constructor
+            #       has these at the end.
+            return None
 
-            assert_is_typelike(abstract)
+        if parameter.kind not in [
+            Parameter.KEYWORD_ONLY,
+            Parameter.POSITIONAL_OR_KEYWORD,
+        ]:
+            # HINT: Take a look at Signature.apply_defaults for supporting
+            #       positional argument defaults
+            # TODO: Support other cases
+            raise UnsupportedParameterTypeError
+
+        # If a specific type requests a parameter, we can ask if we have a
+        # partial builder for it. Since this is the most specific
+        # instruction, we check it first.
+        #
+        # TODO: Maybe we can support this also for functions?
+        #       E.g. when function XY needs param Z, then supply it via the
+        #       partial builder. Maybe we could also **only** deal with
+        #       functions, since abstract.__init__ is also just a function.
+        if isinstance(
+            parent, InferenceParameterResolutionPlan | InferenceBasedResolutionPlan
+        ):
+            plan = yield self._try_builder_based_resolution(parent, name, depth)
+            if plan is not None:
+                return plan
+
+        # If the parameter has a default, it is preferrable
+        if parameter.default is not Parameter.empty:
+            return DefaultParameterResolutionPlan(
+                name=name,
+                depth=depth + 1,
+                type=type(parameter.default),
+            )
+
+        # From here on out, we rely on type annotations. If the type is
+        # annotated, we can run inference and look if we can build the
+        # annotated type from the spec. If not, there is hardly anything we
+        # can do. Only now we need the annotation, so only now we evaluate it.
+        abstract = sig.annotation(name)
+        if abstract is Parameter.empty:
+            raise MissingConstructorKeywordTypeAnnotationError(
+                _subject_of(parent), name
+            )
+
+        # Factories are resolved by planning the type they provide once
+        # and executing that plan every time the factory is called.
+        provided = provided_type(abstract)
+        if provided is not None:
+            return ProviderParameterResolutionPlan(
+                name=name,
+                depth=depth + 1,
+                type=provided,
+                provided=(yield self._plan(provided, name)),
+            )
+
+        # Lazy dependencies are planned right away, so missing ones are still
+        # detected early. Only executing the plan is deferred.
+        lazy = lazy_type(abstract)
+        if lazy is not None:
+            return LazyParameterResolutionPlan(
+                name=name,
+                depth=depth + 1,
+                type=lazy,
+                provided=(yield self._plan(lazy, name)),
+            )
+
+        assert_is_typelike(abstract)
+
+        # Optional dependencies are injected as None, if we fail to build
+        # them. Unless of course the user told us how to build the union.
+        optional = optional_type(abstract)
+        if optional is not None and self.spec.get(abstract) is None:
+            return (
+                yield self._plan_optional_parameter(
+                    name, abstract, optional, depth, parent, root
+                )
+            )
 
+        return (yield self._plan_typed_parameter(name, abstract, depth, parent, root))
+
+    def _plan_typed_parameter[**P, T](
+        self,
+        name: str,
+        abstract: Any,
+        depth: int,
+        parent: InferenceParameterResolutionPlan[T]
+        | InferenceBasedResolutionPlan[T]
+        | CallableResolutionPlan[P, T],
+        root: InferenceBasedResolutionPlan[Any] | CallableResolutionPlan[P, T],
+    ) -> Planning[ParameterResolutionPlan[..., Any]]:
+        with self._visiting(name, abstract):
             # If the user told us to resolve this type in a specific way, use it
             builder = self.spec.get(abstract)
             if builder is not None:
-                args_plan = self.plan_call(builder)
-                parent.parameters.append(
-                    BuilderParameterResolutionPlan(
-                        name=parameter.name,
-                        depth=depth + 1,
-                        type=abstract,
-                        parent=parent,  # type: ignore[reportArgumentType]
-                        builder=builder,
-                        args_plan=args_plan,
-                    )
+                args_plan = yield self._plan_call(builder)
+                return BuilderParameterResolutionPlan(
+                    name=name,
+                    depth=depth + 1,
+                    type=abstract,
+                    builder=builder,
+                    args_plan=args_plan,
                 )
-                continue
 
             if abstract.__module__ == "builtins":
                 raise FailedToInferDependencyError(parent, root, name)  # type: ignore
 
             # As a last fallback, we inspect the constructor of the type in
-            # question and see if we can build all parameters. This recurses
+            # question and see if we can build all parameters. This continues
             # potentially multiple levels deep.
-            #
-            # TODO: Detect loops, maybe using the plan?
             plan = InferenceParameterResolutionPlan(
                 name=name,
                 depth=depth + 1,
                 type=abstract,
-                parent=parent,  # type: ignore[reportArgumentType]
             )
-            self._fill_plan_based_on_inference(abstract.__init__, plan, root)
+            yield self._fill_plan_based_on_inference(abstract, plan, root)
 
             # Optimization: If we only use default parameters, we can just call
             # the default constructor with no arguments. Also makes the plans
@@ -168,19 +386,97 @@ class Planner:
                 isinstance(child, DefaultParameterResolutionPlan)
                 for child in plan.parameters
             ):
-                plan = NoArgsConstructorParameterResolutionPlan(
+                return NoArgsConstructorParameterResolutionPlan(
                     name=name,
                     depth=depth + 1,
                     type=abstract,
-                    parent=parent,  # type: ignore[reportArgumentType]
                 )
 
-            parent.parameters.append(plan)
+            return plan
+
+    def _plan_optional_parameter[**P, T](
+        self,
+        name: str,
+        abstract: Any,
+        optional: Any,
+        depth: int,
+        parent: InferenceParameterResolutionPlan[T]
+        | InferenceBasedResolutionPlan[T]
+        | CallableResolutionPlan[P, T],
+        root: InferenceBasedResolutionPlan[Any] | CallableResolutionPlan[P, T],
+    ) -> Planning[ParameterResolutionPlan[..., Any]]:
+        fallback = NoneParameterResolutionPlan(
+            name=name,
+            depth=depth + 1,
+            type=abstract,
+        )
 
-        # Now that we have all paramers resolve, we maybe can simplify some.
-        # TODO:
-        # for plan in parent.parameters:
-        #    pass
+        self._forget_outdated_plans()
+        if isinstance(self.cache.get(optional), _Failure):
+            return fallback
+
+        try:
+            plan = yield self._plan_typed_parameter(name, optional, depth, parent, root)
+        except CircularDependencyError:
+            # Whether we run in circles depends on what we are currently
+            # planning, so we must not remember this failure.
+            return fallback
+        except DiyError as error:
+            self.cache.set(optional, _Failure(error))
+            return fallback
+
+        # When planning leniently, failures don't raise, but we still can't
+        # build the type. The failure might be a circular dependency, so we
+        # don't remember it either.
+        if self.lenient and _has_failures(plan):
+            return fallback
+
+        return plan
+
+    @contextmanager
+    def _visiting(self, name: str | None, abstract: Any) -> Iterator[None]:
+        """
+        Marks the type as being planned, until the block is left. Planning a
+        type that is already being planned means we run in circles.
+
+        Each check is a single dictionary lookup, so detecting cycles is
+        linear in the size of the plan.
+        """
+        path: dict[Any, str | None] = self._local.__dict__.setdefault("path", {})
+        if abstract in path:
+            visited = list(path.items())
+            start = next(i for i, (other, _) in enumerate(visited) if other == abstract)
+            cycle = [(other_name, other) for other, other_name in visited[start:]]
+            raise CircularDependencyError([[*cycle, (name, abstract)]])
+
+        path[abstract] = name
+        try:
+            yield
+        finally:
+            del path[abstract]
+
+    def _signature(self, subject: Callable[..., Any]) -> LazySignature:
+        sig = self._signatures.get(subject)
+        if sig is None:
+            if isinstance(subject, type):
+                sig = constructor_signature(subject)
+                if sig is None:
+                    # Many classes share the constructor they inherit, e.g.
+                    # the one of `object`, so we reflect it only once.
+                    return self._signature(subject.__init__)
+            else:
+                sig = LazySignature(subject)
+            self._signatures.set(subject, sig)
+        return sig
+
+    def _forget_outdated_plans(self) -> None:
+        """
+        Plans and failures are only valid as long as the spec did not change,
+        since e.g. a builder for a type could have been added since then.
+        """
+        if self._cache_revision != self.spec.revision:
+            self.cache.clear()
+            self._cache_revision = self.spec.revision
 
     def _try_builder_based_resolution(
         self,
@@ -188,7 +484,7 @@ class Planner:
         | InferenceBasedResolutionPlan[Any],
         name: str,
         depth: int,
-    ) -> BuilderParameterResolutionPlan[Any, Any] | None:
+    ) -> Planning[BuilderParameterResolutionPlan[Any, Any] | None]:
         parent_type = parent.type
         if not is_typelike(parent_type):
             return None
@@ -197,15 +493,14 @@ class Planner:
         if partial_builder is None:
             return None
 
-        return_type = signature(partial_builder).return_annotation
+        return_type = return_annotation(partial_builder)
         assert return_type is not Parameter.empty
 
-        args_plan = self.plan_call(partial_builder)
+        args_plan = yield self._plan_call(partial_builder)
         return BuilderParameterResolutionPlan(
             name,
             depth + 1,
             type=return_type,
-            parent=parent,
             builder=partial_builder,
             args_plan=args_plan,
         )
@@ -224,16 +519,169 @@ class Planner:
     def plan_call[**P, R](
         self, subject: Callable[P, R]
     ) -> CallableResolutionPlan[P, R]:
+        """
+        Plans how to call the given function.
+        """
+        return run_planning(self._plan_call(subject))
+
+    def _plan_call[**P, R](
+        self, subject: Callable[P, R]
+    ) -> Planning[CallableResolutionPlan[P, R]]:
         plan = CallableResolutionPlan(subject)
-        self._fill_plan_based_on_inference(subject, plan, plan)
+        yield self._fill_plan_based_on_inference(subject, plan, plan)
         return plan
 
 
+def run_planning[R](planning: Planning[R]) -> R:
+    """
+    Drives the given planning, and all plannings it depends on, to completion.
+
+    Each planning that is yielded is pushed onto a stack and run until it
+    returns. Its result (or the exception it raised) is then sent back into
+    the planning that requested it.
+    """
+    stack: list[Planning[Any]] = [planning]
+    result: Any = None
+    error: Exception | None = None
+
+    while True:
+        current = stack[-1]
+        try:
+            requested = current.send(result) if error is None else current.throw(error)
+        except StopIteration as stop:
+            stack.pop()
+            if len(stack) == 0:
+                return stop.value
+            result, error = stop.value, None
+            continue
+        # Not blind, the exception is either re-raised or sent to the planning
+        # that requested the failed one.
+        except Exception as exception:  # noqa: BLE001
+            stack.pop()
+            if len(stack) == 0:
+                raise
+            result, error = None, exception
+            continue
+
+        stack.append(requested)
+        result, error = None, None
+
+
 def assert_is_instantiable(abstract: type[Any]) -> None:
-    # TODO: Maybe we can also use `signature` here
-    spec = getfullargspec(abstract.__init__)
-    if len(spec.args) <= 0:
-        raise UninstanciableTypeError(abstract)
+    # Classes without a constructor of their own are common, and reflecting
+    # the builtin one is surprisingly expensive.
+    init = abstract.__init__
+    if init is object.__init__:
+        return
+
+    # Reading the code of plain functions, like the constructors dataclasses
+    # generate, is a lot cheaper still.
+    code = getattr(init, "__code__", None)
+    if code is not None and not hasattr(init, "__signature__"):
+        args = code.co_varnames[: code.co_argcount]
+    else:
+        # TODO: Maybe we can also use `signature` here
+        args = getfullargspec(init).args
 
-    if spec.args[0] != "self":
+    if len(args) <= 0 or args[0] != "self":
         raise UninstanciableTypeError(abstract)
+
+
+class _Failure:
+    """
+    Marks a type we failed to plan in the cache of a planner.
+
+    Callers own the errors they catch, and might add notes to them or chain
+    them to others, possibly on another thread. So we keep a copy of the error
+    as it was raised, and raise a fresh copy of it each time.
+    """
+
+    __slots__ = ("_error",)
+
+    def __init__(self, error: DiyError) -> None:
+        super().__init__()
+        self._error = _copy_error(error)
+
+    def error(self) -> DiyError:
+        return _copy_error(self._error)
+
+
+def _copy_error(error: DiyError) -> DiyError:
+    # Errors take other arguments than the ones they pass on to `Exception`,
+    # so we can't construct them again. Instead, we copy their state.
+    copy = type(error).__new__(type(error), *error.args)
+    copy.__dict__.update(vars(error))
+    if error._notes is not None:  # noqa: SLF001
+        copy.__notes__ = list(error._notes)  # noqa: SLF001
+    copy.__cause__ = error.__cause__
+    copy.__suppress_context__ = error.__suppress_context__
+    return copy
+
+
+def _subject_of(
+    plan: InferenceParameterResolutionPlan[Any]
+    | InferenceBasedResolutionPlan[Any]
+    | CallableResolutionPlan[..., Any],
+) -> type[Any] | Callable[..., Any]:
+    if isinstance(plan, CallableResolutionPlan):
+        return plan.subject
+    return plan.type
+
+
+def _annotated_type(sig: LazySignature, name: str) -> Any:
+    try:
+        annotation = sig.annotation(name)
+    except NameError:
+        return None
+    if annotation is Parameter.empty:
+        return None
+    return annotation
+
+
+def _has_failures(plan: ParameterResolutionPlan[..., Any]) -> bool:
+    stack: list[Any] = [plan]
+    while len(stack) > 0:
+        node = stack.pop()
+        match node:
+            case FailedParameterResolutionPlan():
+                return True
+            case (
+                InferenceParameterResolutionPlan()
+                | InferenceBasedResolutionPlan()
+                | CallableResolutionPlan()
+            ):
+                stack.extend(node.parameters)
+            case BuilderParameterResolutionPlan() | BuilderBasedResolutionPlan():
+                stack.extend(node.args_plan.parameters)
+            case ProviderParameterResolutionPlan() | LazyParameterResolutionPlan():
+                stack.append(node.provided)
+            case _:
+                pass
+    return False
+
+
+_shared_planners: WeakValueDictionary[str, Planner] = WeakValueDictionary()
+"""Planners of frozen specs, by the fingerprint of the spec."""
+
+
+def shared_planner(
+    spec: SpecificationProtocol, cache_size: int | None = DEFAULT_MAXSIZE
+) -> Planner:
+    """
+    Returns a planner for the given spec.
+
+    Containers using equal frozen specs share a single planner, so each type
+    is only planned once for all of them. The `cache_size` of the container
+    that created the shared planner wins. Containers don't need to lock
+    anything for this, since the worst thing that can happen is that two
+    threads plan the same type at the same time, and one of the equal plans
+    wins.
+    """
+    if not isinstance(spec, FrozenSpecification):
+        return Planner(spec, cache_size)
+
+    planner = _shared_planners.get(spec.fingerprint)
+    if planner is None or planner.spec != spec:
+        planner = Planner(spec, cache_size)
+        _shared_planners[spec.fingerprint] = planner
+    return planner
@@ -0,0 +1,284 @@
+"""
+Finds the builders and types marked using :mod:`diy.markers` in a package,
+without importing it.
+
+Each module of the package is parsed, and the return annotations of marked
+builders are resolved to import specifiers using the imports of the module.
+The specification can then register them lazily, so only the modules that
+are actually needed are ever imported.
+
+Similar to `.pyc` files, the results are kept in an index in the
+`__pycache__` directory of the package, stamped with the modification time
+and size of each file. Later scans only parse the files that changed since.
+Annotations we can't resolve statically, e.g. ones using a type alias, are
+resolved by importing the module instead. Their results are kept in the index
+as well. Builders need to return a class though, since they are registered by
+its specifier. Builders of e.g. `list[int]` or `Thing | None` can't be
+scanned, and have to be registered explicitly instead.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import marshal
+import sys
+from dataclasses import dataclass, field
+from importlib import import_module
+from importlib.util import find_spec
+from inspect import isfunction
+from pathlib import Path
+
+from diy._internal.imports import specifier_of
+from diy._internal.validation import assert_annotates_return_type
+from diy.errors import PackageNotFoundError, UnscannableBuilderError
+from diy.markers import BUILDER_MARKER
+
+_VERSION = 1
+"""Bumped whenever the format of the index changes, so old ones are ignored."""
+
+_BUILDER = "diy.markers.builder"
+
+_COMPONENT = "diy.markers.component"
+
+type Builders = tuple[tuple[str, str], ...]
+"""The specifiers of the abstract types and of the builders for them."""
+
+type Entry = tuple[int, int, Builders, tuple[str, ...]]
+"""
+The modification time and size of a file, and the builders and components
+found in it.
+"""
+
+
+@dataclass
+class ScanResult:
+    builders: list[tuple[str, str]] = field(default_factory=list)
+    """The specifiers of the abstract types and of the builders for them."""
+
+    components: list[str] = field(default_factory=list)
+    """The specifiers of the marked types."""
+
+    parsed: int = 0
+    """How many files were parsed, since they were not in the index."""
+
+
+def scan_package(package: str, index: str | Path | None = None) -> ScanResult:
+    """
+    Finds all marked builders and types in the modules of the package. Pass
+    `index` to keep the index somewhere else than in the package.
+    """
+    spec = find_spec(package)
+    if spec is None or spec.submodule_search_locations is None:
+        raise PackageNotFoundError(package)
+
+    roots = [Path(location) for location in spec.submodule_search_locations]
+    writable = True
+    if index is None:
+        index = roots[0] / "__pycache__" / f"diy-scan.{package}.marshal"
+        # Like for `.pyc` files, respect `PYTHONDONTWRITEBYTECODE`.
+        writable = not sys.dont_write_bytecode
+    index = Path(index)
+
+    previous = _load_index(index)
+    entries: dict[str, Entry] = {}
+    result = ScanResult()
+    for module, path in _modules(package, roots):
+        stat = path.stat()
+        entry = previous.get(str(path))
+        if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+            builders, components = _analyze(path, module)
+            entry = (stat.st_mtime_ns, stat.st_size, builders, components)
+            result.parsed += 1
+
+        entries[str(path)] = entry
+        result.builders.extend(entry[2])
+        result.components.extend(entry[3])
+
+    if writable and entries != previous:
+        _write_index(index, entries)
+
+    return result
+
+
+def _modules(package: str, roots: list[Path]) -> list[tuple[str, Path]]:
+    """All modules of the package and its sub-packages, along with their path."""
+    modules: list[tuple[str, Path]] = []
+    for root in roots:
+        for path in sorted(root.rglob("*.py")):
+            parts = path.relative_to(root).with_suffix("").parts
+            if "__pycache__" in parts:
+                continue
+            # Directories without an `__init__.py` are not part of the package.
+            directories = [root.joinpath(*parts[:end]) for end in range(1, len(parts))]
+            if not all(
+                (directory / "__init__.py").exists() for directory in directories
+            ):
+                continue
+
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            modules.append((".".join([package, *parts]), path))
+    return modules
+
+
+def _load_index(path: Path) -> dict[str, Entry]:
+    try:
+        # Like `.pyc` files, the index is only ever written by us.
+        version, entries = marshal.loads(path.read_bytes())  # noqa: S302
+    except (OSError, ValueError, EOFError, TypeError):
+        return {}
+    if version != _VERSION:
+        return {}
+    return entries
+
+
+def _write_index(path: Path, entries: dict[str, Entry]) -> None:
+    # Failing to write the index only makes the next scan slower, e.g. when
+    # the package is installed in a read-only location.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_bytes(marshal.dumps((_VERSION, entries)))
+        temporary.replace(path)
+    except OSError:
+        pass
+
+
+# =============================================================================
+# Analysis
+# =============================================================================
+
+
+def _analyze(path: Path, module: str) -> tuple[Builders, tuple[str, ...]]:
+    tree = ast.parse(path.read_bytes(), str(path))
+    names = Names.collect(module, path.name == "__init__.py", tree)
+
+    builders: list[tuple[str, str]] = []
+    components: list[str] = []
+    unresolved = False
+    for node in tree.body:
+        decorators = {names.qualify(decorator) for decorator in _decorators(node)}
+        match node:
+            case ast.FunctionDef() | ast.AsyncFunctionDef() if _BUILDER in decorators:
+                abstract = names.specifier(node.returns)
+                if abstract is None:
+                    unresolved = True
+                    continue
+                builders.append((abstract, f"{module}:{node.name}"))
+            case ast.ClassDef() if _COMPONENT in decorators:
+                components.append(f"{module}:{node.name}")
+            case _:
+                pass
+
+    if unresolved:
+        builders = _import_builders(module)
+
+    return tuple(builders), tuple(components)
+
+
+def _decorators(node: ast.stmt) -> list[ast.expr]:
+    if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+        return node.decorator_list
+    return []
+
+
+def _import_builders(module: str) -> list[tuple[str, str]]:
+    """
+    Finds the marked builders by importing the module, and works out the
+    types they build the same way :meth:`Builders.decorate` does.
+    """
+    builders: list[tuple[str, str]] = []
+    for value in vars(import_module(module)).values():
+        if not isfunction(value) or value.__module__ != module:
+            continue
+        if getattr(value, BUILDER_MARKER, False):
+            abstract = assert_annotates_return_type(value)
+            if not isinstance(abstract, type):
+                raise UnscannableBuilderError(value, abstract)
+            builders.append((specifier_of(abstract), specifier_of(value)))
+    return builders
+
+
+class Names:
+    """
+    Resolves names used in a module to where they were defined, based on its
+    imports and top level definitions.
+    """
+
+    module: str
+
+    names: dict[str, str]
+    """The dotted path to what each name refers to."""
+
+    def __init__(self, module: str, names: dict[str, str]) -> None:
+        super().__init__()
+        self.module = module
+        self.names = names
+
+    @staticmethod
+    def collect(module: str, is_package: bool, tree: ast.Module) -> Names:
+        """Collects the names the top level statements of the module define."""
+        package = module if is_package else module.rpartition(".")[0]
+        names: dict[str, str] = {}
+        for node in tree.body:
+            match node:
+                case ast.Import():
+                    for alias in node.names:
+                        if alias.asname is None:
+                            # `import a.b` binds `a`
+                            first = alias.name.partition(".")[0]
+                            names[first] = first
+                        else:
+                            names[alias.asname] = alias.name
+                case ast.ImportFrom():
+                    source = _absolute(package, node.module or "", node.level)
+                    for alias in node.names:
+                        names[alias.asname or alias.name] = f"{source}.{alias.name}"
+                case ast.ClassDef() | ast.FunctionDef() | ast.AsyncFunctionDef():
+                    names[node.name] = f"{module}.{node.name}"
+                case _:
+                    pass
+        return Names(module, names)
+
+    def qualify(self, expression: ast.expr | None) -> str | None:
+        """The dotted path to what the expression refers to."""
+        match expression:
+            case ast.Name(id=name):
+                if name not in self.names and hasattr(builtins, name):
+                    return f"builtins.{name}"
+                return self.names.get(name)
+            case ast.Attribute(value=value, attr=attribute):
+                base = self.qualify(value)
+                return None if base is None else f"{base}.{attribute}"
+            case ast.Constant(value=str(source)):
+                try:
+                    parsed = ast.parse(source, mode="eval")
+                except SyntaxError:
+                    return None
+                return self.qualify(parsed.body)
+            case _:
+                return None
+
+    def specifier(self, expression: ast.expr | None) -> str | None:
+        """
+        The import specifier for what the expression refers to. It uses the
+        module the name was imported from, which might only re-export it.
+        Specifications match those with the type once it is planned.
+        """
+        qualified = self.qualify(expression)
+        if qualified is None:
+            return None
+        # We can't tell modules and classes apart without importing them, so
+        # we assume the last part is the symbol and the rest the module.
+        module, _, symbol = qualified.rpartition(".")
+        return f"{module}:{symbol}"
+
+
+def _absolute(package: str, module: str, level: int) -> str:
+    """The absolute name of a module imported relative to the package."""
+    if level == 0:
+        return module
+    for _ in range(level - 1):
+        package = package.rpartition(".")[0]
+    return f"{package}.{module}" if module else package
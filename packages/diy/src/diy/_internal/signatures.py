@@ -0,0 +1,159 @@
+"""
+Reads the signatures of constructors and functions, without evaluating all of
+their annotations right away.
+
+`inspect.signature(..., eval_str=True)` evaluates the annotations of all
+parameters at once. Planning usually needs only some of them, since
+parameters with a default or a partial builder are never looked up. Names
+that are only imported when `TYPE_CHECKING` can't be evaluated at all, and
+would fail the whole signature.
+
+Instead, the annotations of a :class:`LazySignature` are evaluated one at a
+time, once the planner needs them. Since Python 3.14, the interpreter defers
+evaluating annotations itself (PEP 649 and 749), and :mod:`annotationlib`
+keeps the ones that can't be evaluated yet as forward references. Before
+that, annotations are either evaluated already, or strings when using
+`from __future__ import annotations`. Both are evaluated like `eval_str`
+would.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import partial
+from inspect import Parameter, Signature, signature
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+if sys.version_info >= (3, 14):
+    from annotationlib import Format, ForwardRef, get_annotations
+
+    def raw_signature(subject: Callable[..., Any]) -> Signature:
+        """
+        The signature of the subject, with annotations that can't be evaluated
+        yet left as forward references.
+        """
+        return signature(subject, annotation_format=Format.FORWARDREF)
+
+    def class_annotations(subject: type[Any]) -> dict[str, Any]:
+        """
+        The annotations of the class itself, with the ones that can't be
+        evaluated yet left as forward references.
+        """
+        return get_annotations(subject, format=Format.FORWARDREF)
+
+    def _evaluate_forward_ref(annotation: Any) -> Any:
+        if isinstance(annotation, ForwardRef):
+            return annotation.evaluate()
+        return annotation
+
+else:
+
+    def raw_signature(subject: Callable[..., Any]) -> Signature:
+        """
+        The signature of the subject, with annotations that were stringified
+        by `from __future__ import annotations` left as strings.
+        """
+        return signature(subject)
+
+    def class_annotations(subject: type[Any]) -> dict[str, Any]:
+        """
+        The annotations of the class itself, with the ones that were
+        stringified by `from __future__ import annotations` left as strings.
+        """
+        return dict(vars(subject).get("__annotations__", {}))
+
+    def _evaluate_forward_ref(annotation: Any) -> Any:
+        return annotation
+
+
+class LazySignature:
+    """
+    The parameters of a function, whose annotations are evaluated once they
+    are needed, and only once. Classes can pass the parameters of their
+    constructor explicitly, see :mod:`diy._internal.introspection`.
+    """
+
+    __slots__ = ("_annotations", "parameters", "subject")
+
+    subject: Callable[..., Any]
+    """The function the parameters belong to."""
+
+    parameters: Mapping[str, Parameter]
+    """The parameters, with their annotations not evaluated yet."""
+
+    _annotations: dict[str, Any]
+    """The annotations that were evaluated already, by parameter name."""
+
+    def __init__(
+        self,
+        subject: Callable[..., Any],
+        parameters: Iterable[Parameter] | None = None,
+    ) -> None:
+        super().__init__()
+        self.subject = subject
+        if parameters is None:
+            self.parameters = raw_signature(subject).parameters
+        else:
+            self.parameters = {parameter.name: parameter for parameter in parameters}
+        self._annotations = {}
+
+    def annotation(self, name: str) -> Any:
+        """
+        The evaluated annotation of the parameter, or `Parameter.empty` if it
+        is not annotated.
+        """
+        annotation = self._annotations.get(name, _UNEVALUATED)
+        if annotation is _UNEVALUATED:
+            annotation = evaluate(self.parameters[name].annotation, self.subject)
+            self._annotations[name] = annotation
+        return annotation
+
+
+def return_annotation(subject: Callable[..., Any]) -> Any:
+    """
+    The evaluated return annotation of the function, or `Signature.empty` if
+    it is not annotated. The annotations of its parameters are not evaluated.
+    """
+    return evaluate(raw_signature(subject).return_annotation, subject)
+
+
+def evaluate(annotation: Any, subject: Callable[..., Any]) -> Any:
+    """
+    Evaluates an annotation of the subject, that might be a string or a
+    forward reference. Raises a `NameError`, if it refers to something that
+    does not exist.
+    """
+    if not isinstance(annotation, str):
+        return _evaluate_forward_ref(annotation)
+
+    # Like `inspect.get_annotations`, look up names where the function is
+    # defined, and make the type parameters of generic functions available.
+    function = _function(subject)
+    scope = getattr(function, "__globals__", None)
+    if scope is None:
+        # E.g. named tuples, which are constructed by a builtin.
+        module = getattr(function, "__module__", None) or subject.__module__
+        scope = vars(sys.modules[module]) if module in sys.modules else {}
+    type_params = {
+        param.__name__: param for param in getattr(function, "__type_params__", ())
+    }
+    return eval(annotation, scope, type_params)  # noqa: S307
+
+
+def _function(subject: Any) -> Any:
+    """The function whose annotations the signature of the subject shows."""
+    if isinstance(subject, type):
+        subject = subject.__init__
+    while True:
+        if isinstance(subject, partial):
+            subject = subject.func
+        elif hasattr(subject, "__wrapped__"):
+            subject = subject.__wrapped__
+        else:
+            return subject
+
+
+_UNEVALUATED: Any = object()
@@ -0,0 +1,468 @@
+"""
+Stores plans on disk, so they can be re-used by later processes.
+
+Planning is a large part of the startup of short-lived processes, like command
+line tools, and most of the time it produces the exact same plans as the last
+time. Similar to `.pyc` files, a :class:`PlanStore` writes the plans to a file
+and loads them on the next start, as long as nothing they were derived from
+changed.
+
+Plans reference types and functions, which can't be written to disk. Instead,
+we store their qualified names and look them up again when loading. Each file
+is stamped with
+
+- the fingerprint of the specification, which covers the registered types and
+  builders. Local classes and functions are identified by the object, so
+  plans of specifications registering them are never re-used by another
+  process,
+- the modification time and size of the source file of every module that
+  defines something the plans reference, or one of the base classes of a
+  referenced class. Constructor signatures can only change along with their
+  source, including inherited ones, so they are covered as well.
+
+If any of them differs when loading, the file is ignored. Files are written in
+the `marshal` format and memory-mapped when loading. Like the `co_names` of a
+code object, each file holds a table of all referenced names, and the plans
+only refer to their index. Loading therefore looks each name up only once.
+
+Plans and planners are pickled using the same encoding, so they can be sent
+to other processes cheaply, see :mod:`diy.workers`.
+"""
+
+from __future__ import annotations
+
+import marshal
+import sys
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from importlib import import_module
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from types import NoneType, UnionType
+from typing import Any
+
+from diy._internal.plan import (
+    BuilderBasedResolutionPlan,
+    BuilderParameterResolutionPlan,
+    CallableResolutionPlan,
+    DefaultParameterResolutionPlan,
+    InferenceBasedResolutionPlan,
+    InferenceParameterResolutionPlan,
+    LazyParameterResolutionPlan,
+    NoArgsConstructorParameterResolutionPlan,
+    NoneParameterResolutionPlan,
+    ParameterResolutionPlan,
+    ProviderParameterResolutionPlan,
+)
+from diy.specification.protocol import SpecificationProtocol
+
+type RootPlan = BuilderBasedResolutionPlan[..., Any] | InferenceBasedResolutionPlan[Any]
+
+_VERSION = 1
+"""Bumped whenever the format changes, so old files are ignored."""
+
+type Stamp = tuple[str, int, int]
+"""The path of a source file, its modification time in nanoseconds and size."""
+
+
+_MISSING: Any = object()
+"""Stands in for names that could not be looked up when loading."""
+
+
+class UnstorableError(Exception):
+    """
+    Raised while encoding a plan that references something we can't look up
+    by its qualified name, e.g. a class defined inside a function.
+    """
+
+
+class PlanStore:
+    """
+    Reads and writes the plans of a specification from and to a file.
+
+    >>> from diy import Specification
+    >>> from diy._internal.planner import Planner
+    >>> from tempfile import TemporaryDirectory
+    >>> from fractions import Fraction
+    ...
+    >>> spec = Specification()
+    >>> spec.add(Fraction)
+    >>> with TemporaryDirectory() as directory:
+    ...   store = PlanStore(f"{directory}/plans")
+    ...   store.save(spec, {Fraction: Planner(spec).plan(Fraction)})
+    ...   store.load(spec)[Fraction].execute()
+    1
+    Fraction(0, 1)
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        super().__init__()
+        self.path = Path(path)
+
+    def load(self, spec: SpecificationProtocol) -> dict[type[Any], RootPlan]:
+        """
+        The stored plans, or none at all if they are outdated. Plans that
+        reference something that does not exist anymore are left out.
+        """
+        try:
+            with (
+                self.path.open("rb") as file,
+                mmap(file.fileno(), 0, access=ACCESS_READ) as data,
+            ):
+                # Like `.pyc` files, the file is only ever written by us.
+                version, fingerprint, stamps, names, entries = marshal.loads(data)  # noqa: S302
+        except (OSError, ValueError, EOFError, TypeError):
+            return {}
+
+        if version != _VERSION or fingerprint != _fingerprint(spec):
+            return {}
+        if any(_stamp(path) != (mtime, size) for path, mtime, size in stamps):
+            return {}
+
+        return decode_plans(names, entries)
+
+    def save(
+        self, spec: SpecificationProtocol, plans: Mapping[type[Any], RootPlan]
+    ) -> int:
+        """
+        Writes all plans that can be stored to the file, replacing whatever it
+        contained before. Returns how many were written.
+
+        Storing plans is best-effort: If the file can't be written, e.g. since
+        its directory is read-only, nothing is written and `0` is returned.
+        """
+        names, entries = _encode_plans(plans)
+        stamps: list[Stamp] = [
+            (path, *stamp)
+            for path in sorted(_source_files(names.modules))
+            if (stamp := _stamp(path)) is not None
+        ]
+        data = marshal.dumps(
+            (_VERSION, _fingerprint(spec), stamps, names.names, entries)
+        )
+
+        # Write to a temporary file of our own first, so other processes never
+        # see a file that is only partially written, nor write to ours.
+        temporary: Path | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                dir=self.path.parent,
+                prefix=f"{self.path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as file:
+                temporary = Path(file.name)
+                file.write(data)
+            temporary.replace(self.path)
+        except OSError:
+            if temporary is not None:
+                with suppress(OSError):
+                    temporary.unlink(missing_ok=True)
+            return 0
+        return len(entries)
+
+
+type EncodedPlans = tuple[list[Any], list[tuple[int, Any]]]
+"""
+The table of all names the plans reference, and the type and structure of
+each plan referring to the table by index.
+"""
+
+
+def encode_plans(plans: Mapping[type[Any], RootPlan]) -> EncodedPlans:
+    """
+    Encodes the plans, so they only consist of builtin values. Plans
+    referencing something that can't be looked up by its qualified name are
+    left out, see :class:`UnstorableError`.
+    """
+    names, entries = _encode_plans(plans)
+    return names.names, entries
+
+
+def decode_plans(
+    names: list[Any], entries: list[tuple[int, Any]]
+) -> dict[type[Any], RootPlan]:
+    """
+    Looks up the names of encoded plans, importing their modules if needed,
+    and rebuilds the plans. Plans that reference something that does not
+    exist anymore are left out.
+    """
+    objects: list[Any] = []
+    for name in names:
+        try:
+            objects.append(_resolve(name, objects))
+        except (ImportError, AttributeError):
+            objects.append(_MISSING)
+
+    plans: dict[type[Any], RootPlan] = {}
+    for index, encoded in entries:
+        try:
+            plans[_object(objects, index)] = _decode_root(encoded, objects)
+        except LookupError:
+            continue
+    return plans
+
+
+def _encode_plans(
+    plans: Mapping[type[Any], RootPlan],
+) -> tuple[_Names, list[tuple[int, Any]]]:
+    names = _Names()
+    entries: list[tuple[int, Any]] = []
+    for abstract, plan in plans.items():
+        # Don't leave names of plans we skip in the table.
+        checkpoint = names.checkpoint()
+        try:
+            entries.append((names.index(abstract), _encode_root(plan, names)))
+        except UnstorableError:
+            names.rollback(checkpoint)
+            continue
+    return names, entries
+
+
+def _fingerprint(spec: SpecificationProtocol) -> str:
+    return spec.freeze().fingerprint
+
+
+def _stamp(path: str) -> tuple[int, int] | None:
+    try:
+        result = Path(path).stat()
+    except OSError:
+        return None
+    return (result.st_mtime_ns, result.st_size)
+
+
+def _source_files(modules: Iterable[str]) -> set[str]:
+    files: set[str] = set()
+    for module in modules:
+        file = getattr(sys.modules.get(module), "__file__", None)
+        if file is not None:
+            files.add(file)
+    return files
+
+
+# =============================================================================
+# Names
+# =============================================================================
+
+
+class _Names:
+    """
+    The table of all types and functions referenced by the stored plans.
+    Entries are either `module:qualname` strings, `None` for `NoneType`, or
+    tuples of the indices of the members of a union.
+    """
+
+    names: list[Any]
+
+    modules: dict[str, None]
+    """
+    The modules defining the referenced types and functions, and the base
+    classes of the types, in the order they were first referenced.
+    """
+
+    _indices: dict[Any, int]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.names = []
+        self.modules = {}
+        self._indices = {}
+
+    def index(self, subject: Any) -> int:
+        index = self._indices.get(subject)
+        if index is None:
+            name = self._name(subject)
+            index = len(self.names)
+            self.names.append(name)
+            self._indices[subject] = index
+        return index
+
+    def checkpoint(self) -> tuple[int, int]:
+        return len(self.names), len(self.modules)
+
+    def rollback(self, checkpoint: tuple[int, int]) -> None:
+        names, modules = checkpoint
+        del self.names[names:]
+        self._indices = {
+            subject: index for subject, index in self._indices.items() if index < names
+        }
+        for module in list(self.modules)[modules:]:
+            del self.modules[module]
+
+    def _name(self, subject: Any) -> Any:
+        if subject is NoneType:
+            return None
+        if isinstance(subject, UnionType):
+            return tuple(self.index(member) for member in subject.__args__)
+
+        module = getattr(subject, "__module__", None)
+        qualname = getattr(subject, "__qualname__", None)
+        if not isinstance(module, str) or not isinstance(qualname, str):
+            raise UnstorableError(subject)
+
+        name = f"{module}:{qualname}"
+        try:
+            resolved = _resolve(name, [])
+        except (ImportError, AttributeError) as error:
+            raise UnstorableError(subject) from error
+        if resolved is not subject:
+            raise UnstorableError(subject)
+
+        self.modules.setdefault(module)
+        # Constructors might be inherited from a base class in another module.
+        for base in getattr(subject, "__mro__", ()):
+            self.modules.setdefault(base.__module__)
+        return name
+
+
+def _resolve(name: Any, objects: list[Any]) -> Any:
+    """
+    Looks up an entry of the name table. Unions refer to the already resolved
+    `objects` of their members.
+    """
+    if name is None:
+        return NoneType
+    if isinstance(name, tuple):
+        members = [_object(objects, index) for index in name]
+        union = members[0]
+        for member in members[1:]:
+            union = union | member
+        return union
+
+    module_name, qualname = name.split(":")
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = import_module(module_name)
+
+    subject: Any = module
+    for part in qualname.split("."):
+        subject = getattr(subject, part)
+    return subject
+
+
+def _object(objects: list[Any], index: int) -> Any:
+    subject = objects[index]
+    if subject is _MISSING:
+        raise LookupError(index)
+    return subject
+
+
+# =============================================================================
+# Plans
+# =============================================================================
+
+
+def _encode_root(plan: RootPlan, names: _Names) -> tuple[Any, ...]:
+    match plan:
+        case InferenceBasedResolutionPlan():
+            parameters = _encode_parameters(plan.parameters, names)
+            return ("inference", names.index(plan.type), parameters)
+        case BuilderBasedResolutionPlan():
+            return (
+                "builder",
+                names.index(plan.type),
+                names.index(plan.builder),
+                _encode_parameters(plan.args_plan.parameters, names),
+            )
+
+
+def _decode_root(encoded: tuple[Any, ...], objects: list[Any]) -> RootPlan:
+    match encoded:
+        case ("inference", abstract, parameters):
+            return InferenceBasedResolutionPlan(
+                _object(objects, abstract), _decode_parameters(parameters, objects)
+            )
+        case ("builder", abstract, builder, parameters):
+            builder = _object(objects, builder)
+            return BuilderBasedResolutionPlan(
+                _object(objects, abstract),
+                builder,
+                CallableResolutionPlan(
+                    builder, _decode_parameters(parameters, objects)
+                ),
+            )
+        case _:
+            raise LookupError(encoded)
+
+
+def _encode_parameters(
+    parameters: list[ParameterResolutionPlan[..., Any]], names: _Names
+) -> tuple[Any, ...]:
+    return tuple(_encode_parameter(parameter, names) for parameter in parameters)
+
+
+def _encode_parameter(
+    node: ParameterResolutionPlan[..., Any], names: _Names
+) -> tuple[Any, ...]:
+    head = (node.name, node.depth, names.index(node.type))
+    match node:
+        case DefaultParameterResolutionPlan():
+            return ("default", *head)
+        case NoArgsConstructorParameterResolutionPlan():
+            return ("no args", *head)
+        case NoneParameterResolutionPlan():
+            return ("none", *head)
+        case BuilderParameterResolutionPlan():
+            return (
+                "builder",
+                *head,
+                names.index(node.builder),
+                _encode_parameters(node.args_plan.parameters, names),
+            )
+        case InferenceParameterResolutionPlan():
+            return ("inference", *head, _encode_parameters(node.parameters, names))
+        case ProviderParameterResolutionPlan():
+            return ("provider", *head, _encode_root(node.provided, names))
+        case LazyParameterResolutionPlan():
+            return ("lazy", *head, _encode_root(node.provided, names))
+        case _:
+            # Failed and constant nodes are never part of plans we store.
+            raise UnstorableError(node)
+
+
+def _decode_parameters(
+    encoded: tuple[Any, ...], objects: list[Any]
+) -> list[ParameterResolutionPlan[..., Any]]:
+    return [_decode_parameter(parameter, objects) for parameter in encoded]
+
+
+def _decode_parameter(
+    encoded: tuple[Any, ...], objects: list[Any]
+) -> ParameterResolutionPlan[..., Any]:
+    kind, name, depth, abstract, *rest = encoded
+    abstract = _object(objects, abstract)
+    match kind, rest:
+        case "default", []:
+            return DefaultParameterResolutionPlan(name, depth, abstract)
+        case "no args", []:
+            return NoArgsConstructorParameterResolutionPlan(name, depth, abstract)
+        case "none", []:
+            return NoneParameterResolutionPlan(name, depth, abstract)
+        case "builder", [builder, parameters]:
+            builder = _object(objects, builder)
+            return BuilderParameterResolutionPlan(
+                name,
+                depth,
+                abstract,
+                builder,
+                CallableResolutionPlan(
+                    builder, _decode_parameters(parameters, objects)
+                ),
+            )
+        case "inference", [parameters]:
+            return InferenceParameterResolutionPlan(
+                name, depth, abstract, _decode_parameters(parameters, objects)
+            )
+        case "provider", [provided]:
+            return ProviderParameterResolutionPlan(
+                name, depth, abstract, _decode_root(provided, objects)
+            )
+        case "lazy", [provided]:
+            return LazyParameterResolutionPlan(
+                name, depth, abstract, _decode_root(provided, objects)
+            )
+        case _:
+            raise LookupError(kind)
@@ -1,12 +1,17 @@
 from collections.abc import Callable
-from inspect import Parameter, Signature, signature
-from types import UnionType
-from typing import Annotated, Any, get_origin
+from functools import reduce
+from inspect import Parameter, Signature
+from operator import or_
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, get_args, get_origin
 
+from diy._internal.signatures import raw_signature, return_annotation
 from diy.errors import (
     MissingConstructorKeywordArgumentError,
     MissingReturnTypeAnnotationError,
 )
+from diy.lazy import Lazy
+from diy.provider import Provider
 
 
 def is_typelike(subject: object) -> bool:
@@ -16,7 +21,46 @@ def is_typelike(subject: object) -> bool:
     if isinstance(subject, UnionType):
         return True
 
-    return get_origin(subject) is Annotated
+    return get_origin(subject) in (Annotated, Union)
+
+
+def provided_type(subject: object) -> Any | None:
+    """
+    Returns `T` if the subject is either `Provider[T]` or `Callable[[], T]`.
+    """
+    origin = get_origin(subject)
+    if origin is Provider:
+        return get_args(subject)[0]
+
+    if origin is Callable:
+        parameters, returns = get_args(subject)
+        if parameters == []:
+            return returns
+
+    return None
+
+
+def lazy_type(subject: object) -> Any | None:
+    """
+    Returns `T` if the subject is `Lazy[T]`.
+    """
+    if get_origin(subject) is Lazy:
+        return get_args(subject)[0]
+    return None
+
+
+def optional_type(subject: object) -> Any | None:
+    """
+    Returns `T` if the subject is `T | None`.
+    """
+    if get_origin(subject) not in (UnionType, Union):
+        return None
+
+    members = get_args(subject)
+    if NoneType not in members:
+        return None
+
+    return reduce(or_, [member for member in members if member is not NoneType])
 
 
 def assert_is_typelike(subject: object) -> None:
@@ -26,7 +70,7 @@ def assert_is_typelike(subject: object) -> None:
 
 
 def assert_annotates_return_type[R](builder: Callable[..., R]) -> type[R]:
-    abstract = signature(builder, eval_str=True).return_annotation
+    abstract = return_annotation(builder)
     if abstract is Signature.empty:
         raise MissingReturnTypeAnnotationError
 
@@ -36,7 +80,8 @@ def assert_annotates_return_type[R](builder: Callable[..., R]) -> type[R]:
 
 
 def assert_constructor_has_parameter(abstract: type[Any], name: str) -> Parameter:
-    sig = signature(abstract.__init__, eval_str=True)
+    # Only the name matters here, the annotation is evaluated once planned.
+    sig = raw_signature(abstract.__init__)
     parameter = sig.parameters.get(name)
     if parameter is None:
         raise MissingConstructorKeywordArgumentError(abstract, name)
@@ -1,22 +1,344 @@
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from inspect import Parameter, signature
 from typing import Any
 
-from diy._internal.plan import ResolutionPlan
+from diy._internal.display import qualified_name
+from diy._internal.plan import (
+    BuilderBasedResolutionPlan,
+    BuilderParameterResolutionPlan,
+    FailedParameterResolutionPlan,
+    InferenceBasedResolutionPlan,
+    InferenceParameterResolutionPlan,
+    LazyParameterResolutionPlan,
+    NoArgsConstructorParameterResolutionPlan,
+    NoneParameterResolutionPlan,
+    ParameterResolutionPlan,
+    ProviderParameterResolutionPlan,
+    ResolutionPlan,
+)
 from diy._internal.planner import Planner
+from diy.errors import CircularDependencyError, Cycle, DiyError, VerificationError
+from diy.specification.frozen import Key
 from diy.specification.protocol import SpecificationProtocol
 
 type VerifiedSpecification = dict[type[Any], ResolutionPlan[..., Any]]
 
+type RootPlan = BuilderBasedResolutionPlan[..., Any] | InferenceBasedResolutionPlan[Any]
+type Node = RootPlan | ParameterResolutionPlan[..., Any]
+
 
 def verify_specification(spec: SpecificationProtocol) -> VerifiedSpecification:
     """
     Looks at all types in the specification and verifies they can actually be
     resolved at runtime.
     """
+    return dict(Verifier(spec).plans)
+
+
+@dataclass
+class Problem:
+    """Something that prevents a type of the specification from being built."""
+
+    subject: type[Any]
+    """The type of the specification that can't be built."""
+
+    path: tuple[str, ...]
+    """
+    The names of the parameters that lead from the planned type to the node
+    that failed. Empty, if planning the type itself failed.
+    """
+
+    node: FailedParameterResolutionPlan[Any] | None
+    """The node that failed, or `None` if planning the type itself failed."""
+
+    error: DiyError
+    """What went wrong."""
+
+    @property
+    def location(self) -> str:
+        return " -> ".join([qualified_name(self.subject), *self.path])
+
+
+@dataclass
+class VerificationReport:
+    """All plans of a specification, along with all problems found in them."""
+
+    plans: dict[type[Any], RootPlan] = field(default_factory=dict)
+    """
+    The plans, by the type they build. Nodes that failed are marked as such
+    and raise their error when executed.
+    """
+
+    problems: list[Problem] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.problems) == 0
+
+    def raise_for_problems(self) -> None:
+        """Raises a single error describing all problems, if there are any."""
+        if not self.ok:
+            raise VerificationError(self.problems)
+
+
+def check_specification(
+    spec: SpecificationProtocol, types: Iterable[type[Any]] | None = None
+) -> VerificationReport:
+    """
+    Plans all types in the specification and collects every problem, instead
+    of stopping at the first one. Pass `types` to only check some of them,
+    e.g. to split large specifications between multiple processes.
+
+    Each circular dependency is reported once, for the first type that
+    found it.
+    """
+    planner = Planner(spec, lenient=True)
+    report = VerificationReport()
+    reported: set[tuple[Any, ...]] = set()
+    for abstract in spec.types() if types is None else types:
+        try:
+            plan = planner.plan(abstract)
+        except DiyError as error:
+            unreported = _unreported(error, reported)
+            if unreported is not None:
+                report.problems.append(Problem(abstract, (), None, unreported))
+            continue
+
+        report.plans[abstract] = plan
+        for path, node in _failed(plan):
+            unreported = _unreported(node.error, reported)
+            if unreported is not None:
+                report.problems.append(Problem(abstract, path, node, unreported))
+
+    return report
+
+
+class Verifier:
+    """
+    Plans all types of a specification, and keeps the plans up to date when
+    the specification changes.
+
+    For each plan, we remember which entries of the spec (builders for types,
+    and partial builders for parameters) it looked at, and what they were at
+    that time. When the spec changes, only the plans that looked at an entry
+    that is different now have to be planned again.
+    """
+
+    plans: dict[type[Any], RootPlan]
+    """The verified plans, by the type they build."""
+
+    _seen: dict[Key, Any]
+    """The entries of the spec the plans looked at, and their values back then."""
+
+    _dependents: dict[Key, set[type[Any]]]
+    """The types, whose plan looked at an entry of the spec."""
+
+    _dependencies: dict[type[Any], set[Key]]
+    """The entries of the spec, each plan looked at."""
+
+    _volatile: set[type[Any]]
+    """
+    Types whose plans fell back to `None` for an optional parameter. We don't
+    know which entries the failed planning looked at, so these are planned
+    again on every change.
+    """
+
+    _revision: int
+    """The revision of the spec, the plans were verified for."""
+
+    def __init__(
+        self,
+        spec: SpecificationProtocol,
+        preloaded: Mapping[type[Any], RootPlan] | None = None,
+    ) -> None:
+        super().__init__()
+        self.spec = spec
+        self.plans = {}
+        self._seen = {}
+        self._dependents = {}
+        self._dependencies = {}
+        self._volatile = set()
+        self._planner = Planner(spec)
+        if preloaded is not None:
+            self._planner.preload(preloaded)
+        self._revision = spec.revision
+        self._plan_all(spec.types())
+
+    @property
+    def outdated(self) -> bool:
+        """Whether the spec changed since it was last verified."""
+        return self._revision != self.spec.revision
+
+    def plan(self, abstract: type[Any]) -> RootPlan:
+        """
+        Plans the given type and remembers which entries of the spec it
+        depends on.
+        """
+        plan = self._planner.plan(abstract)
+        self._forget(abstract)
+        self.plans[abstract] = plan
+
+        dependencies: set[Key] = set()
+        for key in _looked_up(plan):
+            if key is None:
+                self._volatile.add(abstract)
+                continue
+            dependencies.add(key)
+            self._dependents.setdefault(key, set()).add(abstract)
+            self._seen[key] = _lookup(self.spec, key)
+        self._dependencies[abstract] = dependencies
+
+        return plan
+
+    def verify(self) -> int:
+        """
+        Verifies the changes of the spec since the last verification, by
+        planning new types and re-planning those affected by the change.
+
+        Returns how many types were (re-)planned.
+        """
+        revision = self.spec.revision
+
+        affected = set(self._volatile)
+        for key, seen in self._seen.items():
+            if _lookup(self.spec, key) is not seen:
+                affected.update(self._dependents[key])
+        affected.update(
+            abstract for abstract in self.spec.types() if abstract not in self.plans
+        )
+
+        self._plan_all(affected)
+
+        self._revision = revision
+        return len(affected)
+
+    def _plan_all(self, abstracts: Iterable[type[Any]]) -> None:
+        """
+        Plans all given types. Instead of stopping at the first circular
+        dependency, we look for all of them and report them at once.
+        """
+        cycles: dict[tuple[Any, ...], Cycle] = {}
+        for abstract in abstracts:
+            try:
+                self.plan(abstract)
+            except CircularDependencyError as error:
+                for cycle in error.cycles:
+                    cycles.setdefault(_normalize(cycle), cycle)
+
+        if len(cycles) > 0:
+            raise CircularDependencyError(list(cycles.values()))
+
+    def _forget(self, abstract: type[Any]) -> None:
+        self._volatile.discard(abstract)
+        for key in self._dependencies.pop(abstract, ()):
+            dependents = self._dependents[key]
+            dependents.discard(abstract)
+            if len(dependents) == 0:
+                del self._dependents[key]
+                self._seen.pop(key, None)
+
+
+def _looked_up(plan: RootPlan) -> Iterator[Key | None]:
+    """
+    The entries of the spec the planner looked at while creating the plan.
+    Yields `None`, if the plan depends on entries we can't tell.
+    """
+    stack: list[Node] = [plan]
+    while len(stack) > 0:
+        node = stack.pop()
+        match node:
+            case InferenceBasedResolutionPlan() | InferenceParameterResolutionPlan():
+                yield (node.type, None)
+                for parameter in node.parameters:
+                    yield (node.type, parameter.name)
+                stack.extend(node.parameters)
+            case BuilderBasedResolutionPlan() | BuilderParameterResolutionPlan():
+                yield (node.type, None)
+                stack.extend(node.args_plan.parameters)
+            case NoArgsConstructorParameterResolutionPlan():
+                # The planner dropped the parameters that all use their default
+                # values, but it checked for partial builders for each one.
+                yield (node.type, None)
+                for name in _parameter_names(node.type.__init__):
+                    yield (node.type, name)
+            case ProviderParameterResolutionPlan() | LazyParameterResolutionPlan():
+                stack.append(node.provided)
+            case NoneParameterResolutionPlan():
+                yield None
+            case _:
+                pass
+
+
+def _failed(
+    plan: RootPlan,
+) -> Iterator[tuple[tuple[str, ...], FailedParameterResolutionPlan[Any]]]:
+    """
+    The nodes of the plan that failed, along with the names of the parameters
+    that lead to them, in the order they appear in the plan.
+    """
+    stack: list[tuple[tuple[str, ...], Node]] = [((), plan)]
+    while len(stack) > 0:
+        path, node = stack.pop()
+        match node:
+            case FailedParameterResolutionPlan():
+                yield path, node
+            case InferenceBasedResolutionPlan() | InferenceParameterResolutionPlan():
+                stack.extend(
+                    ((*path, child.name), child) for child in reversed(node.parameters)
+                )
+            case BuilderBasedResolutionPlan() | BuilderParameterResolutionPlan():
+                stack.extend(
+                    ((*path, child.name), child)
+                    for child in reversed(node.args_plan.parameters)
+                )
+            case ProviderParameterResolutionPlan() | LazyParameterResolutionPlan():
+                stack.append((path, node.provided))
+            case _:
+                pass
+
+
+def _unreported(error: DiyError, reported: set[tuple[Any, ...]]) -> DiyError | None:
+    """
+    The error, without the cycles that were reported already, or `None` if
+    nothing is left. Marks the remaining cycles as reported.
+    """
+    if not isinstance(error, CircularDependencyError):
+        return error
+
+    cycles = [cycle for cycle in error.cycles if _normalize(cycle) not in reported]
+    reported.update(_normalize(cycle) for cycle in cycles)
+    if len(cycles) == 0:
+        return None
+    return error if cycles == error.cycles else CircularDependencyError(cycles)
+
+
+def _normalize(cycle: Cycle) -> tuple[Any, ...]:
+    """
+    The same cycle is found once for each type that is part of it, just
+    starting at a different type. We identify them by the types they contain,
+    starting with the one with the lowest id.
+    """
+    types = [abstract for _, abstract in cycle[:-1]]
+    start = min(range(len(types)), key=lambda index: id(types[index]))
+    return tuple(types[start:] + types[:start])
+
 
-    planner = Planner(spec)
+def _lookup(spec: SpecificationProtocol, key: Key) -> Any:
+    abstract, name = key
+    if name is None:
+        return spec.get(abstract)
+    return spec.get(abstract, name)
 
-    plans: VerifiedSpecification = {}
-    for type in spec.types():
-        plans[type] = planner.plan(type)
 
-    return plans
+def _parameter_names(function: Callable[..., Any]) -> list[str]:
+    try:
+        parameters = signature(function).parameters.values()
+    except ValueError:
+        return []
+    return [
+        parameter.name
+        for parameter in parameters
+        if parameter.name != "self"
+        and parameter.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    ]
@@ -1,9 +1,12 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Set
 from typing import Any, overload, override
 
-from diy._internal.planner import Planner
+from diy._internal.cache import DEFAULT_MAXSIZE, CacheStats
+from diy._internal.planner import shared_planner
 from diy.container.protocol import ContainerProtocol
+from diy.errors import DiyError
 from diy.specification.default import Specification
+from diy.specification.frozen import FrozenSpecification
 from diy.specification.protocol import SpecificationProtocol
 
 
@@ -19,10 +22,39 @@ class Container(ContainerProtocol, SpecificationProtocol):
     can theoretically happen at any time.
     """
 
-    def __init__(self, spec: SpecificationProtocol | None = None) -> None:
+    profile: str | None
+    """The profile whose bindings apply, see :meth:`Specification.profile`."""
+
+    def __init__(
+        self,
+        spec: SpecificationProtocol | None = None,
+        cache_size: int | None = DEFAULT_MAXSIZE,
+        profile: str | None = None,
+    ) -> None:
         super().__init__()
-        self._spec = spec or Specification()
-        self._planner = Planner(self._spec)
+        spec = spec or Specification()
+        if profile is not None:
+            if not isinstance(spec, Specification):
+                message = (
+                    f"Profiles can only be selected from a Specification, got {spec!r}."
+                )
+                raise TypeError(message)
+            spec = spec.select(profile)
+        self._spec = spec
+        self.profile = profile
+        self._planner = shared_planner(self._spec, cache_size)
+
+    @property
+    def spec(self) -> SpecificationProtocol:
+        """The specification this container resolves types from."""
+        return self._spec
+
+    def cache_stats(self) -> CacheStats:
+        """
+        How well the plans of resolved types are re-used. At most `cache_size`
+        types are remembered at once.
+        """
+        return self._planner.cache.stats()
 
     # =========================================================================
     # SpecificationProtocol
@@ -51,22 +83,49 @@ class Container(ContainerProtocol, SpecificationProtocol):
         constructors.
         """
 
+    @overload
+    def add(self, builder: str, name: str) -> Callable[..., Any]:
+        """
+        Mark the function as a supplier for the named constructor parameter of
+        the type, that the import specifier refers to.
+        """
+
+    @overload
+    def add(self, builder: str) -> None:
+        """
+        Tell the container, that the type the import specifier refers to
+        exists, without importing it yet.
+        """
+
     @override
     def add[T](
-        self, builder: Callable[..., Any] | type[T], name: str | None = None
+        self, builder: Callable[..., Any] | type[T] | str, name: str | None = None
     ) -> Callable[..., Any] | None:
         return self._spec.add(builder, name)  # type: ignore
 
+    @override
+    def add_lazy(self, abstract: type[Any] | str, specifier: str) -> None:
+        self._spec.add_lazy(abstract, specifier)
+
     @override
     def get[T](
         self, abstract: type[T], name: str | None = None
     ) -> Callable[..., T] | None:
         return self._spec.get(abstract, name)  # type: ignore
 
+    @property
+    @override
+    def revision(self) -> int:
+        return self._spec.revision
+
     @override
-    def types(self) -> set[type[Any]]:
+    def types(self) -> Set[type[Any]]:
         return self._spec.types()
 
+    @override
+    def freeze(self) -> FrozenSpecification:
+        return self._spec.freeze()
+
     # =========================================================================
     # ContainerProtocol
     # =========================================================================
@@ -76,6 +135,19 @@ class Container(ContainerProtocol, SpecificationProtocol):
         plan = self._planner.plan(abstract)
         return plan.execute()
 
+    @override
+    def try_resolve[T](self, abstract: type[T]) -> T | None:
+        try:
+            plan = self._planner.plan(abstract)
+        except DiyError:
+            return None
+        return plan.execute()
+
+    @override
+    def resolve_many(self, abstracts: Iterable[type[Any]]) -> list[Any]:
+        plan = self._planner.plan_many(abstracts)
+        return plan.execute()
+
     @override
     def call[R](self, function: Callable[..., R]) -> R:
         plan = self._planner.plan_call(function)
@@ -1,6 +1,8 @@
 from abc import abstractmethod
-from collections.abc import Callable
-from typing import Protocol, runtime_checkable
+from collections.abc import Callable, Iterable
+from typing import Any, Protocol, runtime_checkable
+
+from diy.errors import DiyError
 
 
 @runtime_checkable
@@ -25,6 +27,35 @@ class ContainerProtocol(Protocol):
         not have enough information how to build it.
         """
 
+    def try_resolve[T](self, abstract: type[T]) -> T | None:
+        """
+        Like :meth:`resolve`, but returns `None` instead of raising, when the
+        container does not know how to build the given type.
+
+        Use this when probing for optional components. Note that errors raised
+        by your own builder functions are not caught.
+        """
+        # Containers that can tell planning and building apart do better.
+        try:
+            return self.resolve(abstract)
+        except DiyError:
+            return None
+
+    def resolve_many(self, abstracts: Iterable[type[Any]]) -> list[Any]:
+        """
+        Retrieves instances of all given types from the container at once and
+        returns them in the same order.
+
+        Dependencies that are shared between the requested types are only
+        constructed once and the same instance is passed to all of them. This
+        is handy e.g. during the startup of an application, where lots of
+        services are resolved that all depend on the same few clients.
+
+        Containers that don't implement this resolve the types one by one, so
+        they don't share their dependencies.
+        """
+        return [self.resolve(abstract) for abstract in abstracts]
+
     @abstractmethod
     def call[R](self, function: Callable[..., R]) -> R:
         """
@@ -1,8 +1,10 @@
-from collections.abc import Callable
-from typing import override
+from collections.abc import Callable, Iterable
+from typing import Any, override
 
-from diy._internal.planner import Planner
+from diy._internal.cache import DEFAULT_MAXSIZE, CacheStats
+from diy._internal.planner import shared_planner
 from diy.container.protocol import ContainerProtocol
+from diy.errors import DiyError
 from diy.specification.default import Specification
 from diy.specification.protocol import SpecificationProtocol
 
@@ -12,21 +14,55 @@ class RuntimeContainer(ContainerProtocol):
     A container that tries to construct dependencies at
     runtime.
 
+    Plans are made the first time a type is requested, and are remembered for
+    up to `cache_size` types. Once the plan of a type that is no longer used
+    anywhere else, e.g. a dynamically created class, was evicted from the
+    cache, the type can be garbage collected.
+
     Note that it accepts any spec, even invalid ones with circular
     dependencies, uncallable builder functions, and the likes. If you prefer
     something a little more safe, have a look at :class:`VerifyingContainer`.
     """
 
-    def __init__(self, spec: SpecificationProtocol | None = None) -> None:
+    def __init__(
+        self,
+        spec: SpecificationProtocol | None = None,
+        cache_size: int | None = DEFAULT_MAXSIZE,
+    ) -> None:
         super().__init__()
         self._spec = spec or Specification()
-        self._planner = Planner(self._spec)
+        self._planner = shared_planner(self._spec, cache_size)
+
+    @property
+    def spec(self) -> SpecificationProtocol:
+        """The specification this container resolves types from."""
+        return self._spec
+
+    def cache_stats(self) -> CacheStats:
+        """
+        How well the plans of resolved types are re-used. At most `cache_size`
+        types are remembered at once.
+        """
+        return self._planner.cache.stats()
 
     @override
     def resolve[T](self, abstract: type[T]) -> T:
         plan = self._planner.plan(abstract)
         return plan.execute()
 
+    @override
+    def try_resolve[T](self, abstract: type[T]) -> T | None:
+        try:
+            plan = self._planner.plan(abstract)
+        except DiyError:
+            return None
+        return plan.execute()
+
+    @override
+    def resolve_many(self, abstracts: Iterable[type[Any]]) -> list[Any]:
+        plan = self._planner.plan_many(abstracts)
+        return plan.execute()
+
     @override
     def call[R](self, function: Callable[..., R]) -> R:
         plan = self._planner.plan_call(function)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import override
+from collections.abc import Callable, Iterable
+from os import PathLike
+from typing import Any, override
 
-from diy._internal.planner import Planner
-from diy._internal.verification import verify_specification
+from diy._internal.batch import BatchResolutionPlan
+from diy._internal.plan import BuilderBasedResolutionPlan, InferenceBasedResolutionPlan
+from diy._internal.planner import shared_planner
+from diy._internal.store import PlanStore
+from diy._internal.verification import Verifier
 from diy.container.protocol import ContainerProtocol
+from diy.errors import DiyError
 from diy.specification.protocol import SpecificationProtocol
 
 
@@ -25,22 +30,84 @@ class VerifyingContainer(ContainerProtocol):
 
     This also enables you to verify containers during tests, thereby catching
     misconfigured specifications early in the development process.
+
+    When the specification changes afterwards, only the plans that are
+    affected by the change are verified again, see :meth:`verify`.
+
+    The container stops at the first type that can't be built. To find all
+    problems of a specification at once, e.g. in CI, use
+    :func:`diy.verification.check_specification` instead.
+
+    Pass a `plan_cache` file to re-use the plans of earlier processes, as long
+    as neither the spec nor the source files of the planned types changed
+    since then, see :class:`PlanStore`. If the file can't be written, the
+    container works all the same, it just plans everything again next time.
     """
 
-    def __init__(self, spec: SpecificationProtocol) -> None:
+    def __init__(
+        self,
+        spec: SpecificationProtocol,
+        plan_cache: str | PathLike[str] | None = None,
+    ) -> None:
         super().__init__()
-        self._spec = verify_specification(spec)
-        self._planner = Planner(spec)
-        self._verified_spec = verify_specification(spec)
+        self._spec = spec
+        self._planner = shared_planner(spec)
+
+        if plan_cache is None:
+            self._verifier = Verifier(spec)
+            return
+
+        store = PlanStore(plan_cache)
+        stored = store.load(spec)
+        self._verifier = Verifier(spec, stored)
+        if stored.keys() != self._verifier.plans.keys():
+            store.save(spec, self._verifier.plans)
+
+    @property
+    def spec(self) -> SpecificationProtocol:
+        """The specification this container resolves types from."""
+        return self._spec
+
+    def verify(self) -> int:
+        """
+        Verifies the changes made to the specification since it was last
+        verified. This happens automatically, when resolving types after the
+        specification changed.
+
+        Only the plans of new types, and of types that depend on a builder
+        that was added or replaced, are planned again. Returns how many there
+        were.
+        """
+        return self._verifier.verify()
 
     @override
     def resolve[T](self, abstract: type[T]) -> T:
-        plan = self._spec.get(abstract)
-        if plan is None:
-            plan = self._planner.plan(abstract)
-            self._verified_spec[abstract] = plan
+        return self._plan(abstract).execute()
+
+    @override
+    def try_resolve[T](self, abstract: type[T]) -> T | None:
+        try:
+            plan = self._plan(abstract)
+        except DiyError:
+            return None
+        return plan.execute()
+
+    @override
+    def resolve_many(self, abstracts: Iterable[type[Any]]) -> list[Any]:
+        plan = BatchResolutionPlan([self._plan(abstract) for abstract in abstracts])
         return plan.execute()
 
+    def _plan[T](
+        self, abstract: type[T]
+    ) -> BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T]:
+        if self._verifier.outdated:
+            self._verifier.verify()
+
+        plan = self._verifier.plans.get(abstract)
+        if plan is None:
+            plan = self._verifier.plan(abstract)
+        return plan
+
     @override
     def call[R](self, function: Callable[..., R]) -> R:
         plan = self._planner.plan_call(function)
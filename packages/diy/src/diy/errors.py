@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Collection
+from typing import TYPE_CHECKING, Any, override
 
-from diy._internal.display import print_resolution_plan, qualified_name
-from diy._internal.plan import (
-    CallableResolutionPlan,
-    InferenceBasedResolutionPlan,
-    InferenceParameterResolutionPlan,
-)
+if TYPE_CHECKING:
+    from diy._internal.plan import (
+        CallableResolutionPlan,
+        InferenceBasedResolutionPlan,
+        InferenceParameterResolutionPlan,
+    )
+    from diy._internal.verification import Problem
+
+
+def _qualified_name(subject: Any) -> str:
+    """
+    See :func:`diy._internal.display.qualified_name`. Errors are imported by
+    everything, but only need to display something once they are raised, so
+    the display module is imported on demand.
+    """
+    from diy._internal.display import qualified_name
+
+    return qualified_name(subject)
 
 
 class DiyError(Exception):
@@ -16,12 +28,34 @@ class DiyError(Exception):
     The base error, that all diy errors extend from.
     """
 
+    _notes: list[str] | None = None
+
+    @property
+    def __notes__(self) -> list[str]:  # type: ignore[reportIncompatibleVariableOverride]
+        # Rendering plans and listing known types can get expensive for big
+        # specifications. Since errors are often caught and never displayed,
+        # e.g. when probing for optional dependencies, we only render notes
+        # once someone actually looks at them.
+        if self._notes is None:
+            self._notes = self._render_notes()
+        return self._notes
+
+    @__notes__.setter
+    def __notes__(self, notes: list[str]) -> None:  # type: ignore[reportIncompatibleVariableOverride]
+        self._notes = notes
+
+    def _render_notes(self) -> list[str]:
+        """
+        Notes that are computed lazily, once the error is displayed.
+        """
+        return []
+
 
 class UninstanciableTypeError(DiyError):
     abstract: type[Any]
 
     def __init__(self, abstract: type[Any]) -> None:
-        message = f"Can't instantiate type '{qualified_name(abstract)}', since it's __init__ method does not accept 'self' as its first argument!"
+        message = f"Can't instantiate type '{_qualified_name(abstract)}', since it's __init__ method does not accept 'self' as its first argument!"
         super().__init__(message)
         self.abstract = abstract
 
@@ -42,22 +76,86 @@ class FailedToInferDependencyError[**P, T](DiyError):
         self.parent = parent
         self.root = root
         message = (
-            f"Failed to infer parameter {parameter} of {qualified_name(self.subject)}"
+            f"Failed to infer parameter {parameter} of {_qualified_name(self.subject)}"
         )
         super().__init__(message)
-        printed_plan = print_resolution_plan(root)
+
+    @override
+    def _render_notes(self) -> list[str]:
+        from diy._internal.display import print_resolution_plan
+
+        printed_plan = print_resolution_plan(self.root)
         # TODO: The plan is somewhat helpful here, but we should hint to the
         #       developer at which point of the plan this exception originates
-        self.add_note(f"\n{printed_plan}")
+        return [f"\n{printed_plan}"]
 
     @property
     def subject(self) -> type[Any] | Callable[..., Any]:
+        from diy._internal.plan import CallableResolutionPlan
+
         if isinstance(self.parent, CallableResolutionPlan):
             return self.parent.subject
 
         return self.parent.type
 
 
+type Cycle = list[tuple[str | None, Any]]
+"""
+The parameter names and types that make up a circular dependency, see
+:func:`print_cycle`.
+"""
+
+
+class CircularDependencyError(DiyError):
+    """
+    Gets thrown when a type requires an instance of itself to be constructed,
+    either directly or through its dependencies.
+
+    When verifying a whole specification, a single error is raised for all
+    cycles that were found.
+    """
+
+    cycles: list[Cycle]
+    """All circular dependencies that were found."""
+
+    def __init__(self, cycles: list[Cycle]) -> None:
+        self.cycles = cycles
+        described = "; ".join(
+            " -> ".join(_qualified_name(abstract) for _, abstract in cycle)
+            for cycle in cycles
+        )
+        if len(cycles) == 1:
+            message = f"Found a circular dependency: {described}"
+        else:
+            message = f"Found {len(cycles)} circular dependencies: {described}"
+        super().__init__(message)
+
+    @override
+    def _render_notes(self) -> list[str]:
+        from diy._internal.display import print_cycle
+
+        return [f"\n{print_cycle(cycle)}" for cycle in self.cycles]
+
+
+class VerificationError(DiyError):
+    """
+    Gets thrown when checking a whole specification, and some of its types
+    can't be built. Lists all problems that were found at once.
+    """
+
+    problems: list[Problem]
+
+    def __init__(self, problems: list[Problem]) -> None:
+        self.problems = problems
+        count = len(problems)
+        noun = "problem" if count == 1 else "problems"
+        super().__init__(f"Found {count} {noun} while verifying the specification")
+
+    @override
+    def _render_notes(self) -> list[str]:
+        return [f"- {problem.location}: {problem.error}" for problem in self.problems]
+
+
 class UnresolvableDependencyError(DiyError):
     """
     Gets thrown when a :class:`Container` tries to instantiate a type, but not
@@ -82,12 +180,15 @@ class UnresolvableDependencyError(DiyError):
 
     def __init__(self, abstract: type[Any], known: list[type[Any]] | list[str]) -> None:
         super().__init__(
-            f"Failed to resolve an instance of '{qualified_name(abstract)}'"
+            f"Failed to resolve an instance of '{_qualified_name(abstract)}'"
         )
         self.abstract = abstract
-        enumeration = "\n".join([f"- {qualified_name(x)}" for x in known])
-        note = f"Known types are:\n{enumeration}"
-        self.add_note(note)
+        self.known = known
+
+    @override
+    def _render_notes(self) -> list[str]:
+        enumeration = "\n".join([f"- {_qualified_name(x)}" for x in self.known])
+        return [f"Known types are:\n{enumeration}"]
 
 
 class MissingReturnTypeAnnotationError(DiyError):
@@ -125,13 +226,13 @@ to provide proper annotations.
 
 class MissingConstructorKeywordArgumentError(DiyError):
     def __init__(self, abstract: type[Any], name: str) -> None:
-        message = f"Tried to register partial builder for parameter '{qualified_name(abstract)}'::'{name}' of type , but its __init__ function does not have a keyword argument named '{name}'!"
+        message = f"Tried to register partial builder for parameter '{_qualified_name(abstract)}'::'{name}' of type , but its __init__ function does not have a keyword argument named '{name}'!"
         super().__init__(message)
 
 
 class MissingConstructorKeywordTypeAnnotationError(DiyError):
-    def __init__(self, abstract: type[Any], name: str) -> None:
-        message = f"Tried to build an instance of '{qualified_name(abstract)}', but the '{name}' parameter is missing a type annotation."
+    def __init__(self, abstract: type[Any] | Callable[..., Any], name: str) -> None:
+        message = f"Tried to build an instance of '{_qualified_name(abstract)}', but the '{name}' parameter is missing a type annotation."
         super().__init__(message)
         self.add_note(
             "Either register an explicit builder function via diy.Specification.builders.add, or provide a type annotation for a type that is already known or can be automatically resolved."
@@ -146,6 +247,99 @@ class InvalidConstructorKeywordArgumentError(DiyError):
         provided: type[Any] | str,
         required: type[Any],
     ) -> None:
-        target = f"{qualified_name(abstract)}::{name}"
-        message = f"Tried to register partial builder for {target}. The builder returns '{qualified_name(provided)}', but {target} accepts '{qualified_name(required)}'!"
+        target = f"{_qualified_name(abstract)}::{name}"
+        message = f"Tried to register partial builder for {target}. The builder returns '{_qualified_name(provided)}', but {target} accepts '{_qualified_name(required)}'!"
+        super().__init__(message)
+
+
+class InvalidImportSpecifierError(DiyError):
+    """
+    Gets thrown when a builder or type was registered using an import
+    specifier, that does not refer to anything that can be imported.
+    """
+
+    def __init__(self, specifier: str, cause: Exception | None = None) -> None:
+        if cause is None:
+            message = f"'{specifier}' is not a valid import specifier. Use the form 'my.module:symbol' to refer to a symbol of a module."
+        else:
+            message = f"Failed to import '{specifier}': {cause}"
         super().__init__(message)
+        self.specifier = specifier
+
+
+class PackageNotFoundError(DiyError):
+    """
+    Gets thrown when scanning a package, that can't be found or is a plain
+    module.
+    """
+
+    def __init__(self, package: str) -> None:
+        super().__init__(
+            f"Tried to scan '{package}', but no package with that name can be found."
+        )
+        self.package = package
+
+
+class UnscannableBuilderError(DiyError):
+    """
+    Gets thrown when scanning a package, that marks a builder returning
+    something other than a class, e.g. `Thing | None`. Scanned builders are
+    registered by the import specifier of the type they build, which only
+    classes have.
+    """
+
+    def __init__(self, builder: Callable[..., Any], abstract: Any) -> None:
+        super().__init__(
+            f"Tried to scan the builder '{_qualified_name(builder)}', but it returns '{abstract!r}', which is not a class."
+        )
+        self.add_note(
+            "Remove the marker and register the builder using diy.Specification.add instead."
+        )
+        self.builder = builder
+
+
+class StaticAnalysisError(DiyError):
+    """
+    Gets thrown when a container can't be analyzed without importing it, e.g.
+    because the specifier does not refer to a container defined at the top
+    level of a module.
+    """
+
+    def __init__(self, specifier: str, reason: str) -> None:
+        super().__init__(
+            f"Tried to analyze the container '{specifier}' statically, but {reason}."
+        )
+        self.specifier = specifier
+
+
+class FrozenSpecificationError(DiyError):
+    def __init__(self) -> None:
+        super().__init__("Tried to add a builder to a frozen specification.")
+        self.add_note(
+            "Frozen specifications are immutable snapshots. Add the builder to the specification you called freeze() on, and freeze it again afterwards."
+        )
+
+
+class UnknownProfileError(DiyError):
+    """
+    Gets thrown when selecting a profile, that was never created using
+    :meth:`Specification.profile`, e.g. because of a typo.
+    """
+
+    def __init__(self, profile: str, known: Collection[str]) -> None:
+        super().__init__(
+            f"Tried to select the profile '{profile}', but the specification has no such profile."
+        )
+        self.profile = profile
+        if len(known) > 0:
+            self.add_note(f"Known profiles: {', '.join(sorted(known))}")
+
+
+class WorkerNotInitializedError(DiyError):
+    def __init__(self) -> None:
+        super().__init__(
+            "Tried to get the container of a worker, but initialize_worker() was not called in this process."
+        )
+        self.add_note(
+            "Pass initializer=initialize_worker and initargs=(container,) when creating the process pool."
+        )
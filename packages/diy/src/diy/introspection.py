@@ -0,0 +1,33 @@
+"""
+Teach diy how classes of other libraries are constructed.
+
+To plan a class, diy needs to know the parameters of its constructor. For
+dataclasses and named tuples, it reads them from their fields. Other classes
+are reflected using :func:`inspect.signature`. Libraries generating
+constructors, e.g. from the fields of a model, can instead register an
+adapter, that returns the parameters without `self`. It returns `None` for
+classes it doesn't know, so the next adapter is asked:
+
+```python
+from inspect import Parameter
+
+from diy.introspection import register_adapter
+
+
+@register_adapter
+def model_parameters(abstract: type[Any]) -> list[Parameter] | None:
+    if not issubclass(abstract, Model):
+        return None
+    return [
+        Parameter(name, Parameter.KEYWORD_ONLY, annotation=field.annotation)
+        for name, field in abstract.model_fields.items()
+    ]
+```
+
+Register adapters before planning, since types that were planned already keep
+the parameters they were planned with.
+"""
+
+from diy._internal.introspection import Adapter, register_adapter
+
+__all__ = ["Adapter", "register_adapter"]
@@ -0,0 +1,120 @@
+"""
+Inject dependencies that are only built once they are used.
+
+Components often accept dependencies they only need on rare code paths, e.g.
+a mailer for notifying admins. Annotate the parameter with :class:`Lazy` and
+diy injects a lightweight proxy instead. The dependency is only built on the
+first attribute access, so resolving the component does not pay for
+dependencies it never touches.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from diy._internal.plan import (
+        BuilderBasedResolutionPlan,
+        InferenceBasedResolutionPlan,
+    )
+
+_UNBUILT: Any = object()
+
+
+class Lazy[T]:
+    """
+    Builds an instance of `T` on first use, and forwards all attribute access
+    to it.
+
+    Like a :class:`Provider`, the plan for constructing `T` is created when
+    the component requesting it is planned, so missing dependencies are still
+    detected early. Building the instance is thread-safe, it happens exactly
+    once per proxy.
+
+    Only attribute access is forwarded, and only for names that don't start
+    with `__`. Use :func:`unwrap` to get the instance itself, e.g. to pass it
+    on or to use operators like `len()` on it. Copying or pickling the proxy
+    copies the instance along with it, if it was built already.
+
+    >>> from diy import Container
+    ...
+    >>> class Mailer:
+    ...   def __init__(self):
+    ...     print("building mailer")
+    ...
+    ...   def send(self, message):
+    ...     return f"sent {message}"
+    ...
+    >>> class Service:
+    ...   def __init__(self, mailer: Lazy[Mailer]):
+    ...     self.mailer = mailer
+    ...
+    >>> service = Container().resolve(Service)
+    >>> service.mailer.send("hello")
+    building mailer
+    'sent hello'
+    >>> service.mailer.send("again")
+    'sent again'
+    """
+
+    __slots__ = ("_diy_instance", "_diy_lock", "_diy_plan")
+
+    _diy_plan: BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T]
+
+    _diy_instance: T
+
+    _diy_lock: Lock
+
+    def __init__(
+        self,
+        plan: BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T],
+    ) -> None:
+        super().__init__()
+        self._diy_plan = plan
+        self._diy_instance = _UNBUILT
+        self._diy_lock = Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Our own attributes are missing while the proxy is being copied or
+        # unpickled. Protocols like copying and pickling also probe for
+        # special methods, which must not build the instance.
+        if name.startswith(("_diy_", "__")):
+            raise AttributeError(name)
+        return getattr(unwrap(self), name)
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        # Locks can't be copied or pickled, so each copy gets its own. Copies
+        # of a proxy that wasn't used yet build their own instance.
+        if self._diy_instance is _UNBUILT:
+            return (self._diy_plan,)
+        return (self._diy_plan, self._diy_instance)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        Lazy.__init__(self, state[0])
+        if len(state) > 1:
+            self._diy_instance = state[1]
+
+    def __repr__(self) -> str:
+        if self._diy_instance is _UNBUILT:
+            return f"Lazy({self._diy_plan.type!r})"
+        return f"Lazy({self._diy_instance!r})"
+
+
+def unwrap[T](lazy: Lazy[T]) -> T:
+    """
+    Returns the instance behind the proxy, building it if necessary.
+    """
+    # Once built, the instance never changes, so only the first accesses
+    # need to take the lock.
+    instance = lazy._diy_instance  # noqa: SLF001
+    if instance is not _UNBUILT:
+        return instance
+
+    with lazy._diy_lock:  # noqa: SLF001
+        if lazy._diy_instance is _UNBUILT:  # noqa: SLF001
+            lazy._diy_instance = lazy._diy_plan.execute()  # noqa: SLF001
+        return lazy._diy_instance  # noqa: SLF001
+
+
+__all__ = ["Lazy", "unwrap"]
@@ -0,0 +1,56 @@
+"""
+Mark builders and types, so :meth:`Specification.scan` can find them.
+
+Instead of registering everything in one large module, that has to import the
+whole application up front, mark builders and types where they are defined:
+
+```python
+from diy.markers import builder, component
+
+
+@component
+class UserService:
+    def __init__(self, repository: UserRepository) -> None: ...
+
+
+@builder
+def build_user_repository(database: Database) -> UserRepository:
+    return SqlUserRepository(database)
+```
+
+and let the specification discover them using `spec.scan("myapp.services")`.
+The markers themselves don't register anything, they only tag the function or
+class.
+"""
+
+# Every marked module imports this one, so it avoids importing typing, just
+# like the root package.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+BUILDER_MARKER = "__diy_builder__"
+
+COMPONENT_MARKER = "__diy_component__"
+
+
+def builder[F: Callable[..., Any]](function: F) -> F:
+    """
+    Marks a function as a builder for the type it returns. Like for
+    :meth:`Specification.add`, the type is taken from its return annotation.
+    """
+    setattr(function, BUILDER_MARKER, True)
+    return function
+
+
+def component[T: type[Any]](abstract: T) -> T:
+    """
+    Marks a class as part of the application, so its dependencies are
+    verified even if no builder refers to it.
+    """
+    setattr(abstract, COMPONENT_MARKER, True)
+    return abstract
+
+
+__all__ = ["builder", "component"]
@@ -0,0 +1,80 @@
+"""
+Inject factories instead of instances.
+
+Some components need lots of fresh instances of a dependency during their
+lifetime, e.g. one parser per incoming message. Instead of handing them the
+whole container, annotate the parameter with :class:`Provider` (or a plain
+`Callable[[], T]`) and diy injects a function that builds a new instance each
+time it is called.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from diy._internal.plan import (
+        BuilderBasedResolutionPlan,
+        InferenceBasedResolutionPlan,
+    )
+
+
+class Provider[T]:
+    """
+    Builds new instances of `T` every time it is called.
+
+    The plan for constructing `T` is created once, when the component that
+    requests the provider is planned. Calling the provider only executes the
+    already known plan, so it is considerably cheaper than calling
+    `container.resolve(T)` over and over again.
+
+    Since `T` is planned along with the component, a type can't request a
+    provider of itself, neither directly nor through its dependencies, e.g.
+    `Node(children: Provider[Node])`. Planning it raises a
+    :class:`~diy.errors.CircularDependencyError`. Register a builder for such
+    types, that constructs the nested instances itself.
+
+    >>> from diy import Container
+    ...
+    >>> class Parser: ...
+    ...
+    >>> class Consumer:
+    ...   def __init__(self, parsers: Provider[Parser]):
+    ...     self.parsers = parsers
+    ...
+    >>> consumer = Container().resolve(Consumer)
+    >>> isinstance(consumer.parsers(), Parser)
+    True
+    >>> consumer.parsers() is consumer.parsers()
+    False
+    >>> len(consumer.parsers.many(3))
+    3
+    """
+
+    __slots__ = ("_plan",)
+
+    _plan: BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T]
+
+    def __init__(
+        self,
+        plan: BuilderBasedResolutionPlan[..., T] | InferenceBasedResolutionPlan[T],
+    ) -> None:
+        super().__init__()
+        self._plan = plan
+
+    def __call__(self) -> T:
+        return self._plan.execute()
+
+    def many(self, amount: int) -> list[T]:
+        """
+        Builds `amount` new instances. This is a shorthand for calling the
+        provider `amount` times, each instance gets its own dependencies.
+        """
+        execute = self._plan.execute
+        return [execute() for _ in range(amount)]
+
+    def __repr__(self) -> str:
+        return f"Provider({self._plan.type!r})"
+
+
+__all__ = ["Provider"]
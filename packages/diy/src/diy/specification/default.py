@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from pathlib import Path
 from typing import Any, overload, override
 
+from diy._internal.imports import (
+    LazyBuilder,
+    PendingSpecifiers,
+    import_symbol,
+    specifier_of,
+)
 from diy._internal.validation import (
     assert_annotates_return_type,
     assert_constructor_has_parameter,
 )
+from diy.errors import UnknownProfileError
+from diy.specification.frozen import FrozenSpecification, Key
 from diy.specification.protocol import SpecificationProtocol
 
 
@@ -17,9 +26,24 @@ class Builders:
 
     _by_type: dict[type[Any], Callable[..., Any]]
 
+    _by_specifier: dict[str, str]
+    """
+    Specifiers of builders for types that were referred to by an import
+    specifier, and have not been imported yet.
+    """
+
+    _pending: PendingSpecifiers
+    """The keys of `_by_specifier`, that might refer to re-exported types."""
+
+    revision: int
+    """Incremented every time a builder is added."""
+
     def __init__(self) -> None:
         super().__init__()
         self._by_type = {}
+        self._by_specifier = {}
+        self._pending = PendingSpecifiers()
+        self.revision = 0
 
     def decorate[T](self, builder: Callable[..., T]) -> Callable[..., T]:
         """
@@ -48,8 +72,27 @@ class Builders:
         """
         abstract = assert_annotates_return_type(builder)
         self._by_type[abstract] = builder
+        self.revision += 1
         return builder
 
+    def add_lazy(self, abstract: type[Any] | str, specifier: str) -> None:
+        """
+        Registers the function or class the import specifier refers to as the
+        builder for the abstract type. Its module is only imported, once the
+        type is planned, see :class:`LazyBuilder`.
+
+        The abstract type may be an import specifier as well. Then neither is
+        imported until something requests the type. The specifier may refer
+        to the type by a module re-exporting it, e.g. `"my.package:Client"`,
+        as long as that module was imported by then.
+        """
+        if isinstance(abstract, str):
+            self._by_specifier[abstract] = specifier
+            self._pending.add(abstract)
+        else:
+            self._by_type[abstract] = LazyBuilder(abstract, specifier)
+        self.revision += 1
+
     def get[T](self, abstract: type[T]) -> Callable[..., T] | None:
         """
         Retrieve a builder function for the given abstract type.
@@ -73,11 +116,65 @@ class Builders:
         >>> instance.greet()
         Hello Ella!
         """
-        return self._by_type.get(abstract)
+        builder = self._by_type.get(abstract)
+        if builder is None and len(self._by_specifier) > 0:
+            return self._import(abstract)
+        return builder
+
+    def items(self) -> Iterator[tuple[Key, Callable[..., Any]]]:
+        """
+        All registered builders, keyed like in a :class:`FrozenSpecification`.
+
+        This imports the modules of all types that were referred to by import
+        specifiers, but not those of their lazily registered builders.
+        """
+        self._import_all()
+        for abstract, builder in self._by_type.items():
+            yield (abstract, None), builder
 
     def types(self) -> set[type[Any]]:
+        self._import_all()
         return set(self._by_type.keys())
 
+    def _import(self, abstract: type[Any]) -> Callable[..., Any] | None:
+        """
+        Moves the builder registered for the specifier of the type over, now
+        that it was imported anyways.
+        """
+        # Unions and generic aliases can't be referred to by a specifier.
+        if not isinstance(abstract, type):
+            return None
+        specifier = self._by_specifier.pop(specifier_of(abstract), None)
+        if specifier is None:
+            # It might have been referred to by a module re-exporting it.
+            self._normalize()
+            specifier = self._by_specifier.pop(specifier_of(abstract), None)
+            if specifier is None:
+                return None
+
+        # Builders registered for the type itself take precedence.
+        return self._by_type.setdefault(abstract, LazyBuilder(abstract, specifier))
+
+    def _normalize(self) -> None:
+        """
+        Re-keys builders of types, whose modules were imported already, by the
+        specifier of the module that defines the type.
+        """
+        for abstract_specifier, abstract in self._pending.imported():
+            canonical = specifier_of(abstract)
+            if (
+                canonical != abstract_specifier
+                and abstract_specifier in self._by_specifier
+            ):
+                specifier = self._by_specifier.pop(abstract_specifier)
+                self._by_specifier.setdefault(canonical, specifier)
+
+    def _import_all(self) -> None:
+        for abstract_specifier, specifier in list(self._by_specifier.items()):
+            abstract = import_symbol(abstract_specifier)
+            del self._by_specifier[abstract_specifier]
+            self._by_type.setdefault(abstract, LazyBuilder(abstract, specifier))
+
 
 class Partials:
     """
@@ -89,11 +186,26 @@ class Partials:
 
     _by_type: defaultdict[type[Any], dict[str, Callable[..., Any]]]
 
+    _by_specifier: dict[str, dict[str, Callable[..., Any]]]
+    """
+    Partial builders for types that were referred to by an import specifier,
+    and have not been imported yet.
+    """
+
+    _pending: PendingSpecifiers
+    """The keys of `_by_specifier`, that might refer to re-exported types."""
+
+    revision: int
+    """Incremented every time a partial builder is added."""
+
     def __init__(self) -> None:
         super().__init__()
         self._by_type = defaultdict(dict)
+        self._by_specifier = {}
+        self._pending = PendingSpecifiers()
+        self.revision = 0
 
-    def decorate[P](self, abstract: type[Any], name: str) -> Callable[..., Any]:
+    def decorate[P](self, abstract: type[Any] | str, name: str) -> Callable[..., Any]:
         """
         Add the given partial function for the given parameter of the given
         abstract type by decorating it.
@@ -120,24 +232,34 @@ class Partials:
         >>> instance = builder()
         >>> print(builder())
         Ella
+
+        Instead of the type, you can also pass an import specifier like
+        `"my.module:Greeter"`. The type is then only imported once it is
+        planned. The specifier may refer to the type by a module re-exporting
+        it, as long as that module was imported by then.
         """
 
-        def decorator(builder: Callable[..., P]) -> Callable[..., Callable[..., P]]:
+        def decorator(builder: Callable[..., P]) -> Callable[..., P]:
             # FIXME: This is not strictly required, until the TODO below is implemented
             assert_annotates_return_type(builder)
-            assert_constructor_has_parameter(abstract, name)
 
             # TODO: It would be really nice, if we could somehow verify, that
             # the type returned by the builder is indeed assignable to the
             # specified parameter.
             # Maybe this could be implemented as a MyPy plugin, or even with
             # some type magic based on the paramspec?
-            self._by_type[abstract][name] = builder
-
-            def inner() -> Callable[..., P]:
-                return builder  # pragma: no cover
-
-            return inner
+            if isinstance(abstract, str):
+                # We check the parameter exists, once the type is imported.
+                self._by_specifier.setdefault(abstract, {})[name] = builder
+                self._pending.add(abstract)
+            else:
+                assert_constructor_has_parameter(abstract, name)
+                self._by_type[abstract][name] = builder
+            self.revision += 1
+
+            # Returning the builder itself keeps it reachable by its qualified
+            # name, so plans using it can be stored and pickled.
+            return builder
 
         return decorator
 
@@ -145,11 +267,71 @@ class Partials:
         """
         Retrieve a bound partial builder function.
         """
-        return self._by_type[abstract].get(name)
+        # Don't use the defaultdict here, since that would insert an empty
+        # dict for every type we look up.
+        by_name = self._by_type.get(abstract)
+        if by_name is None:
+            if len(self._by_specifier) == 0:
+                return None
+            by_name = self._import(abstract)
+            if by_name is None:
+                return None
+        return by_name.get(name)
+
+    def items(self) -> Iterator[tuple[Key, Callable[..., Any]]]:
+        """
+        All registered partial builders, keyed like in a
+        :class:`FrozenSpecification`.
+
+        This imports the modules of all types that were referred to by import
+        specifiers.
+        """
+        self._import_all()
+        for abstract, by_name in self._by_type.items():
+            for name, builder in by_name.items():
+                yield (abstract, name), builder
 
     def types(self) -> set[type[Any]]:
+        self._import_all()
         return set(self._by_type.keys())
 
+    def _import(self, abstract: type[Any]) -> dict[str, Callable[..., Any]] | None:
+        """
+        Moves the partial builders registered for the specifier of the type
+        over, now that it was imported anyways.
+        """
+        by_name = self._by_specifier.pop(specifier_of(abstract), None)
+        if by_name is None:
+            # It might have been referred to by a module re-exporting it.
+            self._normalize()
+            by_name = self._by_specifier.pop(specifier_of(abstract), None)
+            if by_name is None:
+                return None
+
+        for name in by_name:
+            assert_constructor_has_parameter(abstract, name)
+        self._by_type[abstract].update(by_name)
+        return self._by_type[abstract]
+
+    def _normalize(self) -> None:
+        """
+        Re-keys partial builders of types, whose modules were imported
+        already, by the specifier of the module that defines the type.
+        """
+        for specifier, abstract in self._pending.imported():
+            canonical = specifier_of(abstract)
+            if canonical != specifier and specifier in self._by_specifier:
+                by_name = self._by_specifier.pop(specifier)
+                self._by_specifier.setdefault(canonical, {}).update(by_name)
+
+    def _import_all(self) -> None:
+        for specifier in list(self._by_specifier):
+            abstract = import_symbol(specifier)
+            # The symbol might be known under a different name.
+            by_name = self._by_specifier.pop(specifier)
+            self._by_specifier.setdefault(specifier_of(abstract), {}).update(by_name)
+            self._import(abstract)
+
 
 class Specification(SpecificationProtocol):
     """
@@ -168,6 +350,12 @@ class Specification(SpecificationProtocol):
     instructions for how they should be built.
     """
 
+    _lazily_registered_types: set[str]
+    """
+    Import specifiers of types that were explicitly registered, but have not
+    been imported yet.
+    """
+
     _implementations: dict[type, type]
     """
     Register concrete implementations for protocols or abstract base classes.
@@ -177,11 +365,20 @@ class Specification(SpecificationProtocol):
     we've already tought the container how to build.
     """
 
+    _profiles: dict[str, Specification]
+    """Bindings that only apply when their profile is selected."""
+
+    _revision: int
+    """Incremented every time a type is explicitly registered."""
+
     def __init__(self) -> None:
         super().__init__()
         self.builders = Builders()
         self.partials = Partials()
         self._explicitly_registered_types = set()
+        self._lazily_registered_types = set()
+        self._profiles = {}
+        self._revision = 0
 
     @overload
     def add[T](self, builder: Callable[..., T]) -> Callable[..., T]:
@@ -206,18 +403,37 @@ class Specification(SpecificationProtocol):
         constructors.
         """
 
+    @overload
+    def add(self, builder: str, name: str) -> Callable[..., Any]:
+        """
+        Mark the function as a supplier for the named constructor parameter of
+        the type, that the import specifier refers to.
+        """
+
+    @overload
+    def add(self, builder: str) -> None:
+        """
+        Tell the container, that the type the import specifier refers to
+        exists, without importing it yet.
+        """
+
     @override
     def add[T](
-        self, builder: Callable[..., Any] | type[T], name: str | None = None
+        self, builder: Callable[..., Any] | type[T] | str, name: str | None = None
     ) -> Callable[..., T] | Callable[..., Any] | None:
         if name is None:
             if isinstance(builder, type):
                 self._explicitly_registered_types.add(builder)
+                self._revision += 1
+                return None
+            if isinstance(builder, str):
+                self._lazily_registered_types.add(builder)
+                self._revision += 1
                 return None
             if callable(builder):
                 return self.builders.decorate(builder)
 
-        if isinstance(builder, type) and isinstance(name, str):
+        if isinstance(builder, type | str) and isinstance(name, str):
             return self.partials.decorate(builder, name)
 
         message = (
@@ -225,6 +441,95 @@ class Specification(SpecificationProtocol):
         )
         raise TypeError(message)
 
+    @override
+    def add_lazy(self, abstract: type[Any] | str, specifier: str) -> None:
+        """
+        Registers a builder for the abstract type by its import specifier, e.g.
+        `"my.module:build_client"`. The specifier may also refer to a class
+        implementing the abstract type. Either way, the module is only
+        imported once the type is planned.
+
+        >>> from diy import Container
+        >>> from fractions import Fraction
+        ...
+        >>> container = Container()
+        >>> container.add_lazy(Fraction, "fractions:Fraction")
+        >>> container.resolve(Fraction)
+        Fraction(0, 1)
+        """
+        self.builders.add_lazy(abstract, specifier)
+
+    def scan(self, package: str, index: str | Path | None = None) -> int:
+        """
+        Registers all builders and types marked using :mod:`diy.markers` in
+        the modules of the package, and returns how many it found.
+
+        The package is scanned without importing it. Builders are registered
+        lazily by their import specifiers, so their modules are only imported
+        once the types they build are planned. The results are kept in an
+        index in the `__pycache__` directory of the package, so later scans
+        only look at files that changed since. Pass `index` to keep it
+        elsewhere.
+
+        Builders work out the type they build from their return annotation,
+        like with :meth:`Builders.decorate`. It has to refer to a class, since
+        builders are registered by its import specifier. Where the annotation
+        can't be resolved without running the module, e.g. since it uses a
+        type alias, the module is imported during the scan.
+        """
+        from diy._internal.scanning import scan_package
+
+        result = scan_package(package, index)
+        for abstract, builder in result.builders:
+            self.builders.add_lazy(abstract, builder)
+        for component in result.components:
+            self.add(component)
+        return len(result.builders) + len(result.components)
+
+    def profile(self, name: str) -> Specification:
+        """
+        Returns the specification for bindings that only apply, when the
+        profile with the given name is selected, e.g. `"prod"` or `"test"`.
+        They take precedence over the bindings of this specification. The
+        profile is created, if it doesn't exist yet.
+
+        Bindings of profiles that are not selected are never planned, so
+        registering their builders lazily keeps their modules from being
+        imported at all.
+
+        >>> from diy import Container, Specification
+        ...
+        >>> class Greeter:
+        ...   def __init__(self, name: str):
+        ...     self.name = name
+        ...
+        >>> spec = Specification()
+        >>> @spec.add(Greeter, "name")
+        ... def build_name() -> str:
+        ...   return "Ella"
+        ...
+        >>> @spec.profile("test").add(Greeter, "name")
+        ... def build_test_name() -> str:
+        ...   return "Test User"
+        ...
+        >>> Container(spec).resolve(Greeter).name
+        'Ella'
+        >>> Container(spec, profile="test").resolve(Greeter).name
+        'Test User'
+        """
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = self._profiles[name] = Specification()
+        return profile
+
+    def select(self, profile: str) -> ProfileSpecification:
+        """
+        Returns a view of this specification, with the bindings of the given
+        profile applied on top. Raises an :class:`UnknownProfileError`, if the
+        profile was never created using :meth:`profile`.
+        """
+        return ProfileSpecification(self, profile)
+
     @override
     def get(
         self, abstract: type[Any], name: str | None = None
@@ -234,12 +539,156 @@ class Specification(SpecificationProtocol):
 
         return self.partials.get(abstract, name)
 
+    @property
+    @override
+    def revision(self) -> int:
+        return self._revision + self.builders.revision + self.partials.revision
+
     @override
     def types(self) -> set[type[Any]]:
+        """
+        All types this specification knows about. This imports the modules of
+        all types that were referred to by import specifiers, but not those of
+        lazily registered builders.
+        """
         types = self.builders.types()
         types.update(self.partials.types())
-        types.update(self._explicitly_registered_types)
+        types.update(self._import_types())
         return types
 
+    @override
+    def freeze(self, profile: str | None = None) -> FrozenSpecification:
+        """
+        Returns an immutable snapshot of the current state of the
+        specification. Pass a `profile` to apply its bindings on top.
+
+        Like :meth:`types`, this imports the modules of all types that were
+        referred to by import specifiers. Containers that freeze or verify
+        their specification, like the :class:`VerifyingContainer` or ones
+        storing their plans, therefore import them up front. Builders
+        registered using :meth:`add_lazy` are only imported once planned.
+        """
+        index = self._index()
+        types = set(self._import_types())
+        if profile is not None:
+            selected = self._existing_profile(profile)
+            index.update(selected._index())  # noqa: SLF001
+            types.update(selected._import_types())  # noqa: SLF001
+        return FrozenSpecification(index, types)
+
+    def _existing_profile(self, name: str) -> Specification:
+        profile = self._profiles.get(name)
+        if profile is None:
+            raise UnknownProfileError(name, self._profiles.keys())
+        return profile
+
+    def _index(self) -> dict[Key, Callable[..., Any]]:
+        index = dict(self.builders.items())
+        index.update(self.partials.items())
+        return index
+
+    def _import_types(self) -> set[type[Any]]:
+        while self._lazily_registered_types:
+            specifier = self._lazily_registered_types.pop()
+            self._explicitly_registered_types.add(import_symbol(specifier))
+        return self._explicitly_registered_types
+
+
+class ProfileSpecification(SpecificationProtocol):
+    """
+    A view of a specification with the bindings of one of its profiles
+    applied on top, see :meth:`Specification.profile`.
+
+    The profile is selected once, so looking up a builder costs at most one
+    additional dictionary access. Bindings added to the specification or the
+    profile later on are still visible. Bindings added to the view are added
+    to the profile.
+    """
+
+    base: Specification
+
+    name: str
+    """The name of the selected profile."""
+
+    _selected: Specification
+
+    def __init__(self, base: Specification, name: str) -> None:
+        super().__init__()
+        self.base = base
+        self.name = name
+        self._selected = base._existing_profile(name)  # noqa: SLF001
+
+    @overload
+    def add[T](self, builder: Callable[..., T]) -> Callable[..., T]:
+        """
+        Mark an existing function as a builder for an abstract type.
+        """
+
+    @overload
+    def add[T](self, builder: type[T], name: str) -> Callable[..., T]:
+        """
+        Mark the function as a supplier for the named constructor parameter of
+        the given type.
+        """
+
+    @overload
+    def add(self, builder: type[Any]) -> None:
+        """
+        Simply tell the container, that this type exists.
+
+        This helps containers to verify that this type should be "buildable" in
+        the future. This means that all its parameters should have known
+        constructors.
+        """
+
+    @overload
+    def add(self, builder: str, name: str) -> Callable[..., Any]:
+        """
+        Mark the function as a supplier for the named constructor parameter of
+        the type, that the import specifier refers to.
+        """
+
+    @overload
+    def add(self, builder: str) -> None:
+        """
+        Tell the container, that the type the import specifier refers to
+        exists, without importing it yet.
+        """
+
+    @override
+    def add[T](
+        self, builder: Callable[..., Any] | type[T] | str, name: str | None = None
+    ) -> Callable[..., Any] | None:
+        return self._selected.add(builder, name)  # type: ignore
+
+    @override
+    def add_lazy(self, abstract: type[Any] | str, specifier: str) -> None:
+        self._selected.add_lazy(abstract, specifier)
+
+    @override
+    def get(
+        self, abstract: type[Any], name: str | None = None
+    ) -> Callable[..., Any] | None:
+        builder = self._selected.get(abstract, name)
+        if builder is None:
+            return self.base.get(abstract, name)
+        return builder
+
+    @property
+    @override
+    def revision(self) -> int:
+        return self.base.revision + self._selected.revision
+
+    @override
+    def types(self) -> set[type[Any]]:
+        return self.base.types() | self._selected.types()
+
+    @override
+    def freeze(self) -> FrozenSpecification:
+        return self.base.freeze(self.name)
+
+    def __repr__(self) -> str:
+        return f"ProfileSpecification({self.name!r})"
+
 
-__all__ = ["Specification"]
+__all__ = ["ProfileSpecification", "Specification"]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections.abc import Callable, ItemsView, Iterable, Mapping, Set
+from types import MappingProxyType
+from typing import Any, Never, override
+
+from diy.errors import FrozenSpecificationError
+from diy.specification.protocol import SpecificationProtocol
+
+type Key = tuple[type[Any], str | None]
+"""The abstract type and, for partial builders, the name of the parameter."""
+
+
+class FrozenSpecification(SpecificationProtocol):
+    """
+    An immutable snapshot of a specification, see
+    :meth:`SpecificationProtocol.freeze`.
+
+    All builders are kept in a single flat index, so looking one up is a single
+    dictionary access. Since the snapshot never changes, it can be shared
+    between threads without locking, and containers using equal snapshots can
+    share everything they derived from them.
+
+    >>> from diy import Specification
+    ...
+    >>> class Greeter:
+    ...   def __init__(self, name: str):
+    ...     self.name = name
+    ...
+    >>> spec = Specification()
+    >>> @spec.add(Greeter, "name")
+    ... def build_name() -> str:
+    ...   return "Ella"
+    ...
+    >>> frozen = spec.freeze()
+    >>> frozen.get(Greeter, "name")()
+    'Ella'
+    >>> frozen.fingerprint == spec.freeze().fingerprint
+    True
+    """
+
+    _index: Mapping[Key, Callable[..., Any]]
+
+    _types: frozenset[type[Any]]
+
+    fingerprint: str
+    """
+    Identifies the contents of the snapshot. It depends on the qualified names
+    of the registered types and builders, so it is stable between processes.
+    Local classes and functions, e.g. closures, can share their qualified
+    name with others, so they are identified by the object instead. Snapshots
+    containing them therefore get a different fingerprint in each process.
+    """
+
+    def __init__(
+        self,
+        index: Mapping[Key, Callable[..., Any]],
+        types: Iterable[type[Any]] = (),
+    ) -> None:
+        super().__init__()
+        self._index = MappingProxyType(dict(index))
+        self._types = frozenset(types).union(abstract for abstract, _ in index)
+        self.fingerprint = _fingerprint(self._index, self._types)
+
+    @override
+    def add[T](
+        self, builder: Callable[..., Any] | type[T], name: str | None = None
+    ) -> Never:
+        raise FrozenSpecificationError
+
+    @override
+    def add_lazy(self, abstract: type[Any] | str, specifier: str) -> Never:
+        raise FrozenSpecificationError
+
+    @override
+    def get[T](
+        self, abstract: type[T], name: str | None = None
+    ) -> Callable[..., T] | None:
+        return self._index.get((abstract, name))
+
+    @property
+    @override
+    def revision(self) -> int:
+        return 0
+
+    @override
+    def types(self) -> frozenset[type[Any]]:
+        return self._types
+
+    def items(self) -> ItemsView[Key, Callable[..., Any]]:
+        """
+        All builders, keyed by the type and, for partial builders, the name of
+        the parameter.
+        """
+        return self._index.items()
+
+    @override
+    def freeze(self) -> FrozenSpecification:
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenSpecification):
+            return NotImplemented
+        return (
+            self.fingerprint == other.fingerprint
+            and self._index == other._index
+            and self._types == other._types
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Mapping proxies can't be pickled.
+        return (FrozenSpecification, (dict(self._index), self._types))
+
+    def __repr__(self) -> str:
+        return f"FrozenSpecification({self.fingerprint[:12]})"
+
+
+def _fingerprint(index: Mapping[Key, Callable[..., Any]], types: Set[type[Any]]) -> str:
+    entries = sorted(
+        f"{_qualify(abstract)}:{name or ''}={_qualify(builder)}"
+        for (abstract, name), builder in index.items()
+    )
+    entries.extend(sorted(_qualify(abstract) for abstract in types))
+    # Most processes never freeze a specification, so don't make all of them
+    # pay for importing hashlib.
+    from hashlib import sha256
+
+    return sha256("\n".join(entries).encode()).hexdigest()
+
+
+def _qualify(subject: Any) -> str:
+    module = getattr(subject, "__module__", None)
+    name = getattr(subject, "__qualname__", None) or repr(subject)
+    if "<locals>" in name or "<lambda>" in name:
+        return f"{module}.{name}@{id(subject):x}"
+    return f"{module}.{name}"
+
+
+__all__ = ["FrozenSpecification"]
@@ -1,6 +1,12 @@
 from abc import abstractmethod
-from collections.abc import Callable
-from typing import Any, Protocol, overload, runtime_checkable
+from collections.abc import Callable, Set
+from itertools import count
+from typing import TYPE_CHECKING, Any, Protocol, overload, runtime_checkable
+
+from diy._internal.imports import LazyBuilder, import_symbol
+
+if TYPE_CHECKING:
+    from diy.specification.frozen import FrozenSpecification
 
 
 @runtime_checkable
@@ -72,11 +78,77 @@ class SpecificationProtocol(Protocol):
     # ) -> None:
     #     pass
 
+    @property
+    def revision(self) -> int:
+        """
+        A number that changes every time something is added to the
+        specification.
+
+        This allows consumers to cache information derived from the
+        specification, and to invalidate it once the specification changes.
+
+        Specifications that don't track their changes report a new revision
+        every time, so nothing derived from them is cached.
+        """
+        return next(_untracked_revisions)
+
+    def add_lazy(self, abstract: type[Any] | str, specifier: str) -> None:
+        """
+        Registers a builder for the abstract type by its import specifier, e.g.
+        `"my.module:build_client"`, so its module is only imported once the
+        type is planned. The abstract type may be given as a specifier too.
+
+        Specifications that don't implement this add the builder right away,
+        which imports both modules.
+        """
+        resolved = import_symbol(abstract) if isinstance(abstract, str) else abstract
+        self.add(LazyBuilder(resolved, specifier))
+
     @abstractmethod
-    def types(self) -> set[type[Any]]:
+    def types(self) -> Set[type[Any]]:
+        """
+        All types the specification knows about, either because there is a
+        builder for them, or because they were explicitly added.
         """
-        TODO:
+
+    def freeze(self) -> "FrozenSpecification":
         """
+        Returns an immutable snapshot of the current state of the
+        specification.
+
+        Adding builders afterwards does not affect the snapshot. Containers
+        created from equal snapshots share the plans they computed.
+
+        Specifications that don't implement this are asked for the builder of
+        each of their types, and for partial builders of each parameter of its
+        constructor.
+        """
+        from diy._internal.introspection import constructor_signature
+        from diy._internal.signatures import LazySignature
+        from diy.specification.frozen import FrozenSpecification
+
+        types = set(self.types())
+        index: dict[tuple[type[Any], str | None], Callable[..., Any]] = {}
+        for abstract in types:
+            builder = self.get(abstract)
+            if builder is not None:
+                index[abstract, None] = builder
+
+            try:
+                sig = constructor_signature(abstract) or LazySignature(
+                    abstract.__init__
+                )
+            except (TypeError, ValueError):
+                # Some builtins don't tell their parameters.
+                continue
+            for name in sig.parameters:
+                partial = self.get(abstract, name)
+                if partial is not None:
+                    index[abstract, name] = partial
+        return FrozenSpecification(index, types)
+
 
+_untracked_revisions = count()
+"""The revisions of specifications, that don't track their changes."""
 
 __all__ = ["SpecificationProtocol"]
@@ -0,0 +1,22 @@
+"""
+Find everything that prevents the types of a specification from being built,
+e.g. in a test or in CI, instead of stopping at the first problem like a
+:class:`~diy.container.verifying.VerifyingContainer` does.
+
+>>> from diy import Specification
+>>> from diy.verification import check_specification
+...
+>>> class Greeter:
+...   def __init__(self, name):
+...     self.name = name
+...
+>>> spec = Specification()
+>>> spec.add(Greeter)
+>>> report = check_specification(spec)
+>>> [problem.path for problem in report.problems]
+[('name',)]
+"""
+
+from diy._internal.verification import Problem, VerificationReport, check_specification
+
+__all__ = ["Problem", "VerificationReport", "check_specification"]
@@ -0,0 +1,52 @@
+"""
+Share a container with the workers of a process pool.
+
+Containers, specifications and the plans they created can be pickled. Plans
+are pickled by the qualified names of the types and builders they reference,
+so a worker receiving a container that already resolved its types doesn't
+have to plan them again. Pass the container to :func:`initialize_worker`
+once per worker, instead of with every task:
+
+```python
+from concurrent.futures import ProcessPoolExecutor
+
+from diy.workers import initialize_worker, worker_container
+
+
+def handle(order_id: int) -> None:
+    worker_container().resolve(OrderService).handle(order_id)
+
+
+with ProcessPoolExecutor(initializer=initialize_worker, initargs=(container,)) as pool:
+    pool.map(handle, order_ids)
+```
+
+Like functions passed to a pool, the types and builders of the container
+need to be defined at the top level of a module, so the workers can import
+them by their qualified names.
+"""
+
+from diy.container.protocol import ContainerProtocol
+from diy.errors import WorkerNotInitializedError
+
+_container: ContainerProtocol | None = None
+"""The container of this worker process."""
+
+
+def initialize_worker(container: ContainerProtocol) -> None:
+    """
+    Makes the container available to the tasks running in this process. Pass
+    it as the `initializer` of a process pool.
+    """
+    global _container
+    _container = container
+
+
+def worker_container() -> ContainerProtocol:
+    """
+    Returns the container that was passed to :func:`initialize_worker` in this
+    process.
+    """
+    if _container is None:
+        raise WorkerNotInitializedError
+    return _container
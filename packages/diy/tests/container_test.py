@@ -266,3 +266,33 @@ def test_it_supplies_nested_builders_with_args_from_the_container() -> None:
     instance = container.resolve(ConsumesApiClient)
 
     assert instance.api.base == "test"
+
+
+def test_try_resolve_returns_none_for_unresolvable_types() -> None:
+    container = Container()
+
+    assert container.try_resolve(Greeter) is None
+
+
+def test_try_resolve_returns_instances_of_resolvable_types() -> None:
+    container = Container()
+
+    @container.add(Greeter, "name")
+    def build_greeter_name() -> str:
+        return "foo"
+
+    greeter = container.try_resolve(Greeter)
+    assert isinstance(greeter, Greeter)
+    assert greeter.name == "foo"
+
+
+def test_try_resolve_does_not_swallow_errors_of_builders() -> None:
+    container = Container()
+
+    @container.add
+    def build_api_client() -> ApiClient:
+        message = "Something went wrong"
+        raise RuntimeError(message)
+
+    with pytest.raises(RuntimeError):
+        container.try_resolve(ApiClient)
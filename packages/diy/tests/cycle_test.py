@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal.display import print_cycle
+from diy._internal.verification import verify_specification
+from diy.errors import CircularDependencyError
+from diy.provider import Provider
+
+
+class Chicken:
+    def __init__(self, egg: Egg) -> None: ...
+
+
+class Egg:
+    def __init__(self, chicken: Chicken) -> None: ...
+
+
+class Farm:
+    def __init__(self, chicken: Chicken) -> None: ...
+
+
+class Snake:
+    def __init__(self, snake: Snake) -> None: ...
+
+
+class Parent:
+    def __init__(self, child: Child) -> None:
+        super().__init__()
+        self.child = child
+
+
+class Child:
+    def __init__(self, parent: Parent | None) -> None:
+        super().__init__()
+        self.parent = parent
+
+
+class Factory:
+    def __init__(self, factories: Provider[Factory]) -> None: ...
+
+
+def test_it_detects_cycles_between_types() -> None:
+    with pytest.raises(CircularDependencyError) as error:
+        Container().resolve(Farm)
+
+    assert [abstract for _, abstract in error.value.cycles[0]] == [
+        Chicken,
+        Egg,
+        Chicken,
+    ]
+
+
+def test_it_detects_types_requiring_themselves() -> None:
+    with pytest.raises(CircularDependencyError):
+        Container().resolve(Snake)
+
+
+def test_it_detects_cycles_through_builders() -> None:
+    container = Container()
+
+    @container.add
+    def build_egg(chicken: Chicken) -> Egg:
+        return Egg(chicken)
+
+    with pytest.raises(CircularDependencyError):
+        container.resolve(Chicken)
+
+
+def test_it_detects_cycles_through_providers() -> None:
+    with pytest.raises(CircularDependencyError):
+        Container().resolve(Factory)
+
+
+def test_optional_parameters_break_cycles() -> None:
+    parent = Container().resolve(Parent)
+
+    assert parent.child.parent is None
+
+
+def test_cycles_are_displayed_like_plans() -> None:
+    cycle = [(None, Chicken), ("egg", Egg), ("chicken", Chicken)]
+
+    assert print_cycle(cycle, ansi=False) == (
+        "tests.cycle_test:Chicken\n"
+        "└─egg: tests.cycle_test:Egg\n"
+        "   └─chicken: tests.cycle_test:Chicken <- circular"
+    )
+
+
+def test_verification_reports_all_cycles_at_once() -> None:
+    spec = Specification()
+    spec.add(Chicken)
+    spec.add(Egg)
+    spec.add(Farm)
+    spec.add(Snake)
+
+    with pytest.raises(CircularDependencyError) as error:
+        verify_specification(spec)
+
+    assert len(error.value.cycles) == 2
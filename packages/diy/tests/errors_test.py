@@ -0,0 +1,55 @@
+import traceback
+
+import pytest
+
+from diy import Container
+from diy.errors import FailedToInferDependencyError, UnresolvableDependencyError
+
+
+class Greeter:
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+class Consumer:
+    def __init__(self, greeter: Greeter) -> None:
+        super().__init__()
+        self.greeter = greeter
+
+
+def test_plans_are_only_rendered_once_the_error_is_displayed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rendered = 0
+
+    def print_resolution_plan(*args: object) -> str:
+        nonlocal rendered
+        rendered += 1
+        return "<plan>"
+
+    monkeypatch.setattr(
+        "diy._internal.display.print_resolution_plan", print_resolution_plan
+    )
+
+    with pytest.raises(FailedToInferDependencyError) as exception:
+        Container().resolve(Consumer)
+
+    assert rendered == 0
+
+    displayed = "".join(traceback.format_exception(exception.value))
+    assert "<plan>" in displayed
+    assert rendered == 1
+
+    traceback.format_exception(exception.value)
+    assert rendered == 1
+
+
+def test_lazy_notes_can_be_extended() -> None:
+    error = UnresolvableDependencyError(Greeter, [Consumer])
+    error.add_note("Another note")
+
+    assert error.__notes__ == [
+        "Known types are:\n- tests.errors_test:Consumer",
+        "Another note",
+    ]
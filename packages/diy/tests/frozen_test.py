@@ -0,0 +1,89 @@
+import pytest
+
+from diy import Container, Specification
+from diy.container.runtime import RuntimeContainer
+from diy.errors import FrozenSpecificationError
+
+
+class Greeter:
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+class Service:
+    def __init__(self, greeter: Greeter) -> None:
+        super().__init__()
+        self.greeter = greeter
+
+
+def spec() -> Specification:
+    spec = Specification()
+
+    @spec.add(Greeter, "name")
+    def build_name() -> str:
+        return "Ella"
+
+    return spec
+
+
+def test_frozen_specs_contain_all_builders_and_types() -> None:
+    mutable = spec()
+    mutable.add(Service)
+
+    frozen = mutable.freeze()
+
+    assert frozen.types() == frozenset({Greeter, Service})
+    assert frozen.get(Greeter) is None
+    assert frozen.get(Greeter, "name") is mutable.get(Greeter, "name")
+
+
+def test_frozen_specs_do_not_change_with_the_original() -> None:
+    mutable = spec()
+    frozen = mutable.freeze()
+
+    @mutable.add
+    def build_greeter() -> Greeter:
+        return Greeter("Bob")
+
+    assert frozen.get(Greeter) is None
+    assert frozen.fingerprint != mutable.freeze().fingerprint
+
+
+def test_frozen_specs_can_not_be_changed() -> None:
+    frozen = spec().freeze()
+
+    with pytest.raises(FrozenSpecificationError):
+        frozen.add(Service)
+
+
+def test_fingerprints_are_stable() -> None:
+    mutable = spec()
+
+    assert mutable.freeze().fingerprint == mutable.freeze().fingerprint
+    assert mutable.freeze() == mutable.freeze()
+
+
+def test_local_builders_with_the_same_name_have_different_fingerprints() -> None:
+    first, second = spec(), spec()
+
+    assert first.freeze().fingerprint != second.freeze().fingerprint
+    assert first.freeze() != second.freeze()
+
+
+def test_looking_up_partials_does_not_register_types() -> None:
+    mutable = Specification()
+
+    assert mutable.get(Greeter, "name") is None
+    assert mutable.types() == set()
+
+
+def test_containers_with_equal_snapshots_share_plans() -> None:
+    mutable = spec()
+    first = RuntimeContainer(mutable.freeze())
+    second = Container(mutable.freeze())
+
+    assert first.resolve(Service).greeter.name == "Ella"
+    assert second.resolve(Service).greeter.name == "Ella"
+    assert first._planner is second._planner  # noqa: SLF001
+    assert first._planner.plan(Service) is second._planner.plan(Service)  # noqa: SLF001
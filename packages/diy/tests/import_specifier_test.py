@@ -0,0 +1,137 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Protocol
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal import imports
+from diy._internal.imports import import_symbol
+from diy.errors import InvalidImportSpecifierError
+
+
+class Clock(Protocol):
+    def now(self) -> int: ...
+
+
+class Calendar:
+    pass
+
+
+MODULE = """
+class SystemClock:
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+
+    def now(self) -> int:
+        return 1000 + self.offset
+
+
+def build_clock() -> SystemClock:
+    return SystemClock(offset=1)
+"""
+
+
+@pytest.fixture()
+def module(tmp_path: Path, request: pytest.FixtureRequest) -> Iterator[str]:
+    """A module that is not imported yet, and is forgotten after the test."""
+    name = f"clocks_{request.node.name}"
+    (tmp_path / f"{name}.py").write_text(MODULE)
+    sys.path.insert(0, str(tmp_path))
+    yield name
+    sys.path.remove(str(tmp_path))
+    sys.modules.pop(name, None)
+
+
+def test_it_imports_lazy_builders_once_they_are_planned(module: str) -> None:
+    container = Container()
+    container.add_lazy(Clock, f"{module}:build_clock")
+    assert module not in sys.modules
+
+    assert container.resolve(Clock).now() == 1001
+    assert module in sys.modules
+
+
+def test_it_plans_lazily_registered_implementations(module: str) -> None:
+    container = Container()
+    container.add_lazy(Clock, f"{module}:SystemClock")
+
+    @container.add(f"{module}:SystemClock", "offset")
+    def build_offset() -> int:
+        return 2
+
+    assert module not in sys.modules
+    assert container.resolve(Clock).now() == 1002
+
+
+def test_types_import_types_referred_to_by_specifiers(module: str) -> None:
+    spec = Specification()
+
+    @spec.add(f"{module}:SystemClock", "offset")
+    def build_offset() -> int:
+        return 2
+
+    assert module not in sys.modules
+    assert [abstract.__name__ for abstract in spec.types()] == ["SystemClock"]
+
+
+def test_it_raises_for_specifiers_it_cant_import() -> None:
+    container = Container()
+    container.add_lazy(Clock, "tests.missing_module:build_clock")
+
+    with pytest.raises(InvalidImportSpecifierError):
+        container.resolve(Clock)
+
+
+@pytest.fixture()
+def package(module: str, tmp_path: Path) -> Iterator[str]:
+    """A package re-exporting the module's types, forgotten after the test."""
+    name = f"re_{module}"
+    (tmp_path / name).mkdir()
+    (tmp_path / name / "__init__.py").write_text(f"from {module} import SystemClock\n")
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_it_finds_types_by_the_specifier_of_a_re_export(
+    module: str, package: str
+) -> None:
+    container = Container()
+    container.add_lazy(f"{package}:SystemClock", f"{module}:build_clock")
+    system_clock = import_symbol(f"{package}:SystemClock")
+
+    assert container.resolve(system_clock).now() == 1001
+
+
+def test_it_finds_partials_by_the_specifier_of_a_re_export(package: str) -> None:
+    spec = Specification()
+
+    @spec.add(f"{package}:SystemClock", "offset")
+    def build_offset() -> int:
+        return 2
+
+    system_clock = import_symbol(f"{package}:SystemClock")
+    assert spec.get(system_clock, "offset") is build_offset
+    assert Container(spec).resolve(system_clock).now() == 1002
+
+
+def test_lookups_only_check_specifiers_again_after_imports(
+    module: str, package: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    checked: list[str] = []
+    monkeypatch.setattr(
+        imports, "imported_symbol", lambda specifier: checked.append(specifier)
+    )
+    spec = Specification()
+    for index in range(100):
+        spec.add_lazy(f"{module}:Missing{index}", f"{module}:build_clock")
+
+    for _ in range(10):
+        assert spec.get(Calendar) is None
+    assert len(checked) == 100
+
+    monkeypatch.undo()
+    spec.add_lazy(f"{package}:SystemClock", f"{module}:build_clock")
+    system_clock = import_symbol(f"{package}:SystemClock")
+    assert spec.get(system_clock) is not None
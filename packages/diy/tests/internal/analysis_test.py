@@ -0,0 +1,217 @@
+import re
+import sys
+from collections.abc import Iterator
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from diy._internal.analysis import analyze_container
+from diy._internal.display import print_resolution_plan, qualified_name
+from diy._internal.verification import check_specification
+from diy.errors import StaticAnalysisError
+from diy.specification.protocol import SpecificationProtocol
+
+SERVICES = """
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, Protocol
+
+from diy.lazy import Lazy
+from diy.provider import Provider
+
+
+class Mailer(Protocol):
+    def send(self, to: str) -> None: ...
+
+
+class SmtpMailer:
+    def __init__(self, host: str, port: int = 25) -> None:
+        self.host = host
+
+
+class FakeMailer:
+    pass
+
+
+@dataclass
+class Settings:
+    debug: bool = False
+    tags: list[str] = field(default_factory=list)
+
+
+class Endpoint(NamedTuple):
+    settings: Settings
+    port: int = 80
+
+
+class Database:
+    def __init__(self, url: str, settings: Settings, endpoint: Endpoint) -> None:
+        self.url = url
+
+
+class Cache:
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+
+class Repository:
+    def __init__(self, database: "Database", cache: Optional[Cache]) -> None:
+        self.database = database
+
+
+class Audit:
+    def __init__(self, *, database: Database, level: int) -> None:
+        self.database = database
+
+
+class Checkout:
+    def __init__(
+        self, repository: Repository, mailer: Lazy[Mailer], audit: Provider[Audit]
+    ) -> None:
+        self.repository = repository
+"""
+
+CONTAINER = """
+from os import environ
+
+from diy import Container, Specification
+
+from .services import Audit, Checkout, Database, Mailer
+
+SMTP_MAILER = "{package}.services:SmtpMailer"
+
+spec = Specification()
+spec.add(Checkout)
+spec.add("{package}.services:Repository")
+spec.add_lazy(Mailer, SMTP_MAILER)
+spec.profile("test").add_lazy(Mailer, "{package}.services:FakeMailer")
+
+
+@spec.add(Database, "url")
+def build_url() -> str:
+    return "sqlite://"
+
+
+@spec.add(SMTP_MAILER, "host")
+def build_host() -> str:
+    return "localhost"
+
+
+dev = spec.profile("dev")
+
+
+@dev.add
+def build_database() -> Database:
+    return Database("sqlite://dev", None, None)
+
+
+for name in ["level"]:
+    spec.add(Audit, name)(lambda: 1)
+
+container = Container(spec, profile=environ.get("SHOP_PROFILE", "dev"))
+
+raise SystemExit("must not be executed by the analysis")
+"""
+
+
+@pytest.fixture()
+def package(tmp_path: Path, request: pytest.FixtureRequest) -> Iterator[str]:
+    """A package that is not imported yet, and is forgotten after the test."""
+    name = re.sub(r"\W", "_", f"analyzed_{request.node.name}")
+    root = tmp_path / name
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "services.py").write_text(SERVICES)
+    (root / "container.py").write_text(CONTAINER.format(package=name))
+
+    sys.path.insert(0, str(tmp_path))
+    yield name
+    sys.path.remove(str(tmp_path))
+    for module in list(sys.modules):
+        if module.partition(".")[0] == name:
+            del sys.modules[module]
+
+
+def plans(spec: SpecificationProtocol) -> dict[str, str]:
+    report = check_specification(spec)
+    return {
+        qualified_name(abstract): print_resolution_plan(plan, ansi=False)
+        for abstract, plan in report.plans.items()
+    }
+
+
+def problems(spec: SpecificationProtocol) -> list[str]:
+    report = check_specification(spec)
+    return sorted(f"{problem.location}: {problem.error}" for problem in report.problems)
+
+
+def runtime_spec(package: str, profile: str) -> SpecificationProtocol:
+    """Imports the container the way the analysis sees it."""
+    source = (Path(sys.path[0]) / package / "container.py").read_text()
+    # The registrations in the loop are skipped by the analysis.
+    source = source.replace('for name in ["level"]:', "for name in []:")
+    source = source.removesuffix(
+        'raise SystemExit("must not be executed by the analysis")\n'
+    )
+    (Path(sys.path[0]) / package / "container.py").write_text(source)
+    module = import_module(f"{package}.container")
+    return module.spec.select(profile)
+
+
+@pytest.mark.parametrize("profile", ["dev", "test"])
+def test_it_plans_like_the_imported_container(package: str, profile: str) -> None:
+    analysis = analyze_container(
+        f"{package}.container:container",
+        profile=None if profile == "dev" else profile,
+    )
+
+    assert analysis.profile == profile
+    assert f"{package}.container" not in sys.modules
+    assert f"{package}.services" not in sys.modules
+
+    spec = runtime_spec(package, profile)
+    assert plans(analysis.spec) == plans(spec)
+    assert problems(analysis.spec) == problems(spec)
+
+
+def test_it_reports_what_it_could_not_follow(package: str) -> None:
+    analysis = analyze_container(f"{package}.container:spec")
+
+    assert analysis.profile is None
+    assert analysis.skipped == [
+        "for name in ['level']: registrations in compound statements can't be analyzed statically"
+    ]
+    assert analysis.unresolved == []
+
+    (Path(sys.path[0]) / package / "container.py").write_text(
+        CONTAINER.format(package=package)
+        + "\nspec.scan('elsewhere')\n"
+        + "\nclass Unknown:\n    def __init__(self, peer: missing.Peer) -> None: ...\n"
+        + "\nspec.add(Unknown)\n"
+    )
+    analysis = analyze_container(f"{package}.container:spec")
+
+    assert analysis.skipped[1:] == [
+        "spec.scan('elsewhere'): it can't be analyzed statically"
+    ]
+    assert analysis.unresolved == [f"{package}.container:Unknown -> peer: missing.Peer"]
+
+
+def test_it_only_parses_files_that_changed(package: str, tmp_path: Path) -> None:
+    cache = tmp_path / "cache"
+    specifier = f"{package}.container:container"
+
+    assert analyze_container(specifier, cache=cache).parsed == 2
+    analysis = analyze_container(specifier, cache=cache)
+    assert (analysis.files, analysis.parsed) == (2, 0)
+
+    (tmp_path / package / "services.py").write_text(SERVICES + "\n# changed\n")
+    assert analyze_container(specifier, cache=cache).parsed == 1
+
+
+def test_it_rejects_containers_it_cannot_find(package: str) -> None:
+    with pytest.raises(StaticAnalysisError):
+        analyze_container(f"{package}.container:missing")
+
+    with pytest.raises(StaticAnalysisError):
+        analyze_container("no_such_module:container")
@@ -0,0 +1,113 @@
+import gc
+from collections import OrderedDict
+from typing import Any
+from weakref import ref
+
+from diy._internal.cache import PlanCache
+from diy.container.runtime import RuntimeContainer
+
+
+class Dependency: ...
+
+
+def dynamic_class(index: int) -> type[Any]:
+    def __init__(self: Any, dependency: Dependency) -> None:  # noqa: N807
+        self.dependency = dependency
+
+    __init__.__annotations__ = {"dependency": Dependency, "return": None}
+    return type(f"Dynamic{index}", (), {"__init__": __init__})
+
+
+def test_it_evicts_the_least_recently_used_entries() -> None:
+    first, second, third = (dynamic_class(index) for index in range(3))
+    cache = PlanCache(maxsize=2)
+
+    cache.set(first, 1)
+    cache.set(second, 2)
+    assert cache.get(first) == 1
+    cache.set(third, 3)
+
+    assert cache.get(first) == 1
+    assert cache.get(second) is None
+    assert cache.get(third) == 3
+    stats = cache.stats()
+    assert (stats.size, stats.hits, stats.misses, stats.evictions) == (2, 3, 1, 1)
+
+
+def test_it_is_keyed_by_any_type() -> None:
+    cache = PlanCache()
+
+    cache.set(int, "int")
+    cache.set(str | None, "optional")
+
+    assert cache.get(int) == "int"
+    assert cache.get(str | None) == "optional"
+    assert len(cache) == 2
+
+
+def test_caches_do_not_share_entries() -> None:
+    subject = dynamic_class(0)
+    first, second = PlanCache(), PlanCache()
+
+    first.set(subject, 1)
+
+    assert second.get(subject) is None
+    first.clear()
+    assert first.get(subject) is None
+
+
+def test_types_are_released_once_their_entries_are_evicted() -> None:
+    cache = PlanCache(maxsize=1)
+    subject = dynamic_class(0)
+    # Like plans, the value references the type it was cached for.
+    cache.set(subject, [subject])
+    collected = ref(subject)
+
+    del subject
+    gc.collect()
+    assert collected() is not None
+
+    cache.set(int, "int")
+    gc.collect()
+    assert collected() is None
+    assert cache.items() == [(int, "int")]
+
+
+def test_nothing_is_stored_on_the_cached_types() -> None:
+    subject = dynamic_class(0)
+    container = RuntimeContainer()
+
+    assert isinstance(container.resolve(subject), subject)
+
+    assert "__diy_cache__" not in vars(subject)
+    assert "__diy_cache__" not in vars(subject.__init__)
+
+
+def test_planned_types_are_released_once_evicted() -> None:
+    container = RuntimeContainer(cache_size=1)
+    subject = dynamic_class(0)
+    container.resolve(subject)
+    collected = ref(subject)
+
+    del subject
+    container.resolve(Dependency)
+    gc.collect()
+
+    assert collected() is None
+
+
+class EvictedAfterReading(OrderedDict[Any, Any]):
+    """Acts like another thread evicted each entry right after it was read."""
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = super().get(key, default)
+        self.pop(key, None)
+        return value
+
+
+def test_it_copes_with_entries_evicted_while_reading() -> None:
+    cache = PlanCache()
+    cache._entries = EvictedAfterReading({int: "int"})  # noqa: SLF001
+
+    assert cache.get(int) == "int"
+    assert cache.get(int) is None
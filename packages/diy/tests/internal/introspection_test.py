@@ -0,0 +1,138 @@
+from dataclasses import InitVar, dataclass, field
+from inspect import Parameter, signature
+from typing import Any, NamedTuple
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal import introspection
+from diy._internal.introspection import (
+    DEFAULT_FACTORY,
+    dataclass_parameters,
+    namedtuple_parameters,
+    register_adapter,
+)
+from diy._internal.planner import Planner
+
+
+class Clock:
+    pass
+
+
+@dataclass
+class Settings:
+    clock: Clock
+    retries: int = 3
+    tags: list[str] = field(default_factory=list)
+    cached: bool = field(default=False, init=False)
+    debug: bool = field(default=False, kw_only=True)
+
+
+@dataclass
+class Scheduler(Settings):
+    interval: float = 1.0
+
+
+@dataclass
+class Customized:
+    clock: Clock
+
+    def __init__(self, clock: Clock, interval: float) -> None:
+        self.clock = clock
+
+
+@dataclass
+class Initialized:
+    clock: Clock
+    seed: InitVar[int] = 0
+
+
+class Point(NamedTuple):
+    clock: Clock
+    x: int = 0
+
+
+class Shifted(Point):
+    def __new__(cls, clock: Clock) -> "Shifted":
+        return super().__new__(cls, clock, 1)
+
+
+class Model:
+    fields: dict[str, type[Any]] = {}  # noqa: RUF012
+
+    def __init__(self, **values: Any) -> None:
+        super().__init__()
+        self.values = values
+
+
+class Order(Model):
+    fields = {"clock": Clock}  # noqa: RUF012
+
+
+def model_parameters(abstract: type[Any]) -> list[Parameter] | None:
+    if not issubclass(abstract, Model):
+        return None
+    return [
+        Parameter(name, Parameter.KEYWORD_ONLY, annotation=annotation)
+        for name, annotation in abstract.fields.items()
+    ]
+
+
+@pytest.fixture()
+def adapters(monkeypatch: pytest.MonkeyPatch) -> list[introspection.Adapter]:
+    """The registered adapters, restored after the test."""
+    adapters = list(introspection._adapters)  # noqa: SLF001
+    monkeypatch.setattr(introspection, "_adapters", adapters)
+    return adapters
+
+
+@pytest.mark.parametrize("subject", [Settings, Scheduler])
+def test_dataclasses_take_the_parameters_of_their_generated_constructor(
+    subject: type[Any],
+) -> None:
+    parameters = dataclass_parameters(subject)
+    assert parameters is not None
+    expected = list(signature(subject.__init__).parameters.values())[1:]
+    assert [(p.name, p.kind, p.annotation) for p in parameters] == [
+        (p.name, p.kind, p.annotation) for p in expected
+    ]
+
+    defaults = {parameter.name: parameter.default for parameter in parameters}
+    assert defaults["retries"] == 3
+    assert defaults["tags"] is DEFAULT_FACTORY
+    assert defaults["clock"] is Parameter.empty
+
+
+@pytest.mark.parametrize("subject", [Customized, Initialized, Clock])
+def test_other_constructors_are_reflected(subject: type[Any]) -> None:
+    assert dataclass_parameters(subject) is None
+
+
+def test_dataclasses_are_planned_like_reflected_ones(
+    adapters: list[introspection.Adapter],
+) -> None:
+    def planned(plan: Any) -> list[tuple[str, str]]:
+        return [(node.name, type(node).__name__) for node in plan.parameters]
+
+    fast = Planner(Specification()).plan(Scheduler)
+    adapters.clear()
+    assert planned(Planner(Specification()).plan(Scheduler)) == planned(fast)
+
+
+def test_named_tuples_are_constructed_from_their_fields() -> None:
+    point = Container().resolve(Point)
+    assert isinstance(point.clock, Clock)
+    assert point.x == 0
+
+    assert namedtuple_parameters(Shifted) is None
+    assert namedtuple_parameters(tuple) is None
+
+
+def test_third_party_adapters_come_first(
+    adapters: list[introspection.Adapter],
+) -> None:
+    assert register_adapter(model_parameters) is model_parameters
+    assert adapters[0] is model_parameters
+
+    order = Container().resolve(Order)
+    assert isinstance(order.values["clock"], Clock)
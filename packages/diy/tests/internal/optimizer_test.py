@@ -0,0 +1,201 @@
+from collections.abc import Callable, Iterator
+from inspect import signature
+from typing import Any
+
+import pytest
+
+from diy import Container
+from diy._internal.display import print_resolution_plan
+from diy._internal.optimizer import (
+    PASSES,
+    count_nodes,
+    forwarded_parameter,
+    optimize,
+    optimize_with_report,
+)
+from diy._internal.plan import (
+    BuilderParameterResolutionPlan,
+    InferenceBasedResolutionPlan,
+)
+from diy._internal.planner import Planner
+from diy.provider import Provider
+
+
+class Logger:
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+
+
+class Formatter:
+    def __init__(self, indent: int = 2) -> None:
+        super().__init__()
+        self.indent = indent
+
+
+class Transport: ...
+
+
+class HttpTransport(Transport): ...
+
+
+class Client:
+    def __init__(
+        self,
+        transport: Transport,
+        formatters: Provider[Formatter],
+        logger: Logger | None,
+        retries: int = 3,
+    ) -> None:
+        super().__init__()
+        self.transport = transport
+        self.formatters = formatters
+        self.logger = logger
+        self.retries = retries
+
+
+def build_transport(transport: HttpTransport) -> Transport:
+    return transport
+
+
+def build_client() -> Client:
+    raise NotImplementedError
+
+
+def container() -> Container:
+    container = Container()
+    container.add(build_transport)
+    return container
+
+
+def forwarding(subject: int) -> int:
+    return subject
+
+
+def keyword_only(*, subject: int) -> int:
+    return subject
+
+
+def documented(subject: int) -> int:
+    """Only returns its argument."""
+    return subject
+
+
+def generic[T](subject: T) -> T:
+    return subject
+
+
+def constant(subject: int) -> int:
+    return 1
+
+
+def two_parameters(subject: int, other: int) -> int:
+    return subject
+
+
+def variadic(subject: int, *others: int) -> int:
+    return subject
+
+
+def reassigning(subject: int) -> int:
+    subject = subject + 1
+    return subject
+
+
+def capturing(subject: int) -> Callable[[], int]:
+    return lambda: subject
+
+
+async def asynchronous(subject: int) -> int:
+    return subject
+
+
+def generating(subject: int) -> Iterator[int]:
+    yield subject
+
+
+@pytest.mark.parametrize(
+    "function", [forwarding, keyword_only, documented, generic, build_transport]
+)
+def test_it_detects_forwarding_functions(function: Callable[..., Any]) -> None:
+    # The bytecode of forwarding functions differs between Python versions,
+    # so each of these checks that the reference is compiled the same way.
+    name = next(iter(signature(function).parameters))
+    assert forwarded_parameter(function) == name
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        constant,
+        two_parameters,
+        variadic,
+        reassigning,
+        capturing,
+        asynchronous,
+        generating,
+        build_client,
+        len,
+    ],
+)
+def test_it_ignores_other_functions(function: Callable[..., Any]) -> None:
+    assert forwarded_parameter(function) is None
+
+
+def test_each_pass_shrinks_the_plan() -> None:
+    plan = Planner(container()).plan(Client)
+
+    optimized, reports = optimize_with_report(plan)
+
+    assert [report.name for report in reports] == [p.name for p in PASSES]
+    assert [report.removed for report in reports] == [1, 1]
+    assert count_nodes(plan) == 6
+    assert count_nodes(optimized) == 4
+
+
+def test_the_original_plan_is_kept_for_display() -> None:
+    plan = Planner(container()).plan(Client)
+    displayed = print_resolution_plan(plan, ansi=False)
+
+    optimized = optimize(plan)
+
+    assert print_resolution_plan(plan, ansi=False) == displayed
+    assert print_resolution_plan(optimized, ansi=False) == (
+        "tests.internal.optimizer_test:Client\n"
+        "├─transport: tests.internal.optimizer_test:HttpTransport <- HttpTransport()\n"
+        "├─formatters: tests.internal.optimizer_test:Formatter <- Provider\n"
+        "└─logger: tests.internal.optimizer_test:Logger | NoneType <- None"
+    )
+
+
+def test_forwarding_roots_are_replaced_by_their_argument() -> None:
+    plan = Planner(container()).plan(Transport)
+
+    optimized = optimize(plan)
+
+    assert isinstance(optimized, InferenceBasedResolutionPlan)
+    assert optimized.type is HttpTransport
+
+
+def test_optimized_plans_build_the_same_instances() -> None:
+    plan = Planner(container()).plan(Client)
+    assert isinstance(plan, InferenceBasedResolutionPlan)
+
+    client = plan.execute()
+
+    assert isinstance(client.transport, HttpTransport)
+    assert isinstance(client.formatters(), Formatter)
+    assert client.formatters() is not client.formatters()
+    assert client.logger is None
+    assert client.retries == 3
+    assert any(
+        isinstance(node, BuilderParameterResolutionPlan) for node in plan.parameters
+    )
+
+
+def test_each_execution_gets_its_own_provider() -> None:
+    plan = Planner(container()).plan(Client)
+
+    first, second = plan.execute(), plan.execute()
+
+    assert first.formatters is not second.formatters
@@ -0,0 +1,41 @@
+import gc
+
+from diy._internal.optimizer import optimize
+from diy._internal.plan import InferenceBasedResolutionPlan
+from diy._internal.planner import Planner
+from diy.specification.default import Specification
+
+
+class Config:
+    def __init__(self, retries: int = 3) -> None: ...
+
+
+class Connection:
+    def __init__(self, config: Config) -> None: ...
+
+
+class Repository:
+    def __init__(self, connection: Connection, config: Config) -> None: ...
+
+
+def test_plan_nodes_have_no_instance_dict() -> None:
+    plan = Planner(Specification()).plan(Repository)
+    assert isinstance(plan, InferenceBasedResolutionPlan)
+
+    nodes = [plan, *plan.parameters]
+    assert all(not hasattr(node, "__dict__") for node in nodes)
+
+
+def test_plans_are_freed_without_the_garbage_collector() -> None:
+    planner = Planner(Specification())
+    planner.plan(Repository)
+
+    gc.collect()
+    gc.disable()
+    try:
+        plan = planner.plan(Repository)
+        optimized = optimize(plan)
+        del plan, optimized
+        assert gc.collect() == 0
+    finally:
+        gc.enable()
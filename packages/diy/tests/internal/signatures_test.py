@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal.signatures import LazySignature, return_annotation
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+class Clock:
+    pass
+
+
+class Invoice:
+    def __init__(self, clock: Clock, rate: Decimal | None = None) -> None:
+        super().__init__()
+        self.clock = clock
+        self.rate = rate
+
+
+class Payment:
+    def __init__(self, invoice: Invoice, amount: Decimal) -> None:
+        super().__init__()
+        self.invoice = invoice
+        self.amount = amount
+
+
+def first[T](values: list[T]) -> T:
+    return values[0]
+
+
+def test_it_only_evaluates_the_annotations_it_needs() -> None:
+    # `Decimal` is only imported when type checking, but planning never needs
+    # the annotation of a parameter with a default.
+    invoice = Container().resolve(Invoice)
+    assert isinstance(invoice.clock, Clock)
+    assert invoice.rate is None
+
+
+def test_parameters_with_partial_builders_are_not_evaluated() -> None:
+    spec = Specification()
+    spec.add(Payment, "amount")(build_amount)
+    payment = Container(spec).resolve(Payment)
+    assert payment.amount == 42
+
+
+def build_amount() -> int:
+    return 42
+
+
+def test_it_reports_annotations_it_needs_but_cannot_evaluate() -> None:
+    with pytest.raises(NameError):
+        Container().resolve(Payment)
+
+
+def test_annotations_are_evaluated_once() -> None:
+    sig = LazySignature(Invoice.__init__)
+    assert sig.parameters["clock"].annotation == "Clock"
+    assert sig.annotation("clock") is Clock
+    assert sig.annotation("clock") is sig.annotation("clock")
+
+
+def test_it_evaluates_type_parameters_of_generic_functions() -> None:
+    [parameter] = first.__type_params__
+    assert return_annotation(first) is parameter
+    assert LazySignature(first).annotation("values") == list[parameter]
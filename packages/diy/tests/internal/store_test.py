@@ -0,0 +1,203 @@
+import marshal
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from diy import Specification
+from diy._internal.planner import Planner
+from diy._internal.store import PlanStore
+from diy.container.verifying import VerifyingContainer
+from diy.provider import Provider
+from tests.fixtures import ApiClient
+
+
+class Config:
+    def __init__(self, retries: int = 3) -> None:
+        super().__init__()
+        self.retries = retries
+
+
+class Mailer:
+    def __init__(self, config: Config, api: ApiClient | None) -> None:
+        super().__init__()
+        self.config = config
+        self.api = api
+
+
+class Newsletter:
+    def __init__(self, mailers: Provider[Mailer], greeting: str) -> None:
+        super().__init__()
+        self.mailers = mailers
+        self.greeting = greeting
+
+
+def build_config() -> Config:
+    return Config(retries=5)
+
+
+def build_greeting() -> str:
+    return "Hi"
+
+
+def newsletter_spec() -> Specification:
+    spec = Specification()
+    spec.add(build_config)
+    spec.add(Newsletter)
+    spec.add(Newsletter, "greeting")(build_greeting)
+    return spec
+
+
+def test_it_loads_the_plans_it_saved(tmp_path: Path) -> None:
+    spec = newsletter_spec()
+    planner = Planner(spec)
+    plans = {Newsletter: planner.plan(Newsletter), Config: planner.plan(Config)}
+    store = PlanStore(tmp_path / "plans")
+
+    assert store.save(spec, plans) == 2
+    loaded = store.load(spec)
+
+    assert loaded == plans
+    newsletter = loaded[Newsletter].execute()
+    assert newsletter.greeting == "Hi"
+    assert newsletter.mailers().config.retries == 5
+
+
+def test_it_ignores_plans_of_a_different_spec(tmp_path: Path) -> None:
+    spec = newsletter_spec()
+    store = PlanStore(tmp_path / "plans")
+    store.save(spec, {Newsletter: Planner(spec).plan(Newsletter)})
+
+    spec.add(Mailer)
+
+    assert store.load(spec) == {}
+
+
+def test_it_ignores_plans_when_sources_changed(tmp_path: Path) -> None:
+    (tmp_path / "store_fixture.py").write_text("class Service: ...\n")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        from store_fixture import Service  # type: ignore[reportMissingImports]
+    finally:
+        sys.path.remove(str(tmp_path))
+
+    spec = Specification()
+    spec.add(Service)
+    store = PlanStore(tmp_path / "plans")
+    store.save(spec, {Service: Planner(spec).plan(Service)})
+    assert Service in store.load(spec)
+
+    source = tmp_path / "store_fixture.py"
+    modified = source.stat().st_mtime_ns + 1_000_000_000
+    os.utime(source, ns=(modified, modified))
+
+    assert store.load(spec) == {}
+    del sys.modules["store_fixture"]
+
+
+@pytest.fixture()
+def modules(tmp_path: Path) -> Iterator[Path]:
+    """A directory to import modules from, which are forgotten after the test."""
+    sys.path.insert(0, str(tmp_path))
+    before = set(sys.modules)
+    yield tmp_path
+    sys.path.remove(str(tmp_path))
+    for module in set(sys.modules) - before:
+        del sys.modules[module]
+
+
+def test_it_ignores_plans_when_inherited_constructors_changed(modules: Path) -> None:
+    (modules / "store_base.py").write_text(
+        "class Base:\n    def __init__(self, retries: int = 3) -> None: ...\n"
+    )
+    (modules / "store_child.py").write_text(
+        "from store_base import Base\n\nclass Service(Base): ...\n"
+    )
+    from store_child import Service  # type: ignore[reportMissingImports]
+
+    spec = Specification()
+    spec.add(Service)
+    store = PlanStore(modules / "plans")
+    store.save(spec, {Service: Planner(spec).plan(Service)})
+    assert Service in store.load(spec)
+
+    source = modules / "store_base.py"
+    modified = source.stat().st_mtime_ns + 1_000_000_000
+    os.utime(source, ns=(modified, modified))
+
+    assert store.load(spec) == {}
+
+
+def test_skipped_plans_do_not_stamp_their_modules(modules: Path) -> None:
+    (modules / "store_skipped.py").write_text(
+        "class Service:\n    def __init__(self, name: str) -> None: ...\n"
+    )
+    from store_skipped import Service  # type: ignore[reportMissingImports]
+
+    spec = Specification()
+    spec.add(Config)
+
+    @spec.add(Service, "name")
+    def build_local_name() -> str:
+        return "Local"
+
+    planner = Planner(spec)
+    store = PlanStore(modules / "plans")
+    plans = {Service: planner.plan(Service), Config: planner.plan(Config)}
+    assert store.save(spec, plans) == 1
+
+    _, _, stamps, _, _ = marshal.loads((modules / "plans").read_bytes())  # noqa: S302
+    assert [Path(path).name for path, _, _ in stamps] == ["store_test.py"]
+
+
+def test_it_skips_plans_it_cant_look_up(tmp_path: Path) -> None:
+    class Local: ...
+
+    spec = Specification()
+    spec.add(Local)
+    spec.add(Config)
+    planner = Planner(spec)
+    plans: dict[type[Any], Any] = {
+        Local: planner.plan(Local),
+        Config: planner.plan(Config),
+    }
+    store = PlanStore(tmp_path / "plans")
+
+    assert store.save(spec, plans) == 1
+    assert list(store.load(spec)) == [Config]
+
+
+def test_verifying_containers_reuse_stored_plans(tmp_path: Path) -> None:
+    spec = newsletter_spec()
+
+    first = VerifyingContainer(spec, plan_cache=tmp_path / "plans")
+    second = VerifyingContainer(spec, plan_cache=tmp_path / "plans")
+
+    planners = [container._verifier._planner for container in (first, second)]  # noqa: SLF001
+    assert [planner.cache.stats().hits for planner in planners] == [0, 2]
+    assert second.resolve(Newsletter).greeting == "Hi"
+
+
+def test_it_leaves_no_temporary_files_behind(tmp_path: Path) -> None:
+    spec = newsletter_spec()
+    store = PlanStore(tmp_path / "plans")
+
+    store.save(spec, {Config: Planner(spec).plan(Config)})
+    store.save(spec, {Config: Planner(spec).plan(Config)})
+
+    assert [path.name for path in tmp_path.iterdir()] == ["plans"]
+
+
+def test_plans_are_stored_on_a_best_effort_basis(tmp_path: Path) -> None:
+    spec = newsletter_spec()
+    # A file where the directory of the store would have to be.
+    (tmp_path / "file").write_text("")
+    path = tmp_path / "file" / "plans"
+
+    assert PlanStore(path).save(spec, {Config: Planner(spec).plan(Config)}) == 0
+
+    container = VerifyingContainer(spec, plan_cache=path)
+    assert container.resolve(Newsletter).greeting == "Hi"
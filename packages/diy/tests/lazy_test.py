@@ -0,0 +1,111 @@
+import pickle  # noqa: S403
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
+from threading import Barrier
+from typing import Any
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal.display import print_resolution_plan
+from diy._internal.planner import Planner
+from diy.container.verifying import VerifyingContainer
+from diy.errors import FailedToInferDependencyError
+from diy.lazy import Lazy, unwrap
+from tests.fixtures import ApiClient
+
+
+class Renderer:
+    built = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        Renderer.built += 1
+        self.format = "pdf"
+
+
+class Reports:
+    def __init__(self, renderer: Lazy[Renderer]) -> None:
+        super().__init__()
+        self.renderer = renderer
+
+
+class RemoteReports:
+    def __init__(self, api: Lazy[ApiClient]) -> None:
+        super().__init__()
+        self.api = api
+
+
+def test_it_builds_lazy_dependencies_on_first_use() -> None:
+    Renderer.built = 0
+
+    reports = Container().resolve(Reports)
+    assert Renderer.built == 0
+
+    assert reports.renderer.format == "pdf"
+    assert reports.renderer.format == "pdf"
+    assert Renderer.built == 1
+    assert isinstance(unwrap(reports.renderer), Renderer)
+
+
+def test_lazy_dependencies_are_built_once_between_threads() -> None:
+    Renderer.built = 0
+    reports = Container().resolve(Reports)
+    barrier = Barrier(8)
+
+    def use() -> Renderer:
+        barrier.wait()
+        return unwrap(reports.renderer)
+
+    with ThreadPoolExecutor(8) as pool:
+        renderers = list(pool.map(lambda _: use(), range(8)))
+
+    assert Renderer.built == 1
+    assert all(renderer is renderers[0] for renderer in renderers)
+
+
+def test_lazy_dependencies_are_planned_eagerly() -> None:
+    spec = Specification()
+    spec.add(RemoteReports)
+
+    with pytest.raises(FailedToInferDependencyError):
+        VerifyingContainer(spec)
+
+
+def test_lazy_dependencies_are_displayed_in_plans() -> None:
+    plan = Planner(Container()).plan(Reports)
+
+    assert print_resolution_plan(plan, ansi=False) == (
+        "tests.lazy_test:Reports\n└─renderer: tests.lazy_test:Renderer <- Lazy"
+    )
+
+
+def test_probing_special_methods_does_not_build_the_instance() -> None:
+    Renderer.built = 0
+    reports = Container().resolve(Reports)
+
+    assert not hasattr(reports.renderer, "__missing_protocol__")
+    assert not hasattr(reports.renderer, "_diy_missing")
+    assert Renderer.built == 0
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy, deepcopy, lambda lazy: pickle.loads(pickle.dumps(lazy))],  # noqa: S301
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_lazy_dependencies_can_be_copied(duplicate: Any) -> None:
+    Renderer.built = 0
+    reports = Container().resolve(Reports)
+
+    # Copies of an unused proxy build their own instance.
+    unused = duplicate(reports.renderer)
+    assert Renderer.built == 0
+    assert unused.format == "pdf"
+    assert Renderer.built == 1
+
+    # Copies of a used one come with the instance.
+    assert reports.renderer.format == "pdf"
+    used = duplicate(reports.renderer)
+    assert used.format == "pdf"
+    assert Renderer.built == 2
@@ -0,0 +1,100 @@
+from typing import Optional
+
+import pytest
+
+from diy import Container
+from diy._internal.planner import Planner
+from diy.errors import FailedToInferDependencyError
+
+
+class Mailer:
+    def __init__(self, dsn: str) -> None:
+        super().__init__()
+        self.dsn = dsn
+
+
+class Logger:
+    pass
+
+
+class UserService:
+    def __init__(self, mailer: Mailer | None, logger: Logger | None) -> None:
+        super().__init__()
+        self.mailer = mailer
+        self.logger = logger
+
+
+class LegacyUserService:
+    def __init__(self, mailer: Optional[Mailer]) -> None:  # noqa: UP007
+        super().__init__()
+        self.mailer = mailer
+
+
+def test_optional_dependencies_are_none_when_they_cant_be_built() -> None:
+    service = Container().resolve(UserService)
+
+    assert service.mailer is None
+    assert isinstance(service.logger, Logger)
+
+
+def test_optional_dependencies_are_built_when_possible() -> None:
+    container = Container()
+
+    @container.add(Mailer, "dsn")
+    def build_mailer_dsn() -> str:
+        return "smtp://localhost"
+
+    service = container.resolve(UserService)
+
+    assert isinstance(service.mailer, Mailer)
+    assert service.mailer.dsn == "smtp://localhost"
+
+
+def test_it_supports_optional_from_the_typing_module() -> None:
+    service = Container().resolve(LegacyUserService)
+
+    assert service.mailer is None
+
+
+def test_failed_plans_are_cached() -> None:
+    planner = Planner(Container())
+
+    with pytest.raises(FailedToInferDependencyError) as first:
+        planner.plan(Mailer)
+
+    with pytest.raises(FailedToInferDependencyError) as second:
+        planner.plan(Mailer)
+
+    assert str(second.value) == str(first.value)
+    assert planner.cache.stats().hits == 1
+
+
+def test_each_caller_gets_its_own_copy_of_a_cached_failure() -> None:
+    planner = Planner(Container())
+
+    with pytest.raises(FailedToInferDependencyError) as first:
+        planner.plan(Mailer)
+    first.value.add_note("Seen by the first caller")
+    notes = list(first.value.__notes__)
+
+    with pytest.raises(FailedToInferDependencyError) as second:
+        planner.plan(Mailer)
+    second.value.add_note("Seen by the second caller")
+
+    with pytest.raises(FailedToInferDependencyError) as third:
+        planner.plan(Mailer)
+
+    assert len({id(first.value), id(second.value), id(third.value)}) == 3
+    assert third.value.__notes__ == notes[:-1]
+    assert third.value.__traceback__ is not None
+
+
+def test_cached_failures_are_forgotten_once_the_spec_changes() -> None:
+    container = Container()
+    assert container.resolve(UserService).mailer is None
+
+    @container.add
+    def build_mailer() -> Mailer:
+        return Mailer("smtp://localhost")
+
+    assert isinstance(container.resolve(UserService).mailer, Mailer)
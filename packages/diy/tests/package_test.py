@@ -0,0 +1,22 @@
+import subprocess  # noqa: S404
+import sys
+
+
+def imported_diy_modules(statement: str) -> set[str]:
+    code = f"{statement}; import sys; print(*sorted(sys.modules))"
+    # Only ever runs the statements of the tests below.
+    command = [sys.executable, "-c", code]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)  # noqa: S603
+    return {module for module in result.stdout.split() if module.startswith("diy")}
+
+
+def test_importing_diy_does_not_import_its_submodules() -> None:
+    assert imported_diy_modules("import diy") == {"diy"}
+
+
+def test_exports_are_imported_on_first_access() -> None:
+    modules = imported_diy_modules("from diy import Container")
+
+    assert "diy.container.default" in modules
+    assert "diy._internal.display" not in modules
+    assert "diy._internal.optimizer" not in modules
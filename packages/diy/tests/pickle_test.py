@@ -0,0 +1,106 @@
+import pickle  # noqa: S403
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal.display import print_resolution_plan
+from diy._internal.imports import LazyBuilder
+from diy.container.runtime import RuntimeContainer
+from diy.container.verifying import VerifyingContainer
+from diy.errors import WorkerNotInitializedError
+from diy.provider import Provider
+from diy.workers import initialize_worker, worker_container
+
+
+class Greeter:
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+class Service:
+    def __init__(self, greeter: Greeter, greeters: Provider[Greeter]) -> None:
+        super().__init__()
+        self.greeter = greeter
+
+
+def build_name() -> str:
+    return "Ella"
+
+
+def spec() -> Specification:
+    spec = Specification()
+    spec.add(Greeter, "name")(build_name)
+    spec.add(Service)
+    return spec
+
+
+def greet(_: int) -> str:
+    return worker_container().resolve(Service).greeter.name
+
+
+def test_containers_keep_their_plans_when_pickled() -> None:
+    container = Container(spec())
+    plan = print_resolution_plan(container._planner.plan(Service))  # noqa: SLF001
+
+    copy = pickle.loads(pickle.dumps(container))  # noqa: S301
+    assert copy.cache_stats().size == 1
+    assert print_resolution_plan(copy._planner.plan(Service)) == plan  # noqa: SLF001
+    assert copy.cache_stats().hits == 1
+    assert copy.resolve(Service).greeter.name == "Ella"
+
+
+@pytest.mark.parametrize(
+    "container",
+    [
+        Container(spec().freeze()),
+        RuntimeContainer(spec()),
+        VerifyingContainer(spec()),
+    ],
+    ids=["frozen", "runtime", "verifying"],
+)
+def test_all_containers_can_be_pickled(
+    container: Container | RuntimeContainer | VerifyingContainer,
+) -> None:
+    container.resolve(Service)
+    copy = pickle.loads(pickle.dumps(container))  # noqa: S301
+    assert copy.resolve(Service).greeter.name == "Ella"
+
+
+def test_lazy_builders_are_pickled_by_their_specifier() -> None:
+    builder = LazyBuilder(Greeter, "tests.pickle_test:Greeter")
+    copy = pickle.loads(pickle.dumps(builder))  # noqa: S301
+    assert copy.specifier == builder.specifier
+    assert copy.abstract is Greeter
+
+
+def test_containers_with_local_builders_cannot_be_pickled() -> None:
+    spec = Specification()
+
+    @spec.add(Greeter, "name")
+    def build_local_name() -> str:
+        return "Local"
+
+    container = Container(spec)
+    container.resolve(Greeter)
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(container)
+
+
+def test_worker_containers_need_to_be_initialized() -> None:
+    with pytest.raises(WorkerNotInitializedError):
+        worker_container()
+
+
+def test_workers_resolve_from_the_passed_container() -> None:
+    container = Container(spec())
+    container.resolve(Service)
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=get_context("spawn"),
+        initializer=initialize_worker,
+        initargs=(container,),
+    ) as pool:
+        assert list(pool.map(greet, range(2))) == ["Ella", "Ella"]
@@ -0,0 +1,122 @@
+from typing import Protocol
+
+import pytest
+
+from diy import Container, Specification
+from diy.errors import UnknownProfileError
+
+
+class Clock(Protocol):
+    def now(self) -> int: ...
+
+
+class SystemClock:
+    def now(self) -> int:
+        return 1000
+
+
+class FrozenClock:
+    def now(self) -> int:
+        return 0
+
+
+class Scheduler:
+    def __init__(self, clock: Clock, interval: int) -> None:
+        super().__init__()
+        self.clock = clock
+        self.interval = interval
+
+
+def scheduler_spec() -> Specification:
+    spec = Specification()
+    spec.add(Scheduler)
+    spec.add_lazy(Clock, "tests.profile_test:SystemClock")
+    spec.profile("test").add_lazy(Clock, "tests.profile_test:FrozenClock")
+    # Would fail to import, if it were ever planned.
+    spec.profile("prod").add_lazy(Clock, "missing_module:ProductionClock")
+
+    @spec.add(Scheduler, "interval")
+    def build_interval() -> int:
+        return 60
+
+    @spec.profile("test").add(Scheduler, "interval")
+    def build_test_interval() -> int:
+        return 1
+
+    return spec
+
+
+def test_selected_profiles_take_precedence() -> None:
+    scheduler = Container(scheduler_spec(), profile="test").resolve(Scheduler)
+
+    assert scheduler.clock.now() == 0
+    assert scheduler.interval == 1
+
+
+def test_inactive_profiles_are_never_planned() -> None:
+    spec = scheduler_spec()
+
+    scheduler = Container(spec).resolve(Scheduler)
+
+    assert scheduler.clock.now() == 1000
+    assert scheduler.interval == 60
+    assert Clock in spec.types()
+
+
+def test_profiles_fall_back_to_the_base_bindings() -> None:
+    spec = scheduler_spec()
+    spec.profile("prod").add_lazy(Clock, "tests.profile_test:SystemClock")
+
+    scheduler = Container(spec, profile="prod").resolve(Scheduler)
+
+    assert scheduler.clock.now() == 1000
+    assert scheduler.interval == 60
+
+
+def test_bindings_added_to_the_profile_later_are_visible() -> None:
+    spec = scheduler_spec()
+    spec.profile("staging")
+    container = Container(spec, profile="staging")
+    assert container.resolve(Scheduler).interval == 60
+
+    @spec.profile("staging").add(Scheduler, "interval")
+    def build_staging_interval() -> int:
+        return 5
+
+    assert container.resolve(Scheduler).interval == 5
+
+
+def test_freezing_applies_the_profile() -> None:
+    spec = scheduler_spec()
+
+    frozen = spec.freeze(profile="test")
+
+    assert Container(frozen).resolve(Scheduler).interval == 1
+    assert frozen == spec.select("test").freeze()
+    assert frozen.fingerprint != spec.freeze().fingerprint
+
+
+def test_profiles_can_only_be_selected_from_specifications() -> None:
+    with pytest.raises(TypeError):
+        Container(scheduler_spec().freeze(), profile="test")
+
+
+def test_bindings_added_to_a_selected_profile_only_apply_to_it() -> None:
+    spec = scheduler_spec()
+
+    @spec.select("test").add(Scheduler, "interval")
+    def build_other_test_interval() -> int:
+        return 2
+
+    assert Container(spec, profile="test").resolve(Scheduler).interval == 2
+    assert Container(spec).resolve(Scheduler).interval == 60
+
+
+def test_unknown_profiles_cannot_be_selected() -> None:
+    spec = scheduler_spec()
+
+    with pytest.raises(UnknownProfileError) as error:
+        Container(spec, profile="prdo")
+    assert error.value.__notes__ == ["Known profiles: prod, test"]
+    with pytest.raises(UnknownProfileError):
+        spec.freeze(profile="prdo")
@@ -0,0 +1,86 @@
+from collections.abc import Callable, Set
+from typing import Any, override
+
+from diy import Container
+from diy._internal.planner import Planner
+from diy.container.protocol import ContainerProtocol
+from diy.container.verifying import VerifyingContainer
+from diy.specification.protocol import SpecificationProtocol
+from tests.fixtures import ApiClient
+
+
+class Clock:
+    pass
+
+
+class MinimalContainer(ContainerProtocol):
+    """Only implements what containers had to implement from the start."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.container = Container()
+
+    @override
+    def resolve[T](self, abstract: type[T]) -> T:
+        return self.container.resolve(abstract)
+
+    @override
+    def call[R](self, function: Callable[..., R]) -> R:
+        return self.container.call(function)
+
+
+class MinimalSpecification(SpecificationProtocol):
+    """Only implements what specifications had to implement from the start."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.builders: dict[type[Any], Callable[..., Any]] = {}
+
+    @override
+    def add(self, builder: Any, name: str | None = None) -> Any:
+        self.builders[builder.__signature__.return_annotation] = builder
+        return builder
+
+    @override
+    def get(self, abstract: type[Any], name: str | None = None) -> Any:
+        return None if name is not None else self.builders.get(abstract)
+
+    @override
+    def types(self) -> Set[type[Any]]:
+        return self.builders.keys()
+
+
+def test_containers_get_the_methods_added_since() -> None:
+    container = MinimalContainer()
+    assert isinstance(container.try_resolve(Clock), Clock)
+    assert container.try_resolve(ApiClient) is None
+    [clock, other] = container.resolve_many([Clock, Clock])
+    assert isinstance(clock, Clock)
+    assert isinstance(other, Clock)
+
+
+def test_specifications_get_the_methods_added_since() -> None:
+    spec = MinimalSpecification()
+    assert spec.revision != spec.revision
+
+    spec.add_lazy("tests.fixtures:ApiClient", "tests.protocol_test:build_client")
+    assert ApiClient in spec.types()
+    client = Planner(spec).plan(ApiClient).execute()
+    assert isinstance(client, ApiClient)
+
+
+def build_client() -> ApiClient:
+    return ApiClient("Ella")
+
+
+def test_specifications_are_frozen_from_what_they_report() -> None:
+    spec = MinimalSpecification()
+    spec.builders[ApiClient] = build_client
+
+    frozen = spec.freeze()
+    assert frozen.types() == {ApiClient}
+    assert frozen.get(ApiClient) is build_client
+    assert frozen.get(ApiClient, "name") is None
+
+    client = VerifyingContainer(spec).resolve(ApiClient)
+    assert isinstance(client, ApiClient)
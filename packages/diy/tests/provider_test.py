@@ -0,0 +1,82 @@
+from collections.abc import Callable
+
+import pytest
+
+from diy import Container
+from diy._internal.display import print_resolution_plan
+from diy._internal.planner import Planner
+from diy.errors import CircularDependencyError
+from diy.provider import Provider
+
+
+class Parser:
+    def __init__(self, delimiter: str = ",") -> None:
+        super().__init__()
+        self.delimiter = delimiter
+
+
+class Consumer:
+    def __init__(self, parsers: Provider[Parser]) -> None:
+        super().__init__()
+        self.parsers = parsers
+
+
+class CallableConsumer:
+    def __init__(self, parsers: Callable[[], Parser]) -> None:
+        super().__init__()
+        self.parsers = parsers
+
+
+class Node:
+    def __init__(self, children: "Provider[Node]") -> None:
+        super().__init__()
+        self.children = children
+
+
+def test_it_injects_providers_that_build_fresh_instances() -> None:
+    consumer = Container().resolve(Consumer)
+
+    first = consumer.parsers()
+    second = consumer.parsers()
+
+    assert isinstance(first, Parser)
+    assert isinstance(second, Parser)
+    assert first is not second
+
+
+def test_it_injects_providers_for_callables_without_parameters() -> None:
+    consumer = Container().resolve(CallableConsumer)
+
+    assert isinstance(consumer.parsers, Provider)
+    assert isinstance(consumer.parsers(), Parser)
+
+
+def test_providers_use_builders_from_the_spec() -> None:
+    container = Container()
+
+    @container.add
+    def build_parser() -> Parser:
+        return Parser(";")
+
+    consumer = container.resolve(Consumer)
+    parsers = consumer.parsers.many(3)
+
+    assert len(parsers) == 3
+    assert all(parser.delimiter == ";" for parser in parsers)
+    assert len({id(parser) for parser in parsers}) == 3
+
+
+def test_providers_are_displayed_in_plans() -> None:
+    plan = Planner(Container()).plan(Consumer)
+
+    assert print_resolution_plan(plan, ansi=False) == (
+        "tests.provider_test:Consumer\n"
+        "└─parsers: tests.provider_test:Parser <- Provider"
+    )
+
+
+def test_types_cannot_request_providers_of_themselves() -> None:
+    # The provided type is planned along with the component, so this would
+    # plan `Node` forever.
+    with pytest.raises(CircularDependencyError):
+        Container().resolve(Node)
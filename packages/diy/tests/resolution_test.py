@@ -1,4 +1,8 @@
-from diy import Container
+import sys
+from typing import Any
+
+from diy import Container, Specification
+from diy._internal.planner import Planner
 
 
 class Innermost:
@@ -18,3 +22,84 @@ class Outer:
 def test_it_can_resolve_nested_types() -> None:
     instance = Container().resolve(Outer)
     assert isinstance(instance, Outer)
+
+
+class Database:
+    pass
+
+
+class UserRepository:
+    def __init__(self, database: Database) -> None:
+        self.database = database
+
+
+class OrderRepository:
+    def __init__(self, database: Database, users: UserRepository) -> None:
+        self.database = database
+        self.users = users
+
+
+def test_it_can_resolve_many_types_at_once() -> None:
+    users, orders = Container().resolve_many([UserRepository, OrderRepository])
+
+    assert isinstance(users, UserRepository)
+    assert isinstance(orders, OrderRepository)
+
+
+def test_resolving_many_types_shares_their_dependencies() -> None:
+    users, orders = Container().resolve_many([UserRepository, OrderRepository])
+
+    assert users.database is orders.database
+    assert orders.users is users
+    assert orders.users.database is orders.database
+
+
+def test_resolving_many_types_reports_the_saved_work() -> None:
+    plan = Planner(Specification()).plan_many([UserRepository, OrderRepository])
+
+    # UserRepository, Database, OrderRepository, Database, UserRepository,
+    # Database, but only UserRepository, Database and OrderRepository are
+    # actually built.
+    assert plan.nodes == 6
+    assert plan.unique_nodes == 3
+    assert plan.saved == 3
+
+
+def test_resolving_many_types_calls_shared_builders_once() -> None:
+    calls = 0
+    container = Container()
+
+    @container.add
+    def build_database() -> Database:
+        nonlocal calls
+        calls += 1
+        return Database()
+
+    container.resolve_many([UserRepository, OrderRepository, Database])
+
+    assert calls == 1
+
+
+def _deep_chain(depth: int) -> type[Any]:
+    current: type[Any] = type("Level0", (), {})
+    for index in range(1, depth):
+
+        def __init__(self: Any, inner: Any) -> None:  # noqa: N807
+            self.inner = inner
+
+        __init__.__annotations__ = {"inner": current, "return": None}
+        current = type(f"Level{index}", (), {"__init__": __init__})
+
+    return current
+
+
+def test_it_can_resolve_chains_deeper_than_the_recursion_limit() -> None:
+    depth = sys.getrecursionlimit() * 2
+    instance = Container().resolve(_deep_chain(depth))
+
+    levels = 1
+    while hasattr(instance, "inner"):
+        instance = instance.inner
+        levels += 1
+
+    assert levels == depth
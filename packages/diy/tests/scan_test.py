@@ -0,0 +1,185 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from diy import Container, Specification
+from diy._internal.imports import import_symbol
+from diy._internal.scanning import scan_package
+from diy.errors import PackageNotFoundError, UnscannableBuilderError
+
+MODELS = """
+class Clock:
+    def now(self) -> int:
+        raise NotImplementedError
+"""
+
+CLOCKS = """
+from diy import markers
+from ..models import Clock
+
+
+class SystemClock(Clock):
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+
+    def now(self) -> int:
+        return 1000 + self.offset
+
+
+@markers.builder
+def build_clock(offset: int) -> Clock:
+    return SystemClock(offset)
+
+
+@markers.builder
+def build_offset() -> "int":
+    return 1
+"""
+
+GREETER = """
+from diy.markers import builder, component
+
+
+class Names(list[str]): ...
+
+
+# Aliases can only be resolved by importing the module.
+Roster = Names
+
+
+@component
+class Greeter:
+    def __init__(self, names: Names) -> None:
+        self.names = names
+
+
+@builder
+def build_names() -> Roster:
+    return Names(["Ella"])
+"""
+
+REPOSITORIES = """
+class Repository:
+    def __init__(self, name: str) -> None:
+        self.name = name
+"""
+
+STORAGE = """
+from diy.markers import builder
+from ..domain import Repository
+
+
+@builder
+def build_repository() -> Repository:
+    return Repository("memory")
+"""
+
+OPTIONAL = """
+from diy.markers import builder
+from ..models import Clock
+
+
+@builder
+def build_optional_clock() -> Clock | None:
+    return None
+"""
+
+
+@pytest.fixture()
+def package(tmp_path: Path, request: pytest.FixtureRequest) -> Iterator[str]:
+    """A package that is not imported yet, and is forgotten after the test."""
+    name = f"shop_{request.node.name}"
+    root = tmp_path / name
+    (root / "services").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "models.py").write_text(MODELS)
+    (root / "services" / "__init__.py").write_text("")
+    (root / "services" / "clocks.py").write_text(CLOCKS)
+    (root / "services" / "greeter.py").write_text(GREETER)
+    # Not part of the package, since the directory has no `__init__.py`.
+    (root / "scripts").mkdir()
+    (root / "scripts" / "broken.py").write_text("raise SystemExit")
+
+    sys.path.insert(0, str(tmp_path))
+    yield name
+    sys.path.remove(str(tmp_path))
+    for module in list(sys.modules):
+        if module.partition(".")[0] == name:
+            del sys.modules[module]
+
+
+def test_it_registers_marked_builders_without_importing_them(package: str) -> None:
+    spec = Specification()
+
+    assert spec.scan(package, index=None) == 4
+    assert f"{package}.services.clocks" not in sys.modules
+
+    clock = import_symbol(f"{package}.models:Clock")
+    assert Container(spec).resolve(clock).now() == 1001
+    assert f"{package}.services.clocks" in sys.modules
+
+
+def test_it_registers_builders_for_re_exported_types(
+    package: str, tmp_path: Path
+) -> None:
+    root = tmp_path / package
+    (root / "domain").mkdir()
+    (root / "domain" / "__init__.py").write_text(
+        "from .repositories import Repository\n"
+    )
+    (root / "domain" / "repositories.py").write_text(REPOSITORIES)
+    (root / "services" / "storage.py").write_text(STORAGE)
+    spec = Specification()
+    spec.scan(package, index=None)
+
+    # The builder refers to the type by the package re-exporting it.
+    repository = import_symbol(f"{package}.domain.repositories:Repository")
+    assert Container(spec).resolve(repository).name == "memory"
+
+
+def test_it_registers_marked_types(package: str) -> None:
+    spec = Specification()
+    spec.scan(package)
+
+    names = {abstract.__qualname__ for abstract in spec.types()}
+    assert names == {"Clock", "int", "Names", "Greeter"}
+    greeter = import_symbol(f"{package}.services.greeter:Greeter")
+    assert Container(spec).resolve(greeter).names == ["Ella"]
+
+
+def test_it_only_parses_files_that_changed(package: str, tmp_path: Path) -> None:
+    index = tmp_path / "index"
+    assert scan_package(package, index).parsed == 5
+    assert scan_package(package, index).parsed == 0
+
+    (tmp_path / package / "models.py").write_text(MODELS + "\n# changed\n")
+    result = scan_package(package, index)
+
+    assert result.parsed == 1
+    assert len(result.builders) == 3
+
+
+def test_it_keeps_the_index_in_the_package(
+    package: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    scan_package(package)
+
+    index = tmp_path / package / "__pycache__" / f"diy-scan.{package}.marshal"
+    assert index.exists()
+
+
+def test_it_rejects_unknown_packages() -> None:
+    with pytest.raises(PackageNotFoundError):
+        Specification().scan("no_such_package")
+
+
+def test_it_rejects_builders_that_do_not_return_a_class(
+    package: str, tmp_path: Path
+) -> None:
+    (tmp_path / package / "services" / "optional.py").write_text(OPTIONAL)
+
+    with pytest.raises(UnscannableBuilderError, match="build_optional_clock"):
+        Specification().scan(package, index=None)
@@ -1,8 +1,19 @@
 import pytest
 
 from diy import Specification
+from diy._internal.display import print_resolution_plan
+from diy._internal.plan import (
+    InferenceBasedResolutionPlan,
+    InferenceParameterResolutionPlan,
+)
 from diy.container.verifying import VerifyingContainer
-from diy.errors import FailedToInferDependencyError
+from diy.errors import (
+    CircularDependencyError,
+    FailedToInferDependencyError,
+    MissingConstructorKeywordTypeAnnotationError,
+    VerificationError,
+)
+from diy.verification import check_specification
 from tests.fixtures import ApiClient
 
 
@@ -28,3 +39,174 @@ def test_it_throws_for_builder_dependencies() -> None:
         VerifyingContainer(spec)
 
     assert exception.value.subject == ApiClient
+
+
+class Config:
+    def __init__(self, url: str = "sqlite://") -> None:
+        super().__init__()
+        self.url = url
+
+
+class Database:
+    def __init__(self, config: Config) -> None:
+        super().__init__()
+        self.config = config
+
+
+class Cache: ...
+
+
+class Reports:
+    def __init__(self, database: Database) -> None:
+        super().__init__()
+        self.database = database
+
+
+def test_it_only_replans_types_affected_by_changes() -> None:
+    spec = Specification()
+    spec.add(Reports)
+    spec.add(Cache)
+    container = VerifyingContainer(spec)
+
+    @spec.add
+    def build_config() -> Config:
+        return Config("postgres://")
+
+    # The new builder makes `Config` part of the spec, so it is verified too.
+    assert container.verify() == 2
+    assert container.resolve(Reports).database.config.url == "postgres://"
+
+
+def test_it_replans_types_whose_partials_changed() -> None:
+    spec = Specification()
+    spec.add(Database)
+    spec.add(Cache)
+    container = VerifyingContainer(spec)
+
+    @spec.add(Config, "url")
+    def build_url() -> str:
+        return "mysql://"
+
+    assert container.verify() == 2
+    assert container.resolve(Database).config.url == "mysql://"
+
+
+def test_it_verifies_changes_before_resolving() -> None:
+    spec = Specification()
+    spec.add(Cache)
+    container = VerifyingContainer(spec)
+
+    spec.add(ApiClient)
+
+    with pytest.raises(FailedToInferDependencyError):
+        container.resolve(Cache)
+
+
+def test_it_does_not_replan_anything_without_changes() -> None:
+    spec = Specification()
+    spec.add(Reports)
+    container = VerifyingContainer(spec)
+
+    assert container.verify() == 0
+    assert container.resolve(Reports) is not container.resolve(Reports)
+
+
+class Mailer:
+    def __init__(self, host, port) -> None:  # type: ignore[reportMissingParameterType]  # noqa: ANN001
+        super().__init__()
+
+
+class Notifier:
+    def __init__(self, mailer: Mailer, api: ApiClient, cache: Cache) -> None:
+        super().__init__()
+
+
+def test_check_reports_all_problems_at_once() -> None:
+    spec = Specification()
+    spec.add(Notifier)
+
+    report = check_specification(spec)
+
+    assert not report.ok
+    assert [(problem.subject, problem.path) for problem in report.problems] == [
+        (Notifier, ("mailer", "host")),
+        (Notifier, ("mailer", "port")),
+        (Notifier, ("api", "token")),
+    ]
+    assert all(
+        isinstance(problem.error, MissingConstructorKeywordTypeAnnotationError)
+        for problem in report.problems[:2]
+    )
+    assert isinstance(report.problems[2].error, FailedToInferDependencyError)
+
+
+def test_check_points_to_the_failed_nodes() -> None:
+    spec = Specification()
+    spec.add(Notifier)
+
+    report = check_specification(spec)
+
+    plan = report.plans[Notifier]
+    assert isinstance(plan, InferenceBasedResolutionPlan)
+    api = plan.parameters[1]
+    assert isinstance(api, InferenceParameterResolutionPlan)
+    assert report.problems[2].node is api.parameters[0]
+    assert print_resolution_plan(plan, ansi=False).splitlines()[1:3] == [
+        "├─mailer: tests.verification_test:Mailer",
+        "│  ├─host: Unknown <- MissingConstructorKeywordTypeAnnotationError",
+    ]
+
+
+def test_check_raises_a_single_error() -> None:
+    spec = Specification()
+    spec.add(Notifier)
+
+    with pytest.raises(VerificationError) as exception:
+        check_specification(spec).raise_for_problems()
+
+    assert len(exception.value.problems) == 3
+    assert "Found 3 problems" in str(exception.value)
+
+
+def test_check_passes_valid_specifications() -> None:
+    spec = Specification()
+    spec.add(Reports)
+
+    report = check_specification(spec)
+
+    assert report.ok
+    report.raise_for_problems()
+    assert isinstance(report.plans[Reports].execute(), Reports)
+
+
+def test_failed_nodes_raise_when_executed() -> None:
+    spec = Specification()
+    spec.add(Notifier)
+
+    plan = check_specification(spec).plans[Notifier]
+
+    with pytest.raises(MissingConstructorKeywordTypeAnnotationError):
+        plan.execute()
+
+
+class Chicken:
+    def __init__(self, egg: "Egg") -> None:
+        super().__init__()
+
+
+class Egg:
+    def __init__(self, chicken: Chicken) -> None:
+        super().__init__()
+
+
+def test_check_reports_each_cycle_once() -> None:
+    spec = Specification()
+    spec.add(Chicken)
+    spec.add(Egg)
+
+    report = check_specification(spec, [Chicken, Egg])
+
+    [problem] = report.problems
+    assert problem.subject is Chicken
+    assert isinstance(problem.error, CircularDependencyError)
+    assert len(problem.error.cycles) == 1
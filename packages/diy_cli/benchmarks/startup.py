@@ -0,0 +1,59 @@
+"""
+Reports how long the `diy` command takes to start up for commands that don't
+need to plan anything, and which diy modules it imports for them.
+
+Run it from the `packages/diy_cli` directory using
+
+    python -m benchmarks.startup
+"""
+
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+COMMANDS = [["--help"], ["config"]]
+
+ROUNDS = 10
+
+PYPROJECT = """
+[tool.diy.containers]
+default = "app:container"
+"""
+
+
+def startup(arguments: list[str], project: Path) -> tuple[float, int]:
+    """
+    The best wall clock time of running the command in milliseconds, and how
+    many diy modules it imported.
+    """
+    code = "import diy_cli; diy_cli.main()"
+    command = [sys.executable, "-X", "importtime", "-c", code, *arguments]
+    best = float("inf")
+    modules = 0
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        # Only ever runs the commands above.
+        result = subprocess.run(command, capture_output=True, text=True, cwd=project)  # noqa: S603
+        best = min(best, perf_counter() - start)
+        modules = sum(
+            1
+            for line in result.stderr.splitlines()
+            if line.rpartition("|")[2].strip().startswith("diy")
+        )
+    return best * 1_000, modules
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        project = Path(directory)
+        (project / "pyproject.toml").write_text(PYPROJECT)
+        for arguments in COMMANDS:
+            milliseconds, modules = startup(arguments, project)
+            name = f"diy {' '.join(arguments)} ({modules} diy modules)"
+            sys.stdout.write(f"{name:<50} {milliseconds:>12.2f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
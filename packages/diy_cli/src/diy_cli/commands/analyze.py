@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+from time import perf_counter
+
+from click import Path as PathType
+from click import echo, option
+from diy._internal.analysis import analyze_container
+from diy._internal.display import print_resolution_plan, qualified_name
+from diy.errors import DiyError
+from diy.verification import check_specification
+
+from diy_cli.commands.helpers import default_specifier_or_exit, problems_by_subject
+from diy_cli.commands.root import root
+
+
+@root.command
+@option(
+    "--container",
+    "specifier",
+    help="The import specifier of the container to analyze, e.g. 'app:container'.",
+)
+@option(
+    "--profile",
+    help="Analyze the plans for this profile, instead of the one the container selects.",
+)
+@option(
+    "--cache",
+    type=PathType(dir_okay=False, path_type=Path),
+    help="Where to keep what was found in each file. Defaults to __pycache__/diy-analysis.marshal.",
+)
+def analyze(
+    specifier: str | None = None,
+    profile: str | None = None,
+    cache: Path | None = None,
+) -> None:
+    """
+    Shows the plans of all types of a container, without importing it.
+
+    The modules defining the container and the types it refers to are parsed
+    instead of imported, so none of your code runs. The plans are
+    approximate: registrations that can't be followed statically, e.g. ones
+    made in loops, are listed as skipped. What was found in each file is
+    cached by its hash, so later runs only parse the files that changed.
+
+    If you do not specify a container explicitly, the default one from the
+    project configuration will be used.
+    """
+    if specifier is None:
+        specifier = default_specifier_or_exit()
+
+    # Like for `.pyc` files, respect `PYTHONDONTWRITEBYTECODE`.
+    if cache is None and not sys.dont_write_bytecode:
+        cache = Path.cwd() / "__pycache__" / "diy-analysis.marshal"
+
+    started = perf_counter()
+    try:
+        analysis = analyze_container(specifier, profile, [Path.cwd(), *sys.path], cache)
+    except DiyError as error:
+        echo(f"✗ {error}", err=True)
+        exit(1)
+
+    types = analysis.spec.types()
+    report = check_specification(analysis.spec, types)
+    problems = problems_by_subject(report)
+
+    if analysis.profile is not None:
+        echo(f"Profile: {analysis.profile}\n")
+    for abstract in sorted(types, key=qualified_name):
+        plan = report.plans.get(abstract)
+        if plan is not None:
+            echo(print_resolution_plan(plan))
+        for problem in problems.get(abstract, []):
+            echo(f"✗ {problem}")
+        echo("")
+
+    for registration in analysis.skipped:
+        echo(f"? Skipped {registration}")
+    for annotation in analysis.unresolved:
+        echo(f"? Could not resolve {annotation}")
+    echo(
+        f"Analyzed {len(types)} types from {analysis.files} files "
+        f"({analysis.parsed} parsed) in {perf_counter() - started:.2f}s"
+    )
@@ -0,0 +1,38 @@
+from typing import Any
+
+from click import echo
+from diy.verification import Problem, VerificationReport
+
+from diy_cli.config.resolve import message_and_exit_code, resolve_config
+from diy_cli.container.resolve import NoContainerConfigured, default_specifier
+from diy_cli.utils.result import Err
+
+
+def default_specifier_or_exit() -> str:
+    """
+    The import specifier of the default container of the project
+    configuration. Exits with an error, if there is none.
+    """
+    configuration = resolve_config()
+    if isinstance(configuration, Err):
+        [message, exit_code] = message_and_exit_code(configuration.error)
+        echo(f"Failed to resolve configuration: {message}", err=True)
+        exit(exit_code)
+
+    specifier = default_specifier(configuration.value)
+    if specifier is None:
+        echo(NoContainerConfigured.message, err=True)
+        exit(1)
+    return specifier
+
+
+def describe_problem(problem: Problem) -> str:
+    return f"{problem.location}: {problem.error}"
+
+
+def problems_by_subject(report: VerificationReport) -> dict[type[Any], list[str]]:
+    """The problems of the report, described by the type they prevent building."""
+    problems: dict[type[Any], list[str]] = {}
+    for problem in report.problems:
+        problems.setdefault(problem.subject, []).append(describe_problem(problem))
+    return problems
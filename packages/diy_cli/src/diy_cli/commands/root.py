@@ -1,6 +1,32 @@
 import click
 
+from diy_cli.utils.lazy_group import LazyCommand, LazyGroup
 
-@click.group()
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "analyze": LazyCommand(
+            "diy_cli.commands.analyze",
+            "Shows the plans of a container, without importing it.",
+        ),
+        "config": LazyCommand(
+            "diy_cli.commands.config",
+            "Prints the current configuration in JSON to the console.",
+        ),
+        "show": LazyCommand(
+            "diy_cli.commands.show",
+            "Show how the given SUBJECT would be resolved.",
+        ),
+        "verify": LazyCommand(
+            "diy_cli.commands.verify",
+            "Verifies that all configured containers can resolve their types.",
+        ),
+        "watch": LazyCommand(
+            "diy_cli.commands.watch",
+            "Shows the plans of a container, and how they change while you edit it.",
+        ),
+    },
+)
 def root() -> None:
     pass
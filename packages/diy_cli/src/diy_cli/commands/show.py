@@ -9,6 +9,8 @@ from diy._internal.display import fully_qualify, print_resolution_plan, qualifie
 from diy._internal.plan import ResolutionPlan
 from diy._internal.planner import Planner
 from diy.container.protocol import ContainerProtocol
+from diy.errors import UnknownProfileError
+from diy.specification.default import ProfileSpecification, Specification
 
 from diy_cli.commands.root import root
 from diy_cli.config.resolve import message_and_exit_code, resolve_config
@@ -35,6 +37,10 @@ from diy_cli.utils.result import Err
     type=DisplayFormat,
     help="Determines the output format.",
 )
+@option(
+    "--profile",
+    help="Show the plans for this profile, instead of the one the container selected.",
+)
 @argument(
     "subject",
     type=IMPORT_SPECIFIER,
@@ -44,6 +50,7 @@ def show(
     container: ContainerProtocol | None = None,
     subject: None | type | Callable[..., Any] | str = None,
     format: DisplayFormat = DisplayFormat.TEXT,
+    profile: str | None = None,
 ) -> None:
     """
     Show how the given SUBJECT would be resolved. If omitted, all types and
@@ -54,7 +61,8 @@ def show(
     it refers to a function, it describes how it would be called.
 
     If you do not specify a container explicitly, the default one from the
-    project configuration will be used.
+    project configuration will be used. Plans are shown for the profile the
+    container selected, unless you pass another one using --profile.
     """
 
     if container is None:
@@ -77,7 +85,16 @@ def show(
             f"_planner attribute of {container!r} does not contain an instance of diy.Planner!"
         )
 
+    if profile is not None:
+        planner = _select_profile(planner, profile)
+    active = (
+        planner.spec.name if isinstance(planner.spec, ProfileSpecification) else None
+    )
+
     if format == DisplayFormat.TEXT:
+        if active is not None:
+            echo(f"Profile: {active}\n")
+
         if subject is not None:
             _display_text_plan(planner, subject)
             return
@@ -91,7 +108,23 @@ def show(
             message = "Not implemented yet!"
             raise Exception(message)
 
-        _display_all_plans_in_json(planner)
+        _display_all_plans_in_json(planner, active)
+
+
+def _select_profile(planner: Planner, profile: str) -> Planner:
+    spec = planner.spec
+    if isinstance(spec, ProfileSpecification):
+        spec = spec.base
+    if not isinstance(spec, Specification):
+        echo(
+            f"Can't select a profile for {spec!r}, it is not a Specification!", err=True
+        )
+        exit(1)
+    try:
+        return Planner(spec.select(profile))
+    except UnknownProfileError as error:
+        echo(f"✗ {error}", err=True)
+        exit(1)
 
 
 def _get_plan[T](planner: Planner, subject: T) -> ResolutionPlan[..., T]:
@@ -108,7 +141,7 @@ def _display_text_plan(planner: Planner, subject: Any) -> None:
     echo(print_resolution_plan(_get_plan(planner, subject)))
 
 
-def _display_all_plans_in_json(planner: Planner) -> None:
+def _display_all_plans_in_json(planner: Planner, profile: str | None) -> None:
     plans: dict[str, PrintedPlan] = {}
     for subject in planner.spec.types():
         namespace, name = fully_qualify(subject)
@@ -120,5 +153,5 @@ def _display_all_plans_in_json(planner: Planner) -> None:
             ),
         )
     ordered_plans: OrderedDict[str, PrintedPlan] = OrderedDict(sorted(plans.items()))
-    container = PrintedContainer(plans=ordered_plans)
+    container = PrintedContainer(plans=ordered_plans, profile=profile)
     echo(json.dumps(asdict(container), indent=4))
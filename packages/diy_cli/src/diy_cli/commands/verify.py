@@ -0,0 +1,170 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from math import ceil
+from os import cpu_count
+from time import perf_counter
+from typing import Any
+
+from click import IntRange, echo, option
+from diy._internal.display import FQN, fully_qualify
+from diy.errors import DiyError
+from diy.specification.protocol import SpecificationProtocol
+from diy.verification import check_specification
+
+from diy_cli.commands.helpers import describe_problem
+from diy_cli.commands.root import root
+from diy_cli.config.resolve import message_and_exit_code, resolve_config
+from diy_cli.container.resolve import describe, spec_from_specifier
+from diy_cli.utils.result import Err
+
+
+@dataclass
+class ShardResult:
+    """What a worker found, in a form that can be sent between processes."""
+
+    checked: int
+    """How many types were checked."""
+
+    problems: list[str] = field(default_factory=list)
+    """A line describing each problem."""
+
+    error: str | None = None
+    """Why the types could not be checked at all, e.g. a failed import."""
+
+
+@root.command
+@option(
+    "--jobs",
+    "-j",
+    type=IntRange(min=1),
+    help="How many worker processes to use. Defaults to the number of CPUs.",
+)
+@option(
+    "--shard-size",
+    type=IntRange(min=1),
+    default=250,
+    show_default=True,
+    help="How many types a worker process checks at least.",
+)
+def verify(jobs: int | None = None, shard_size: int = 250) -> None:
+    """
+    Verifies that all types of all configured containers can be resolved, and
+    reports every problem that was found.
+
+    Large containers are split into shards, which are checked by a pool of
+    worker processes. Each worker imports the container on its own. Containers
+    that fail to load are reported, and the remaining ones are verified all
+    the same.
+
+    \b
+    Exit codes:
+    1  General error, e.g. a container could not be imported or loaded.
+    2  pyproject.toml not found.
+    3  pyproject.toml is missing a tools.diy section.
+    4  pyproject.toml has a tools.diy section, but it violates the
+       configuration schema.
+    5  At least one container has types that can't be resolved.
+    """
+    configuration = resolve_config()
+    if isinstance(configuration, Err):
+        [message, exit_code] = message_and_exit_code(configuration.error)
+        echo(message, err=True)
+        exit(exit_code)
+
+    if jobs is None:
+        jobs = cpu_count() or 1
+
+    started = perf_counter()
+    failed = False
+    errored = False
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for name, specifier in configuration.value.containers.items():
+            container_started = perf_counter()
+            result = spec_from_specifier(specifier)
+            if isinstance(result, Err):
+                echo(f"✗ {name}: {describe(result.error)}", err=True)
+                errored = True
+                continue
+
+            spec = result.value
+            try:
+                # Distinct types might share a qualified name, e.g. local
+                # classes. Those always end up in the same shard.
+                types = sorted(
+                    {fully_qualify(abstract) for abstract in spec.types()},
+                    key=lambda fqn: (fqn[0] or "", fqn[1]),
+                )
+                shards = _split(types, jobs, shard_size)
+                if len(shards) == 1:
+                    # Starting a worker costs more than checking a few types.
+                    results = [_check(spec, types)]
+                else:
+                    futures = [
+                        pool.submit(_check_shard, specifier, shard) for shard in shards
+                    ]
+                    results = [future.result() for future in futures]
+            except DiyError as error:
+                echo(f"✗ {name}: {error}", err=True)
+                errored = True
+                continue
+
+            errors = [result.error for result in results if result.error is not None]
+            if len(errors) > 0:
+                echo(f"✗ {name}: {errors[0]}", err=True)
+                errored = True
+                continue
+
+            problems = [problem for result in results for problem in result.problems]
+            checked = sum(result.checked for result in results)
+            elapsed = perf_counter() - container_started
+            summary = f"{checked} types, {len(shards)} shards in {elapsed:.2f}s"
+            if len(problems) == 0:
+                echo(f"✓ {name}: {summary}")
+                continue
+
+            failed = True
+            echo(f"✗ {name}: {len(problems)} problems in {summary}")
+            for problem in problems:
+                echo(f"  - {problem}")
+
+    echo(f"Verified in {perf_counter() - started:.2f}s")
+    if errored:
+        exit(1)
+    if failed:
+        exit(5)
+
+
+def _split(types: list[FQN], jobs: int, shard_size: int) -> list[list[FQN]]:
+    """
+    Splits the types into at most one shard per job, each holding at least
+    `shard_size` types.
+    """
+    count = max(1, min(jobs, ceil(len(types) / shard_size)))
+    return [types[index::count] for index in range(count)]
+
+
+def _check_shard(specifier: str, shard: list[FQN]) -> ShardResult:
+    """
+    Runs in a worker process. Types can't be sent between processes, so we
+    import the container again and look them up by their qualified names.
+    """
+    result = spec_from_specifier(specifier)
+    if isinstance(result, Err):
+        return ShardResult(0, error=describe(result.error))
+    # Errors can't always be sent between processes, so we send their message.
+    try:
+        return _check(result.value, shard)
+    except DiyError as error:
+        return ShardResult(0, error=str(error))
+
+
+def _check(spec: SpecificationProtocol, names: list[FQN]) -> ShardResult:
+    by_name: dict[FQN, list[Any]] = {}
+    for abstract in spec.types():
+        by_name.setdefault(fully_qualify(abstract), []).append(abstract)
+    types = [abstract for name in names for abstract in by_name.get(name, [])]
+    report = check_specification(spec, types)
+    return ShardResult(
+        checked=len(types),
+        problems=[describe_problem(problem) for problem in report.problems],
+    )
@@ -0,0 +1,208 @@
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from diy_cli.commands.root import root
+
+VALID = """
+from diy import Container
+
+
+class Clock: ...
+
+
+class Scheduler:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+container = Container()
+container.add(Scheduler)
+"""
+
+INVALID = """
+from diy import Container
+
+
+class Mailer:
+    def __init__(self, host) -> None:
+        self.host = host
+
+
+class Newsletter:
+    def __init__(self, mailer: Mailer) -> None:
+        self.mailer = mailer
+
+
+class Archive:
+    def __init__(self, mailer: Mailer) -> None:
+        self.mailer = mailer
+
+
+container = Container()
+container.add(Newsletter)
+container.add(Archive)
+"""
+
+SHARED_NAMES = """
+from diy import Container
+
+
+def make():
+    class Job: ...
+
+    return Job
+
+
+class Clock: ...
+
+
+container = Container()
+container.add(make())
+container.add(make())
+container.add(Clock)
+"""
+
+WITHOUT_SPEC = """
+from diy.container.protocol import ContainerProtocol
+
+
+class Minimal(ContainerProtocol):
+    def resolve(self, abstract):
+        return abstract()
+
+    def call(self, function):
+        return function()
+
+
+container = Minimal()
+"""
+
+FACTORY = """
+from diy import Container
+
+
+def container():
+    return Container()
+"""
+
+BROKEN_SPECIFIER = """
+from diy import Container
+
+
+container = Container()
+container.add("missing_module:Missing")
+"""
+
+type Project = Callable[[str], str]
+"""Writes the source of the default container's module, returns its name."""
+
+
+@pytest.fixture()
+def project(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> Iterator[Project]:
+    """A project configuring a single container, forgotten after the test."""
+    name = f"app_{request.node.name}"
+
+    def write(source: str) -> str:
+        (tmp_path / f"{name}.py").write_text(source)
+        return name
+
+    (tmp_path / "pyproject.toml").write_text(
+        f'[tool.diy.containers]\ndefault = "{name}:container"\n'
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield write
+    sys.modules.pop(name, None)
+
+
+def test_it_passes_valid_containers(project: Project) -> None:
+    project(VALID)
+
+    result = CliRunner().invoke(root, ["verify"])
+
+    assert result.exit_code == 0, result.output
+    assert "✓ default: 1 types, 1 shards" in result.output
+
+
+def test_it_reports_every_problem(project: Project) -> None:
+    project(INVALID)
+
+    result = CliRunner().invoke(root, ["verify"])
+
+    assert result.exit_code == 5
+    assert "✗ default: 2 problems in 2 types" in result.output
+    assert "Archive -> mailer -> host" in result.output
+    assert "Newsletter -> mailer -> host" in result.output
+
+
+def test_it_splits_containers_between_workers(project: Project) -> None:
+    project(INVALID)
+
+    result = CliRunner().invoke(root, ["verify", "--jobs", "2", "--shard-size", "1"])
+
+    assert result.exit_code == 5
+    assert "✗ default: 2 problems in 2 types, 2 shards" in result.output
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_it_checks_types_sharing_a_qualified_name(project: Project, jobs: str) -> None:
+    project(SHARED_NAMES)
+
+    result = CliRunner().invoke(root, ["verify", "--jobs", jobs, "--shard-size", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert f"✓ default: 3 types, {jobs} shards" in result.output
+
+
+def test_it_explains_containers_without_a_specification(project: Project) -> None:
+    project(WITHOUT_SPEC)
+
+    result = CliRunner().invoke(root, ["verify"])
+
+    assert result.exit_code == 1
+    assert "Minimal does not expose the specification" in result.output
+
+
+def test_it_does_not_call_functions(project: Project) -> None:
+    project(FACTORY)
+
+    result = CliRunner().invoke(root, ["verify"])
+
+    assert result.exit_code == 1
+    assert "expected a container, but got an instance of function" in result.output
+
+
+def test_it_reports_containers_that_fail_to_load_and_keeps_going(
+    project: Project,
+) -> None:
+    broken = project(BROKEN_SPECIFIER)
+    valid = f"{broken}_valid"
+    Path(f"{valid}.py").write_text(VALID)
+    Path("pyproject.toml").write_text(
+        "[tool.diy.containers]\n"
+        f'broken = "{broken}:container"\n'
+        f'valid = "{valid}:container"\n'
+    )
+
+    result = CliRunner().invoke(root, ["verify"])
+    sys.modules.pop(valid, None)
+
+    assert result.exit_code == 1, result.output
+    assert "✗ broken: Failed to import 'missing_module:Missing'" in result.output
+    assert "✓ valid: 1 types, 1 shards" in result.output
+
+
+def test_it_requires_a_configuration(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(root, ["verify"])
+
+    assert result.exit_code == 2
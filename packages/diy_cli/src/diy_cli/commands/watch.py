@@ -0,0 +1,357 @@
+import sys
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from difflib import unified_diff
+from importlib import reload
+from pathlib import Path
+from textwrap import indent
+from time import perf_counter, sleep
+from types import ModuleType
+from typing import Any
+
+from click import FloatRange, echo, option
+from diy._internal.display import print_resolution_plan, qualified_name
+from diy._internal.plan import (
+    BuilderBasedResolutionPlan,
+    BuilderParameterResolutionPlan,
+    InferenceBasedResolutionPlan,
+    InferenceParameterResolutionPlan,
+    LazyParameterResolutionPlan,
+    ProviderParameterResolutionPlan,
+)
+from diy._internal.verification import Node
+from diy.errors import DiyError
+from diy.specification.protocol import SpecificationProtocol
+from diy.verification import check_specification
+
+from diy_cli.commands.helpers import default_specifier_or_exit, problems_by_subject
+from diy_cli.commands.root import root
+from diy_cli.container.resolve import describe, spec_from_specifier
+from diy_cli.utils.result import Err
+
+type Binding = tuple[str, str | None]
+"""The qualified name of a type and, for partial builders, the parameter."""
+
+
+@dataclass
+class Entry:
+    """What the watcher knows about the plan of a single type."""
+
+    plan: str
+    """The rendered plan, empty if the type could not be planned at all."""
+
+    problems: list[str] = field(default_factory=list)
+    """A line describing each problem of the plan."""
+
+    modules: set[str] = field(default_factory=set)
+    """The modules defining the types and builders the plan involves."""
+
+    types: set[str] = field(default_factory=set)
+    """The qualified names of the types the plan involves."""
+
+
+@root.command
+@option(
+    "--container",
+    "specifier",
+    help="The import specifier of the container to watch, e.g. 'app:container'.",
+)
+@option(
+    "--interval",
+    type=FloatRange(min=0.05),
+    default=0.5,
+    show_default=True,
+    help="How often to check the source files for changes, in seconds.",
+)
+def watch(specifier: str | None = None, interval: float = 0.5) -> None:
+    """
+    Shows the plans of all types of a container, and keeps showing how they
+    change while you edit the source files, until interrupted.
+
+    The container stays imported. When source files in the current directory
+    change, only the changed modules and the modules referring to them are
+    reloaded, and only the types whose plans involve them are planned again.
+
+    If you do not specify a container explicitly, the default one from the
+    project configuration will be used.
+    """
+    if specifier is None:
+        specifier = default_specifier_or_exit()
+
+    watcher = Watcher(specifier, Path.cwd())
+    started = perf_counter()
+    spec = watcher.load()
+    if spec is None:
+        exit(1)
+
+    watcher.plan(spec, spec.types())
+    for name in sorted(watcher.entries):
+        entry = watcher.entries[name]
+        echo(entry.plan)
+        for problem in entry.problems:
+            echo(f"✗ {problem}")
+        echo("")
+    echo(
+        f"Planned {len(watcher.entries)} types in {perf_counter() - started:.2f}s, "
+        f"watching {len(watcher.modules)} modules for changes"
+    )
+
+    try:
+        while True:
+            sleep(interval)
+            changed = watcher.changed()
+            if len(changed) > 0:
+                watcher.update(changed)
+    except KeyboardInterrupt:
+        pass
+
+
+class Watcher:
+    """
+    Keeps a container imported, and its plans up to date with the source
+    files defining it.
+    """
+
+    specifier: str
+    """The import specifier of the container."""
+
+    root: Path
+    """Only modules in this directory are watched."""
+
+    entries: dict[str, Entry]
+    """The plans of all types of the container, by their qualified name."""
+
+    modules: dict[str, tuple[Path, int]]
+    """The path and modification time of the watched modules, by their name."""
+
+    _bindings: dict[Binding, str]
+    """The qualified names of the builders of the container."""
+
+    _preloaded: set[str]
+    """Modules that were imported before the container, e.g. diy itself."""
+
+    _stale: set[str]
+    """
+    Modules that changed, but whose types weren't re-planned because reloading
+    them or loading the container failed. They are reloaded with the next change.
+    """
+
+    def __init__(self, specifier: str, root: Path) -> None:
+        super().__init__()
+        self.specifier = specifier
+        self.root = root.resolve()
+        self.entries = {}
+        self.modules = {}
+        self._bindings = {}
+        self._preloaded = set(sys.modules)
+        self._stale = set()
+
+    def load(self) -> SpecificationProtocol | None:
+        """
+        Imports the container, or picks up the one that was reloaded, and
+        starts watching the modules it imported.
+        """
+        result = spec_from_specifier(self.specifier)
+        self._track()
+        if isinstance(result, Err):
+            echo(
+                f"✗ Failed to load '{self.specifier}': {describe(result.error)}",
+                err=True,
+            )
+            return None
+
+        spec = result.value
+        try:
+            frozen = spec.freeze()
+        except DiyError as error:
+            echo(f"✗ Failed to load the container: {error}", err=True)
+            return None
+
+        self._bindings = {
+            (qualified_name(abstract), name): qualified_name(builder)
+            for (abstract, name), builder in frozen.items()
+        }
+        return spec
+
+    def plan(
+        self, spec: SpecificationProtocol, types: Collection[type[Any]]
+    ) -> dict[str, Entry]:
+        """Plans the given types, and returns their new entries."""
+        report = check_specification(spec, types)
+        problems = problems_by_subject(report)
+
+        entries: dict[str, Entry] = {}
+        for abstract in types:
+            name = qualified_name(abstract)
+            plan = report.plans.get(abstract)
+            entry = Entry(
+                plan="" if plan is None else print_resolution_plan(plan),
+                problems=problems.get(abstract, []),
+            )
+            _involve(entry, abstract)
+            if plan is not None:
+                _involve_plan(entry, plan)
+            entries[name] = self.entries[name] = entry
+        return entries
+
+    def changed(self) -> set[str]:
+        """The watched modules, that changed since they were last checked."""
+        changed: set[str] = set()
+        for name, (path, modified) in self.modules.items():
+            try:
+                current = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            if current != modified:
+                changed.add(name)
+                self.modules[name] = (path, current)
+        return changed
+
+    def update(self, changed: set[str]) -> None:
+        """
+        Reloads the changed modules, re-plans the types affected by them and
+        prints how their plans changed.
+        """
+        started = perf_counter()
+        reloaded = self._reload(changed | self._stale)
+        if reloaded is None:
+            self._stale |= changed
+            return
+
+        previous = self._bindings
+        spec = self.load()
+        if spec is None:
+            # Their types are re-planned once the container loads again.
+            self._stale = reloaded
+            return
+        self._stale.clear()
+
+        rebound = {key[0] for key, _ in self._bindings.items() ^ previous.items()}
+        types = {qualified_name(abstract): abstract for abstract in spec.types()}
+        affected = [
+            abstract
+            for name, abstract in types.items()
+            if name not in self.entries
+            or not self.entries[name].modules.isdisjoint(reloaded)
+            or not self.entries[name].types.isdisjoint(rebound)
+        ]
+
+        for name in sorted(self.entries.keys() - types.keys()):
+            del self.entries[name]
+            echo(f"- {name}")
+
+        old = {name: self.entries.get(name) for name in map(qualified_name, affected)}
+        for name, entry in sorted(self.plan(spec, affected).items()):
+            _print_change(name, old[name], entry)
+
+        elapsed = perf_counter() - started
+        echo(f"Re-planned {len(affected)} of {len(types)} types in {elapsed:.2f}s")
+
+    def _reload(self, changed: set[str]) -> set[str] | None:
+        """
+        Reloads the changed modules and the ones referring to them, and
+        returns their names. Returns `None`, if reloading one of them failed.
+        """
+        # Modules referring to a changed one have to be reloaded as well,
+        # otherwise they keep using its old classes and functions.
+        pending = set(changed)
+        while True:
+            dependents = {
+                name
+                for name in self.modules
+                if name not in pending and _refers_to(sys.modules.get(name), pending)
+            }
+            if len(dependents) == 0:
+                break
+            pending |= dependents
+
+        # Modules are moved to the end of `sys.modules` once they finished
+        # executing, so dependencies are reloaded before their dependents.
+        for name in list(sys.modules):
+            if name not in pending:
+                continue
+            try:
+                reload(sys.modules[name])
+            except Exception as error:  # noqa: BLE001
+                # The file might be saved halfway, or contain a typo. We'll
+                # try again on the next change.
+                echo(f"✗ Failed to reload {name}: {error!r}", err=True)
+                return None
+
+        return pending
+
+    def _track(self) -> None:
+        """Starts watching the modules in the root that were imported since."""
+        for name, module in list(sys.modules.items()):
+            if name in self._preloaded or name in self.modules:
+                continue
+            file = getattr(module, "__file__", None)
+            if file is None:
+                continue
+            path = Path(file).resolve()
+            if self.root not in path.parents or "site-packages" in path.parts:
+                continue
+            self.modules[name] = (path, path.stat().st_mtime_ns)
+
+
+def _refers_to(module: ModuleType | None, names: set[str]) -> bool:
+    if module is None:
+        return False
+    for value in list(vars(module).values()):
+        if isinstance(value, ModuleType):
+            if value.__name__ in names:
+                return True
+        elif getattr(value, "__module__", None) in names:
+            return True
+    return False
+
+
+def _involve(entry: Entry, subject: Any) -> None:
+    """Adds the type or builder, and the modules its definition spans."""
+    entry.types.add(qualified_name(subject))
+    # Classes might inherit their constructor from a class of another module.
+    for definition in getattr(subject, "__mro__", (subject,)):
+        module = getattr(definition, "__module__", None)
+        if module is not None:
+            entry.modules.add(module)
+
+
+def _involve_plan(entry: Entry, plan: Node) -> None:
+    stack: list[Node] = [plan]
+    while len(stack) > 0:
+        node = stack.pop()
+        if node.type is not None:
+            _involve(entry, node.type)
+        match node:
+            case InferenceBasedResolutionPlan() | InferenceParameterResolutionPlan():
+                stack.extend(node.parameters)
+            case BuilderBasedResolutionPlan() | BuilderParameterResolutionPlan():
+                _involve(entry, node.builder)
+                stack.extend(node.args_plan.parameters)
+            case ProviderParameterResolutionPlan() | LazyParameterResolutionPlan():
+                stack.append(node.provided)
+            case _:
+                pass
+
+
+def _print_change(name: str, old: Entry | None, new: Entry) -> None:
+    if old is None:
+        echo(f"+ {name}")
+        echo(indent(new.plan, "  "))
+    elif old.plan != new.plan:
+        echo(f"~ {name}")
+        diff = unified_diff(
+            old.plan.splitlines(), new.plan.splitlines(), lineterm="", n=1
+        )
+        # Skip the header naming the compared files.
+        for line in list(diff)[2:]:
+            echo(f"  {line}")
+    elif old.problems == new.problems:
+        return
+
+    for problem in new.problems:
+        if old is None or problem not in old.problems:
+            echo(f"✗ {problem}")
+    for problem in [] if old is None else old.problems:
+        if problem not in new.problems:
+            echo(f"✓ fixed {problem}")
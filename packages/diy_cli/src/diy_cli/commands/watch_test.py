@@ -0,0 +1,170 @@
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from diy_cli.commands.watch import Watcher
+
+CLOCK = """
+class Clock: ...
+"""
+
+MAILER = """
+class Mailer:
+    def __init__(self, host: str = "localhost") -> None:
+        self.host = host
+"""
+
+MAILER_WITH_CLOCK = """
+from {package}.clock import Clock
+
+
+class Mailer:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+"""
+
+APP = """
+from diy import Container
+
+from {package}.clock import Clock
+from {package}.mail import Mailer
+
+
+class Scheduler:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+class Newsletter:
+    def __init__(self, mailer: Mailer) -> None:
+        self.mailer = mailer
+
+
+container = Container()
+container.add(Scheduler)
+container.add(Newsletter)
+"""
+
+
+class Package:
+    """A package defining a container, whose modules can be edited."""
+
+    def __init__(self, root: Path, name: str) -> None:
+        super().__init__()
+        self.root = root
+        self.name = name
+
+    def write(self, module: str, source: str) -> None:
+        (self.root / self.name / f"{module}.py").write_text(
+            source.format(package=self.name)
+        )
+
+    def edit(self, module: str, source: str) -> None:
+        """
+        Rewrites the module, and makes sure its modification time changes even
+        on file systems with a coarse resolution.
+        """
+        path = self.root / self.name / f"{module}.py"
+        modified = path.stat().st_mtime_ns + 1_000_000_000
+        self.write(module, source)
+        os.utime(path, ns=(modified, modified))
+
+
+@pytest.fixture()
+def package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
+) -> Iterator[Package]:
+    """A package with the `clock`, `mail` and `app` modules, forgotten after the test."""
+    package = Package(tmp_path, f"watched_{request.node.name}")
+    (tmp_path / package.name).mkdir()
+    package.write("__init__", "")
+    package.write("clock", CLOCK)
+    package.write("mail", MAILER)
+    package.write("app", APP)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in list(sys.modules):
+        if name.split(".")[0] == package.name:
+            del sys.modules[name]
+
+
+@pytest.fixture()
+def watcher(package: Package) -> Watcher:
+    """Watches the container of the package, with all of its types planned."""
+    watcher = Watcher(f"{package.name}.app:container", package.root)
+    spec = watcher.load()
+    assert spec is not None
+    watcher.plan(spec, spec.types())
+    return watcher
+
+
+def test_it_watches_the_modules_the_container_imported(
+    package: Package, watcher: Watcher
+) -> None:
+    assert set(watcher.modules) == {
+        package.name,
+        f"{package.name}.clock",
+        f"{package.name}.mail",
+        f"{package.name}.app",
+    }
+
+
+def test_changes_are_reported_once(package: Package, watcher: Watcher) -> None:
+    assert watcher.changed() == set()
+
+    package.edit("clock", CLOCK)
+
+    assert watcher.changed() == {f"{package.name}.clock"}
+    assert watcher.changed() == set()
+
+
+def test_modules_referring_to_changed_ones_are_reloaded(
+    package: Package, watcher: Watcher
+) -> None:
+    clock = f"{package.name}.clock"
+    app = f"{package.name}.app"
+    package.edit("clock", CLOCK)
+
+    # The package refers to its submodules as well.
+    assert watcher._reload({clock}) == {package.name, clock, app}  # noqa: SLF001
+    assert sys.modules[app].Clock is sys.modules[clock].Clock
+
+
+def test_it_re_plans_the_types_affected_by_a_change(
+    package: Package, watcher: Watcher, capsys: pytest.CaptureFixture[str]
+) -> None:
+    package.edit("mail", MAILER_WITH_CLOCK)
+
+    watcher.update(watcher.changed())
+
+    output = capsys.readouterr().out
+    assert f"~ {package.name}.app:Newsletter" in output
+    assert f"{package.name}.app:Scheduler" not in output
+    assert "clock" in watcher.entries[f"{package.name}.app:Newsletter"].plan
+
+
+def test_failed_reloads_are_retried_with_the_next_change(
+    package: Package, watcher: Watcher, capsys: pytest.CaptureFixture[str]
+) -> None:
+    newsletter = f"{package.name}.app:Newsletter"
+    plan = watcher.entries[newsletter].plan
+    package.edit("clock", "class Clock(")
+    package.edit("mail", MAILER_WITH_CLOCK)
+
+    watcher.update(watcher.changed())
+
+    assert f"Failed to reload {package.name}.clock" in capsys.readouterr().err
+    assert watcher.entries[newsletter].plan == plan
+
+    # Only the clock changes again, but the mailer still has to be reloaded.
+    package.edit("clock", CLOCK)
+    changed = watcher.changed()
+    assert changed == {f"{package.name}.clock"}
+
+    watcher.update(changed)
+
+    assert f"~ {newsletter}" in capsys.readouterr().out
+    assert watcher.entries[newsletter].plan != plan
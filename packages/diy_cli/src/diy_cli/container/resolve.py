@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 
 from diy.container.protocol import ContainerProtocol
+from diy.specification.protocol import SpecificationProtocol
 
 from diy_cli.config.schema import DiyProjectConfig
-from diy_cli.utils.import_specifiers import FailureReason, resolve_import_specifier
+from diy_cli.utils.import_specifiers import (
+    FailureReason,
+    resolve_import_specifier,
+)
+from diy_cli.utils.import_specifiers import message as import_failure_message
 from diy_cli.utils.result import Err, Ok, Result
 
 
@@ -21,14 +26,33 @@ class ResolvedWrongType:
     actual: type
 
 
+@dataclass
+class HasNoSpecification:
+    actual: type
+
+
 type ConfigResolutionError = (
     NoContainerConfigured | FailedToImportSpecifier | ResolvedWrongType
 )
 
+type SpecResolutionError = ConfigResolutionError | HasNoSpecification
+
 
 def from_config(
     config: DiyProjectConfig,
 ) -> Result[ContainerProtocol, ConfigResolutionError]:
+    specifier = default_specifier(config)
+    if specifier is None:
+        return Err(NoContainerConfigured())
+
+    return from_specifier(specifier)
+
+
+def default_specifier(config: DiyProjectConfig) -> str | None:
+    """
+    The import specifier of the container named "default", or of the only
+    container if there is just one.
+    """
     specifier = None
     if len(config.containers) == 1:
         specifier = next(iter(config.containers.values()))
@@ -36,9 +60,13 @@ def from_config(
     if "default" in config.containers:
         specifier = config.containers["default"]
 
-    if specifier is None:
-        return Err(NoContainerConfigured())
+    return specifier
+
 
+def from_specifier(
+    specifier: str,
+) -> Result[ContainerProtocol, ConfigResolutionError]:
+    """Imports the container the specifier refers to."""
     result = resolve_import_specifier(specifier)
 
     if isinstance(result, Err):
@@ -50,3 +78,32 @@ def from_config(
         return Err(ResolvedWrongType(type(resolved)))
 
     return Ok(resolved)
+
+
+def spec_from_specifier(
+    specifier: str,
+) -> Result[SpecificationProtocol, SpecResolutionError]:
+    """
+    Imports the container the specifier refers to, and returns the
+    specification it resolves types from.
+    """
+    result = from_specifier(specifier)
+    if isinstance(result, Err):
+        return Err(result.error)
+
+    spec = getattr(result.value, "spec", None)
+    if not isinstance(spec, SpecificationProtocol):
+        return Err(HasNoSpecification(type(result.value)))
+    return Ok(spec)
+
+
+def describe(error: SpecResolutionError) -> str:
+    match error:
+        case NoContainerConfigured():
+            return error.message
+        case FailedToImportSpecifier(cause):
+            return import_failure_message(cause)
+        case ResolvedWrongType(actual):
+            return f"expected a container, but got an instance of {actual.__qualname__}"
+        case HasNoSpecification(actual):
+            return f"{actual.__qualname__} does not expose the specification it resolves types from as its `spec`"
@@ -49,3 +49,5 @@ class PrintedContainer:
 
     version: int = 1
     plans: dict[str, PrintedPlan] = field(default_factory=dict)
+    profile: str | None = None
+    """The profile whose bindings the plans were created with."""
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, override
+
+from click import Command, Context, Group, HelpFormatter
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """
+    A command that is only imported, once it is invoked.
+    """
+
+    module: str
+    """The module defining the command, which registers it when imported."""
+
+    help: str
+    """The summary shown in the help of the group."""
+
+
+class LazyGroup(Group):
+    """
+    A group that knows its commands by the modules defining them, so it only
+    imports the module of the command that actually runs. Listing the commands
+    in the help uses the summaries of the lazy commands, so it does not import
+    anything either.
+
+    The modules register their commands on the group like usual, e.g. by using
+    `@root.command`.
+    """
+
+    lazy_commands: dict[str, LazyCommand]
+
+    def __init__(
+        self, *args: Any, lazy_commands: dict[str, LazyCommand], **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    @override
+    def list_commands(self, ctx: Context) -> list[str]:
+        return sorted({*self.commands, *self.lazy_commands})
+
+    @override
+    def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            import_module(self.lazy_commands[cmd_name].module)
+        return super().get_command(ctx, cmd_name)
+
+    @override
+    def format_commands(self, ctx: Context, formatter: HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if len(names) == 0:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows: list[tuple[str, str]] = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is None:
+                rows.append((name, self.lazy_commands[name].help))
+            elif not command.hidden:
+                rows.append((name, command.get_short_help_str(limit)))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)